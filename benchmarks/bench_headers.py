@@ -0,0 +1,83 @@
+"""
+Request header construction micro-benchmark.
+
+Compares headers built per second by the former `_request_headers()` (fresh
+dict, `json.dumps` and `strftime` on every call) with the cached per-token
+template that only splices the request ID into pre-serialized bytes. Also
+times the request-ID generator on its own.
+
+Run from the project root:
+    uv run python -m benchmarks.bench_headers --calls 200000
+"""
+
+import argparse
+import datetime
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from comdirect_api.client import ComdirectClient
+from comdirect_api.utils import timestamp
+
+
+def _legacy_timestamp() -> str:
+    return datetime.datetime.now(datetime.UTC).strftime("%Y%m%d%H%M%S%f")
+
+
+def _legacy_request_headers(
+    session_id: str, token: str, extra: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    base_hdr = {
+        "Accept": "application/json",
+        "Authorization": f"Bearer {token}",
+        "x-http-request-info": json.dumps(
+            {
+                "clientRequestId": {
+                    "sessionId": session_id,
+                    "requestId": _legacy_timestamp(),
+                }
+            }
+        ),
+        "Content-Type": "application/json",
+    }
+    if extra:
+        base_hdr.update(extra)
+    return base_hdr
+
+
+def _rate(fn: Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    client = ComdirectClient("bench", "secret", "user", "pin")
+    client.session_id = "3f1a6c2e-5b7d-4e8f-9a0b-1c2d3e4f5a6b"
+    token = "a" * 36
+
+    cases = [
+        ("request id", _legacy_timestamp, timestamp),
+        (
+            "headers",
+            lambda: _legacy_request_headers(client.session_id, token),
+            lambda: client._request_headers(token),
+        ),
+    ]
+    print(f"{args.calls} calls each")
+    print(f"{'case':<12} {'before /s':>12} {'after /s':>12} {'speedup':>8}")
+    for name, before, after in cases:
+        before_rate = _rate(before, args.calls)
+        after_rate = _rate(after, args.calls)
+        speedup = after_rate / before_rate
+        print(f"{name:<12} {before_rate:>12,.0f} {after_rate:>12,.0f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
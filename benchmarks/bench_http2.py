@@ -0,0 +1,62 @@
+"""
+HTTP/1.1 vs HTTP/2 fan-out benchmark.
+
+Fires N parallel `get_depot_positions` calls through a `ComdirectClient`
+against the local stand-in server and compares wall time and the number of
+TCP connections opened for both transport modes.
+
+The stand-in speaks cleartext HTTP/2 with prior knowledge, so the HTTP/2 run
+disables HTTP/1.1 on the pooled client; against api.comdirect.de the same
+`http2=True` flag negotiates HTTP/2 via TLS ALPN instead.
+
+Run from the project root (requires the ``http2`` extra):
+    uv run python -m benchmarks.bench_http2 --requests 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks.standin import StandInClient, StandInServer, fixed_latency
+
+
+async def _run(mode: str, requests: int, latency: float, limits: httpx.Limits) -> tuple[float, int]:
+    async with StandInServer(fixed_latency(latency)) as server:
+        async with StandInClient(server.url, limits=limits, http2=mode == "HTTP/2") as client:
+            # Warm-up request so both modes start from an established connection
+            await client.get_depot_positions("warmup")
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(client.get_depot_positions(f"depot-{i}") for i in range(requests))
+            )
+            elapsed = time.perf_counter() - start
+        return elapsed, server.connections
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency (s)")
+    parser.add_argument("--max-connections", type=int, default=20)
+    args = parser.parse_args()
+
+    limits = httpx.Limits(
+        max_connections=args.max_connections,
+        max_keepalive_connections=args.max_connections,
+    )
+    print(
+        f"{args.requests} parallel requests, {args.latency * 1000:.0f} ms server latency, "
+        f"max_connections={args.max_connections}"
+    )
+    print(f"{'mode':<10} {'wall (s)':>10} {'req/s':>10} {'connections':>12}")
+    for mode in ("HTTP/1.1", "HTTP/2"):
+        elapsed, connections = await _run(mode, args.requests, args.latency, limits)
+        print(
+            f"{mode:<10} {elapsed:>10.3f} {args.requests / elapsed:>10.0f} {connections:>12}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,153 @@
+"""
+Response parsing benchmark.
+
+Compares the former parse path (`Model(**response.json())`: json.loads builds
+dicts, then pydantic validates them) with `_parse()`, which validates the raw
+bytes with a cached TypeAdapter in one pass. The "lazy" row wraps the decoded
+JSON in a `LazyModel` and reads the fields the depot sync needs per item
+(`position_id`, `quantity`, `wkn`, `instrument.isin`; for transactions
+`reference`, `amount`, `booking_date`). Payloads are synthetic but
+shaped like real API responses (amounts as strings, nested instruments).
+Reports the best wall time over several rounds and the peak traced memory
+of a single parse.
+
+Run from the project root:
+    uv run python -m benchmarks.bench_parse --positions 1000 --transactions 5000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from comdirect_api.client import _adapter
+from comdirect_api.models import AccountTransactions, DepotPositions, LazyModel
+
+
+def _amount(value: float, unit: str = "EUR") -> dict:
+    return {"value": f"{value:.2f}", "unit": unit}
+
+
+def depot_positions_payload(count: int) -> bytes:
+    values = [
+        {
+            "depotId": "D1",
+            "positionId": f"P{n:06d}",
+            "wkn": f"A{n:05d}",
+            "custodyType": "CLEARING",
+            "quantity": _amount(10 + n % 90, "XXX"),
+            "availableQuantity": _amount(10 + n % 90, "XXX"),
+            "currentPrice": {
+                "price": _amount(12.34 + n),
+                "priceDateTime": "2026-10-16T17:35:00+02:00",
+            },
+            "purchasePrice": _amount(10.5 + n),
+            "purchaseValue": _amount((10.5 + n) * (10 + n % 90)),
+            "currentValue": _amount((12.34 + n) * (10 + n % 90)),
+            "profitLossPurchaseAbs": _amount(1.84 * (10 + n % 90)),
+            "profitLossPurchaseRel": "17.52",
+            "instrument": {
+                "instrumentId": f"I{n:08d}",
+                "wkn": f"A{n:05d}",
+                "isin": f"DE000A{n:06d}",
+                "mnemonic": f"M{n % 1000}",
+                "name": f"Example Instrument {n}",
+                "shortName": f"EX {n}",
+            },
+        }
+        for n in range(count)
+    ]
+    return json.dumps({"paging": {"index": 0, "matches": count}, "values": values}).encode()
+
+
+def account_transactions_payload(count: int) -> bytes:
+    values = [
+        {
+            "reference": f"R{n:010d}",
+            "bookingStatus": "BOOKED",
+            "bookingDate": f"2026-{n % 12 + 1:02d}-{n % 28 + 1:02d}",
+            "valutaDate": f"2026-{n % 12 + 1:02d}-{n % 28 + 1:02d}",
+            "amount": _amount(-12.5 - n % 500),
+            "remitter": {"holderName": "Max Mustermann"},
+            "creditor": {
+                "holderName": f"Merchant {n % 50}",
+                "iban": "DE02120300000000202051",
+                "bic": "BYLADEM1001",
+            },
+            "remittanceInfo": f"01Card payment {n}02Merchant {n % 50}",
+            "transactionType": {"key": "DIRECT_DEBIT", "text": "Lastschrift"},
+            "newTransaction": False,
+        }
+        for n in range(count)
+    ]
+    return json.dumps({"paging": {"index": 0, "matches": count}, "values": values}).encode()
+
+
+def _read_fields(result) -> None:
+    """Read the per-item fields a sync run uses."""
+    if result.model_type is DepotPositions:
+        for position in result.values:
+            _ = position.position_id, position.quantity, position.wkn, position.instrument.isin
+    else:
+        for transaction in result.values:
+            _ = transaction.reference, transaction.amount, transaction.booking_date
+
+
+def _best_time(fn: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=1000)
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    cases = [
+        (
+            f"{args.positions} positions",
+            DepotPositions,
+            depot_positions_payload(args.positions),
+        ),
+        (
+            f"{args.transactions} transactions",
+            AccountTransactions,
+            account_transactions_payload(args.transactions),
+        ),
+    ]
+    print(f"best of {args.rounds} rounds; peak = traced memory of one parse")
+    print(f"{'payload':<20} {'size':>8} {'path':<14} {'time ms':>9} {'peak MiB':>9}")
+    for name, model, body in cases:
+        paths = [
+            ("json + kwargs", lambda m=model, b=body: m(**json.loads(b))),
+            ("validate_json", lambda m=model, b=body: _adapter(m).validate_json(b)),
+        ]
+        paths.append(("lazy", lambda m=model, b=body: _read_fields(LazyModel(m, json.loads(b)))))
+        for path, parse in paths:
+            parse()  # warm up validators and the adapter cache
+            elapsed = _best_time(parse, args.rounds) * 1000
+            peak = _peak_memory(parse) / 2**20
+            print(
+                f"{name:<20} {len(body) / 2**20:>6.1f}MB {path:<14} "
+                f"{elapsed:>9.1f} {peak:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
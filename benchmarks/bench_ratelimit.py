@@ -0,0 +1,112 @@
+"""
+Shared rate limiter vs retry-on-429 benchmark.
+
+Several `ComdirectClient`s sharing one OAuth client_id (like the accounts in
+`functions/sync/run.py`) hammer a stand-in server that enforces a fixed
+per-second quota. Compares completed requests per minute for three modes:
+
+- fixed backoff : the former SyncService loop (sleep 2/4/8 s on 429)
+- retry pipeline: only react to 429s via RetryPolicy (Retry-After, jitter)
+- token bucket  : pace all clients with one shared TokenBucketLimiter
+
+Run from the project root:
+    uv run python -m benchmarks.bench_ratelimit --clients 4 --quota 20 --duration 15
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Iterator
+
+import httpx
+
+from benchmarks.standin import StandInClient, StandInServer, fixed_window_quota
+from comdirect_api.ratelimit import TokenBucketLimiter
+from comdirect_api.retry import NO_RETRY
+
+MODES = ("fixed backoff", "retry pipeline", "token bucket")
+
+
+async def _fixed_backoff_call(client: StandInClient, depot_id: str) -> None:
+    """The pre-pipeline SyncService loop: up to 3 retries after 2, 4, 8 seconds."""
+    for attempt in range(4):
+        try:
+            await client.get_depot_positions(depot_id)
+            return
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 429 and attempt < 3:
+                await asyncio.sleep(2 ** (attempt + 1))
+            else:
+                raise
+
+
+async def _worker(
+    mode: str,
+    client: StandInClient,
+    stop_at: float,
+    counts: dict[str, int],
+    call_ids: Iterator[int],
+) -> None:
+    while time.monotonic() < stop_at:
+        # A distinct depot per call, so concurrent calls are not coalesced into one GET
+        depot_id = f"depot-{next(call_ids)}"
+        try:
+            if mode == "fixed backoff":
+                await _fixed_backoff_call(client, depot_id)
+            else:
+                await client.get_depot_positions(depot_id)
+            counts["completed"] += 1
+        except httpx.HTTPStatusError:
+            counts["failed"] += 1
+
+
+async def _run(mode: str, args: argparse.Namespace) -> tuple[dict[str, int], int]:
+    limiter = TokenBucketLimiter(rate=args.quota, burst=1) if mode == "token bucket" else None
+    retry = NO_RETRY if mode == "fixed backoff" else None
+    counts = {"completed": 0, "failed": 0}
+    async with StandInServer(fixed_window_quota(args.quota, latency=args.latency)) as server:
+        clients = [
+            StandInClient(
+                server.url, client_id="shared-client-id", rate_limiter=limiter, retry=retry
+            )
+            for _ in range(args.clients)
+        ]
+        stop_at = time.monotonic() + args.duration
+        call_ids = itertools.count()
+        await asyncio.gather(
+            *(
+                _worker(mode, client, stop_at, counts, call_ids)
+                for client in clients
+                for _ in range(args.concurrency)
+            )
+        )
+        await asyncio.gather(*(client.aclose() for client in clients))
+        return counts, server.requests
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=4, help="clients sharing one client_id")
+    parser.add_argument("--concurrency", type=int, default=3, help="parallel calls per client")
+    parser.add_argument("--quota", type=int, default=20, help="server quota (requests/s)")
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency (s)")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per mode")
+    args = parser.parse_args()
+    logging.getLogger("comdirect_api").setLevel(logging.ERROR)  # silence retry warnings
+
+    print(
+        f"{args.clients} clients x {args.concurrency} workers, quota {args.quota} req/s, "
+        f"{args.duration:.0f} s per mode"
+    )
+    print(f"{'mode':<14} {'completed/min':>14} {'429s sent':>10} {'gave up':>8}")
+    for mode in MODES:
+        counts, server_requests = await _run(mode, args)
+        throttled = server_requests - counts["completed"]
+        per_minute = counts["completed"] / args.duration * 60
+        print(f"{mode:<14} {per_minute:>14.0f} {throttled:>10} {counts['failed']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+Transaction existence check benchmark.
+
+Compares the two ways the sync can find out which fetched transaction ids are
+already stored:
+
+- per id : `MongoRepo.transaction_exists()` (count_documents, limit=1) per id
+- set    : `MongoRepo.existing_transaction_ids()` ($in query per 1000 ids)
+
+By default `MongoRepo` runs against an in-memory stand-in collection that
+charges a fixed round-trip time per query (like a call to Atlas), so no
+database is needed. Pass `--mongodb-uri` to measure a real mongod instead; a
+scratch database is created and dropped.
+
+Run from the project root:
+    uv run python -m benchmarks.bench_txn_lookup --ids 5000 --stored 4500 --rtt-ms 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from functions.sync.mongo_repo import MongoRepo
+
+
+class _StandInCursor:
+    def __init__(self, docs: list[dict], rtt: float) -> None:
+        self._docs = docs
+        self._rtt = rtt
+
+    async def __aiter__(self):
+        await asyncio.sleep(self._rtt)  # one batch is enough for 1000 projected ids
+        for doc in self._docs:
+            yield doc
+
+
+class StandInTransactions:
+    """The subset of AsyncCollection used by the existence checks."""
+
+    def __init__(self, stored: set[str], rtt: float) -> None:
+        self.stored = stored
+        self.rtt = rtt
+        self.round_trips = 0
+
+    async def count_documents(self, query: dict, limit: int = 0) -> int:
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+        return int(query["transaction_id"] in self.stored)
+
+    def find(self, query: dict, projection: dict) -> _StandInCursor:
+        self.round_trips += 1
+        ids = query["transaction_id"]["$in"]
+        docs = [{"transaction_id": i} for i in ids if i in self.stored]
+        return _StandInCursor(docs, self.rtt)
+
+
+async def _per_id(repo: MongoRepo, ids: list[str]) -> set[str]:
+    return {i for i in ids if await repo.transaction_exists(i)}
+
+
+async def _set_based(repo: MongoRepo, ids: list[str]) -> set[str]:
+    return await repo.existing_transaction_ids(ids)
+
+
+async def _time(fn, repo: MongoRepo, ids: list[str]) -> tuple[float, set[str]]:
+    start = time.perf_counter()
+    found = await fn(repo, ids)
+    return time.perf_counter() - start, found
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ids", type=int, default=5000, help="fetched transaction ids")
+    parser.add_argument("--stored", type=int, default=4500, help="ids already stored")
+    parser.add_argument("--rtt-ms", type=float, default=20.0, help="stand-in round trip")
+    parser.add_argument("--mongodb-uri", help="measure a real mongod instead")
+    args = parser.parse_args()
+
+    ids = [f"TXN{n:08d}" for n in range(args.ids)]
+    stored = set(ids[: args.stored])
+    repo = MongoRepo(args.mongodb_uri or "mongodb://localhost", "bench_txn_lookup")
+    if args.mongodb_uri:
+        await repo.initialize()
+        await repo._db["transactions"].delete_many({})
+        await repo._db["transactions"].insert_many([{"transaction_id": i} for i in stored])
+        target = f"mongod at {args.mongodb_uri}"
+    else:
+        collection = StandInTransactions(stored, args.rtt_ms / 1000)
+        repo._db = {"transactions": collection}
+        target = f"stand-in collection, {args.rtt_ms:.0f} ms per round trip"
+
+    print(f"{args.ids} ids, {args.stored} stored; {target}")
+    print(f"{'method':<8} {'time s':>8} {'round trips':>12} {'found':>7}")
+    try:
+        for name, fn in (("per id", _per_id), ("set", _set_based)):
+            before = 0 if args.mongodb_uri else collection.round_trips
+            elapsed, found = await _time(fn, repo, ids)
+            trips = "-" if args.mongodb_uri else str(collection.round_trips - before)
+            print(f"{name:<8} {elapsed:>8.2f} {trips:>12} {len(found):>7}")
+    finally:
+        if args.mongodb_uri:
+            await repo._client.drop_database("bench_txn_lookup")
+        await repo.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
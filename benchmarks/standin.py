@@ -0,0 +1,200 @@
+"""
+Local stand-in for api.comdirect.de used by the benchmarks.
+
+A tiny asyncio server that speaks HTTP/1.1 (via h11) and cleartext HTTP/2 with
+prior knowledge (via h2) on the same port. Every request is answered by a
+pluggable async handler, so individual benchmarks can simulate latency, quotas
+or canned payloads without touching the real bank.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import h11
+import httpx
+
+from comdirect_api.client import ComdirectClient
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:  # pragma: no cover - h2 only needed for HTTP/2 benchmarks
+    h2 = None
+
+# (method, path) -> (status, headers, body)
+Handler = Callable[[str, str], Awaitable[tuple[int, dict[str, str], bytes]]]
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+EMPTY_LIST = b'{"paging": {"index": 0, "matches": 0}, "values": []}'
+
+
+def fixed_latency(seconds: float, body: bytes = EMPTY_LIST) -> Handler:
+    """Handler that answers every request with `body` after a fixed delay."""
+
+    async def handler(method: str, path: str) -> tuple[int, dict[str, str], bytes]:
+        await asyncio.sleep(seconds)
+        return 200, {"content-type": "application/json"}, body
+
+    return handler
+
+
+def fixed_window_quota(
+    quota: int, window: float = 1.0, latency: float = 0.0, body: bytes = EMPTY_LIST
+) -> Handler:
+    """
+    Handler enforcing `quota` requests per fixed `window` like a throttling API.
+
+    Requests over the quota get 429 with an integer-second Retry-After, which
+    is how most real gateways (and api.comdirect.de) round their hints.
+    """
+    state = {"window_start": time.monotonic(), "count": 0}
+
+    async def handler(method: str, path: str) -> tuple[int, dict[str, str], bytes]:
+        now = time.monotonic()
+        if now - state["window_start"] >= window:
+            state["window_start"], state["count"] = now, 0
+        state["count"] += 1
+        if state["count"] > quota:
+            return 429, {"retry-after": "1"}, b'{"code": "TOO_MANY_REQUESTS"}'
+        await asyncio.sleep(latency)
+        return 200, {"content-type": "application/json"}, body
+
+    return handler
+
+
+class StandInClient(ComdirectClient):
+    """ComdirectClient pointed at a stand-in server, already 'authenticated'."""
+
+    def __init__(self, base_url: str, client_id: str = "bench", **kwargs) -> None:
+        super().__init__(
+            client_id=client_id,
+            client_secret="bench",
+            zugangsnummer="bench",
+            pin="bench",
+            **kwargs,
+        )
+        self.BASE_URL = f"{base_url}/api"
+        self.banking_access_token = "bench-token"
+        self.session_id = "bench-session"
+        self.token_expires_at = time.time() + 3600
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                limits=self._limits,
+                timeout=self._timeout,
+                http1=not self._http2,  # h2c prior knowledge for the cleartext stand-in
+                http2=self._http2,
+            )
+        return self._http
+
+
+class StandInServer:
+    """Async context manager running the stand-in server on a free local port."""
+
+    def __init__(self, handler: Handler, host: str = "127.0.0.1") -> None:
+        self._handler = handler
+        self._host = host
+        self._server: asyncio.Server | None = None
+        self.connections = 0
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Server is not running")
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://{self._host}:{port}"
+
+    async def __aenter__(self) -> "StandInServer":
+        self._server = await asyncio.start_server(self._serve, self._host, 0)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            data = await reader.read(65536)
+            if data.startswith(H2_PREFACE):
+                await self._serve_h2(data, reader, writer)
+            else:
+                await self._serve_h1(data, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h1(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conn = h11.Connection(h11.SERVER)
+        conn.receive_data(data)
+        request: h11.Request | None = None
+        while True:
+            event = conn.next_event()
+            if event is h11.NEED_DATA:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                conn.receive_data(chunk)
+            elif isinstance(event, h11.Request):
+                request = event
+            elif isinstance(event, h11.EndOfMessage) and request is not None:
+                self.requests += 1
+                status, headers, body = await self._handler(
+                    request.method.decode(), request.target.decode()
+                )
+                response_headers = [(k, v) for k, v in headers.items()]
+                response_headers.append(("content-length", str(len(body))))
+                writer.write(conn.send(h11.Response(status_code=status, headers=response_headers)))
+                writer.write(conn.send(h11.Data(data=body)))
+                writer.write(conn.send(h11.EndOfMessage()))
+                await writer.drain()
+                conn.start_next_cycle()
+                request = None
+            elif isinstance(event, h11.ConnectionClosed):
+                return
+
+    async def _serve_h2(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        if h2 is None:
+            raise RuntimeError("HTTP/2 stand-in requires the 'h2' package")
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        pending: set[asyncio.Task] = set()
+
+        async def respond(stream_id: int, method: str, path: str) -> None:
+            self.requests += 1
+            status, headers, body = await self._handler(method, path)
+            response_headers = [(":status", str(status)), *headers.items()]
+            response_headers.append(("content-length", str(len(body))))
+            conn.send_headers(stream_id, response_headers)
+            conn.send_data(stream_id, body, end_stream=True)
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+        while data:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = dict(event.headers)
+                    task = asyncio.create_task(
+                        respond(event.stream_id, headers[":method"], headers[":path"])
+                    )
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
@@ -3,10 +3,12 @@
 import asyncio
 import json
 import logging
+from contextlib import aclosing
 
 import azure.functions as func
 
 from comdirect_api.client import ComdirectClient
+from comdirect_api.ratelimit import TokenBucketLimiter
 from functions.sync.mongo_repo import MongoRepo
 from functions.sync.settings import settings
 from functions.sync.sync_service import SyncService
@@ -20,6 +22,15 @@ _repo = MongoRepo(
     database=settings.mongodb_database,
 )
 
+# Shared by every client so all accounts stay within one client_id quota
+_limiter = TokenBucketLimiter(rate=settings.api_rate_limit_per_second)
+
+# Stored sessions let warm invocations skip the push TAN (None if no key is set)
+_token_store = settings.token_store()
+
+# Reference data (depot list, instruments) stays cached across warm invocations
+_cache = settings.response_cache()
+
 app = func.FunctionApp(http_auth_level=func.AuthLevel.FUNCTION)
 
 
@@ -39,32 +50,37 @@ async def comdirect_sync(req: func.HttpRequest) -> func.HttpResponse:
     """
     logger.info("Sync triggered")
 
+    credentials = {
+        name: (account.zugangsnummer.get_secret_value(), account.pin.get_secret_value())
+        for name, account in settings.accounts.items()
+    }
+    clients: dict[str, ComdirectClient] = {}
+    sync_tasks: dict[str, asyncio.Task[dict]] = {}
     try:
         await _repo.initialize()
 
-        # Sequential authentication — one push TAN approval per account
-        clients: dict[str, ComdirectClient] = {}
-        for name, account in settings.accounts.items():
-            logger.info("Authenticating %s...", name)
-            client = await ComdirectClient.create(
-                zugangsnummer=account.zugangsnummer.get_secret_value(),
-                pin=account.pin.get_secret_value(),
+        # Concurrent authentication — each account starts syncing once its TAN is approved
+        async with aclosing(
+            ComdirectClient.authenticate_many(
+                credentials, rate_limiter=_limiter, token_store=_token_store, cache=_cache
             )
-            clients[name] = client
-
-        # Parallel sync across all authenticated clients
-        tasks = [
-            SyncService(
-                client,
-                _repo,
-                account_name=name,
-                display_name=settings.accounts[name].display_name,
-                depot_transactions_lookback=settings.depot_transactions_lookback,
-            ).run_full_sync()
-            for name, client in clients.items()
-        ]
-        results_list = await asyncio.gather(*tasks)
-        result = dict(zip(clients.keys(), results_list))
+        ) as authenticated:
+            async for name, client in authenticated:
+                clients[name] = client
+                logger.info("%s authenticated", name)
+                service = SyncService(
+                    client,
+                    _repo,
+                    account_name=name,
+                    display_name=settings.accounts[name].display_name,
+                    depot_transactions_lookback=settings.depot_transactions_lookback,
+                    watermark_margin_days=settings.depot_transactions_safety_margin_days,
+                    full_rescan=settings.depot_transactions_full_rescan,
+                )
+                sync_tasks[name] = asyncio.create_task(service.run_full_sync())
+
+        results_list = await asyncio.gather(*sync_tasks.values())
+        result = dict(zip(sync_tasks.keys(), results_list))
 
     except Exception as exc:
         logger.exception("Sync failed: %s", exc)
@@ -73,6 +89,11 @@ async def comdirect_sync(req: func.HttpRequest) -> func.HttpResponse:
             status_code=500,
             mimetype="application/json",
         )
+    finally:
+        for task in sync_tasks.values():
+            task.cancel()  # no-op for finished syncs
+        await asyncio.gather(*sync_tasks.values(), return_exceptions=True)
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
 
     return func.HttpResponse(
         json.dumps(result, default=str),
@@ -1,11 +1,17 @@
 """MongoDB Atlas repository for the Comdirect sync function."""
 
+from collections.abc import Iterable
 from datetime import UTC, date, datetime
 from decimal import Decimal
 
-from pymongo import ASCENDING, DESCENDING
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, UpdateOne
 from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.asynchronous.mongo_client import AsyncMongoClient
+from pymongo.errors import BulkWriteError
+
+_DUPLICATE_KEY = 11000
+_IN_CHUNK = 1000  # transaction_ids per $in query
 
 
 def _now() -> datetime:
@@ -23,6 +29,35 @@ def _date_to_datetime(d: date | None) -> datetime | None:
     return datetime(d.year, d.month, d.day, tzinfo=UTC)
 
 
+def _transaction_doc(
+    transaction_id: str,
+    depot_id: str,
+    account_name: str,
+    display_name: str | None,
+    wkn: str | None,
+    booking_date: date | None,
+    transaction_type: str | None,
+    quantity: Decimal | None,
+    quantity_unit: str | None,
+    execution_price: Decimal | None,
+    price_unit: str | None,
+) -> dict:
+    return {
+        "transaction_id": transaction_id,
+        "depot_id": depot_id,
+        "account_name": account_name,
+        "display_name": display_name,
+        "wkn": wkn,
+        "booking_date": _date_to_datetime(booking_date),
+        "transaction_type": transaction_type,
+        "quantity": _decimal_to_str(quantity),
+        "quantity_unit": quantity_unit,
+        "execution_price": _decimal_to_str(execution_price),
+        "price_unit": price_unit,
+        "recorded_at": _now(),
+    }
+
+
 class MongoRepo:
     """All Atlas read/write operations for the sync service."""
 
@@ -39,10 +74,31 @@ class MongoRepo:
             [("depot_id", ASCENDING), ("recorded_at", DESCENDING)]
         )
         await self._db["transactions"].create_index("transaction_id", unique=True)
+        await self._db["transaction_watermarks"].create_index("depot_id", unique=True)
 
     async def close(self) -> None:
         await self._client.aclose()
 
+    async def _latest_per_key(
+        self, collection: str, key: str, ids: Iterable[str]
+    ) -> dict[str, dict]:
+        """
+        Latest document (by recorded_at) per `key` value, via one aggregation.
+
+        $sort on (key, recorded_at desc) follows the (key, recorded_at) index,
+        so $group with $first reads one index entry per key instead of
+        scanning every snapshot. Ids without documents are absent.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        cursor = await self._db[collection].aggregate([
+            {"$match": {key: {"$in": ids}}},
+            {"$sort": {key: ASCENDING, "recorded_at": DESCENDING}},
+            {"$group": {"_id": f"${key}", "doc": {"$first": "$$ROOT"}}},
+        ])
+        return {row["_id"]: row["doc"] async for row in cursor}
+
     # ------------------------------------------------------------------
     # account_balances — insert-only time series
     # ------------------------------------------------------------------
@@ -54,6 +110,10 @@ class MongoRepo:
             sort=[("recorded_at", DESCENDING)],
         )
 
+    async def get_latest_balances(self, account_ids: Iterable[str]) -> dict[str, dict]:
+        """Return {account_id: latest balance document} for all accounts in one query."""
+        return await self._latest_per_key("account_balances", "account_id", account_ids)
+
     async def insert_balance(
         self,
         account_id: str,
@@ -82,15 +142,20 @@ class MongoRepo:
 
     async def touch_balance_last_synced(self, account_id: str) -> None:
         """Update last_synced_at on the latest balance doc without inserting a new one."""
-        doc = await self._db["account_balances"].find_one(
+        await self._db["account_balances"].find_one_and_update(
             {"account_id": account_id},
+            {"$set": {"last_synced_at": _now()}},
             sort=[("recorded_at", DESCENDING)],
         )
-        if doc:
-            await self._db["account_balances"].update_one(
-                {"_id": doc["_id"]},
-                {"$set": {"last_synced_at": _now()}},
-            )
+
+    async def touch_balances_last_synced(self, balance_ids: list[ObjectId]) -> None:
+        """Update last_synced_at on already fetched balance docs (by _id) in one write."""
+        if not balance_ids:
+            return
+        await self._db["account_balances"].update_many(
+            {"_id": {"$in": balance_ids}},
+            {"$set": {"last_synced_at": _now()}},
+        )
 
     # ------------------------------------------------------------------
     # depot_snapshots — insert-only; one document = entire depot state
@@ -103,6 +168,10 @@ class MongoRepo:
             sort=[("recorded_at", DESCENDING)],
         )
 
+    async def get_latest_depot_snapshots(self, depot_ids: Iterable[str]) -> dict[str, dict]:
+        """Return {depot_id: latest snapshot} for all depots in one query."""
+        return await self._latest_per_key("depot_snapshots", "depot_id", depot_ids)
+
     async def insert_depot_snapshot(
         self,
         depot_id: str,
@@ -130,17 +199,25 @@ class MongoRepo:
             "last_synced_at": now,
         })
 
-    async def touch_depot_last_synced(self, depot_id: str) -> None:
-        """Update last_synced_at on the latest snapshot without inserting a new one."""
-        doc = await self._db["depot_snapshots"].find_one(
+    async def touch_depot_last_synced(
+        self, depot_id: str, snapshot_id: ObjectId | None = None
+    ) -> None:
+        """
+        Update last_synced_at on the latest snapshot without inserting a new one.
+
+        Pass the _id of the snapshot already read via get_latest_depot_snapshot()
+        to update it directly; otherwise the latest one is looked up in the
+        same round trip.
+        """
+        update = {"$set": {"last_synced_at": _now()}}
+        if snapshot_id is not None:
+            await self._db["depot_snapshots"].update_one({"_id": snapshot_id}, update)
+            return
+        await self._db["depot_snapshots"].find_one_and_update(
             {"depot_id": depot_id},
+            update,
             sort=[("recorded_at", DESCENDING)],
         )
-        if doc:
-            await self._db["depot_snapshots"].update_one(
-                {"_id": doc["_id"]},
-                {"$set": {"last_synced_at": _now()}},
-            )
 
     # ------------------------------------------------------------------
     # transactions — insert-only, keyed by transaction_id
@@ -154,6 +231,24 @@ class MongoRepo:
             > 0
         )
 
+    async def existing_transaction_ids(self, transaction_ids: Iterable[str]) -> set[str]:
+        """
+        Return the subset of `transaction_ids` that is already stored.
+
+        Runs one $in query per _IN_CHUNK ids, projected to transaction_id
+        without _id, so the unique index covers it and no documents are read.
+        """
+        ids = list(dict.fromkeys(transaction_ids))
+        existing: set[str] = set()
+        for start in range(0, len(ids), _IN_CHUNK):
+            cursor = self._db["transactions"].find(
+                {"transaction_id": {"$in": ids[start:start + _IN_CHUNK]}},
+                {"transaction_id": 1, "_id": 0},
+            )
+            async for doc in cursor:
+                existing.add(doc["transaction_id"])
+        return existing
+
     async def insert_transaction(
         self,
         transaction_id: str,
@@ -170,17 +265,80 @@ class MongoRepo:
     ) -> None:
         if await self.transaction_exists(transaction_id):
             return
-        await self._db["transactions"].insert_one({
-            "transaction_id": transaction_id,
-            "depot_id": depot_id,
-            "account_name": account_name,
-            "display_name": display_name,
-            "wkn": wkn,
-            "booking_date": _date_to_datetime(booking_date),
-            "transaction_type": transaction_type,
-            "quantity": _decimal_to_str(quantity),
-            "quantity_unit": quantity_unit,
-            "execution_price": _decimal_to_str(execution_price),
-            "price_unit": price_unit,
-            "recorded_at": _now(),
-        })
+        await self._db["transactions"].insert_one(_transaction_doc(
+            transaction_id=transaction_id,
+            depot_id=depot_id,
+            account_name=account_name,
+            display_name=display_name,
+            wkn=wkn,
+            booking_date=booking_date,
+            transaction_type=transaction_type,
+            quantity=quantity,
+            quantity_unit=quantity_unit,
+            execution_price=execution_price,
+            price_unit=price_unit,
+        ))
+
+    async def insert_transactions_bulk(self, transactions: list[dict]) -> dict:
+        """
+        Insert a batch of transactions in one unordered bulk write.
+
+        Each dict carries the keyword arguments of insert_transaction(). Every
+        transaction becomes an upsert with $setOnInsert keyed by the unique
+        transaction_id, so existing documents are left untouched. Returns
+        {"inserted": n, "skipped": m}.
+        """
+        if not transactions:
+            return {"inserted": 0, "skipped": 0}
+
+        operations = []
+        for txn in transactions:
+            doc = _transaction_doc(**txn)
+            operations.append(UpdateOne(
+                {"transaction_id": doc["transaction_id"]},
+                {"$setOnInsert": doc},
+                upsert=True,
+            ))
+        try:
+            result = await self._db["transactions"].bulk_write(operations, ordered=False)
+            inserted = result.upserted_count
+        except BulkWriteError as e:
+            # A concurrent sync may insert the same transaction_id between the
+            # upsert's lookup and its insert; the unique index rejects ours.
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != _DUPLICATE_KEY for error in errors):
+                raise
+            inserted = e.details.get("nUpserted", 0)
+        return {"inserted": inserted, "skipped": len(operations) - inserted}
+
+    # ------------------------------------------------------------------
+    # transaction_watermarks — one document per depot, replaced each sync
+    # ------------------------------------------------------------------
+
+    async def get_transaction_watermark(self, depot_id: str) -> dict | None:
+        """
+        Return the depot's high-water mark, or None before the first sync.
+
+        {"booking_date": date, "transaction_ids": [ids booked on that date]}
+        """
+        doc = await self._db["transaction_watermarks"].find_one({"depot_id": depot_id})
+        if doc is None:
+            return None
+        return {
+            "booking_date": doc["booking_date"].date(),
+            "transaction_ids": doc["transaction_ids"],
+        }
+
+    async def set_transaction_watermark(
+        self, depot_id: str, booking_date: date, transaction_ids: list[str]
+    ) -> None:
+        """Store the latest synced booking date and the transaction ids booked on it."""
+        await self._db["transaction_watermarks"].update_one(
+            {"depot_id": depot_id},
+            {"$set": {
+                "booking_date": _date_to_datetime(booking_date),
+                "transaction_ids": transaction_ids,
+                "updated_at": _now(),
+            }},
+            upsert=True,
+        )
@@ -3,11 +3,13 @@
 Run from the project root:
     uv run python -m functions.sync.run
     uv run python -m functions.sync.run --accounts DEPOT11,DEPOT22
+    uv run python -m functions.sync.run --full-rescan
 
 Required environment variables (or .env file):
     CLIENT_ID, CLIENT_SECRET
     ACCOUNTS__<NAME>__ZUGANGSNUMMER, ACCOUNTS__<NAME>__PIN  (one pair per account)
     MONGODB_CONNECTION_STRING, MONGODB_DATABASE (default: finance)
+    TOKEN_STORE_KEY, TOKEN_STORE_PATH  (optional: resume sessions without a push TAN)
 """
 
 import argparse
@@ -15,8 +17,10 @@ import asyncio
 import json
 import logging
 import sys
+from contextlib import aclosing
 
 from comdirect_api.client import ComdirectClient
+from comdirect_api.ratelimit import TokenBucketLimiter
 from functions.sync.mongo_repo import MongoRepo
 from functions.sync.settings import settings
 from functions.sync.sync_service import SyncService
@@ -29,8 +33,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _parse_args() -> set[str] | None:
-    """Return the set of account names to sync, or None to sync all."""
+def _parse_args() -> tuple[set[str] | None, bool]:
+    """Return the account names to sync (None = all) and whether to rescan fully."""
     parser = argparse.ArgumentParser(description="Comdirect → MongoDB Atlas sync")
     parser.add_argument(
         "--accounts",
@@ -38,14 +42,21 @@ def _parse_args() -> set[str] | None:
         help="Comma-separated account names to sync (e.g. DEPOT11,DEPOT22). "
              "Omit or leave blank to sync all configured accounts.",
     )
+    parser.add_argument(
+        "--full-rescan",
+        action="store_true",
+        help="Fetch the whole depot transaction lookback window instead of "
+             "starting at the stored watermarks.",
+    )
     args = parser.parse_args()
+    full_rescan = args.full_rescan or settings.depot_transactions_full_rescan
     if args.accounts.strip():
-        return {name.strip().lower() for name in args.accounts.split(",")}
-    return None  # all accounts
+        return {name.strip().lower() for name in args.accounts.split(",")}, full_rescan
+    return None, full_rescan  # all accounts
 
 
 async def main() -> None:
-    selected = _parse_args()
+    selected, full_rescan = _parse_args()
 
     repo = MongoRepo(
         connection_string=settings.mongodb_connection_string.get_secret_value(),
@@ -53,43 +64,63 @@ async def main() -> None:
     )
     await repo.initialize()
 
+    # One limiter for all accounts — they share the same OAuth client_id quota
+    limiter = TokenBucketLimiter(rate=settings.api_rate_limit_per_second)
+    token_store = settings.token_store()
+    cache = settings.response_cache()
+    credentials: dict[str, tuple[str, str]] = {}
+    for name, account in settings.accounts.items():
+        if selected is not None and name not in selected:
+            logger.info("Skipping %s (not in --accounts filter)", name)
+            continue
+        credentials[name] = (
+            account.zugangsnummer.get_secret_value(),
+            account.pin.get_secret_value(),
+        )
+
+    if not credentials:
+        logger.warning("No accounts matched. Check --accounts filter or .env configuration.")
+        await repo.close()
+        return
+
+    clients: dict[str, ComdirectClient] = {}
+    sync_tasks: dict[str, asyncio.Task[dict]] = {}
     try:
-        # --- Sequential authentication (one push TAN approval at a time) ---
-        clients: dict[str, ComdirectClient] = {}
-        for name, account in settings.accounts.items():
-            if selected is not None and name not in selected:
-                logger.info("Skipping %s (not in --accounts filter)", name)
-                continue
-            logger.info("Authenticating %s — approve push TAN on your phone...", name)
-            client = await ComdirectClient.create(
-                zugangsnummer=account.zugangsnummer.get_secret_value(),
-                pin=account.pin.get_secret_value(),
+        # --- Concurrent authentication; each account starts syncing once approved ---
+        logger.info(
+            "Authenticating %s — approve the push TANs on your phone if asked...",
+            ", ".join(credentials),
+        )
+        async with aclosing(
+            ComdirectClient.authenticate_many(
+                credentials, rate_limiter=limiter, token_store=token_store, cache=cache
             )
-            clients[name] = client
-            logger.info("%s authenticated.", name)
-
-        if not clients:
-            logger.warning("No accounts matched. Check --accounts filter or .env configuration.")
-            return
-
-        # --- Parallel sync (all authenticated clients run concurrently) ---
-        logger.info("Starting parallel sync for: %s", ", ".join(clients))
-        tasks = [
-            SyncService(
-                client,
-                repo,
-                account_name=name,
-                display_name=settings.accounts[name].display_name,
-                depot_transactions_lookback=settings.depot_transactions_lookback,
-            ).run_full_sync()
-            for name, client in clients.items()
-        ]
-        results_list = await asyncio.gather(*tasks)
-        result = dict(zip(clients.keys(), results_list))
+        ) as authenticated:
+            async for name, client in authenticated:
+                clients[name] = client
+                logger.info("%s authenticated — starting sync.", name)
+                service = SyncService(
+                    client,
+                    repo,
+                    account_name=name,
+                    display_name=settings.accounts[name].display_name,
+                    depot_transactions_lookback=settings.depot_transactions_lookback,
+                    watermark_margin_days=settings.depot_transactions_safety_margin_days,
+                    full_rescan=full_rescan,
+                )
+                sync_tasks[name] = asyncio.create_task(service.run_full_sync())
+
+        results_list = await asyncio.gather(*sync_tasks.values())
+        result = dict(zip(sync_tasks.keys(), results_list))
 
         print(json.dumps(result, default=str, indent=2))
         logger.info("Sync completed successfully")
     finally:
+        # Stop syncs still running if authentication of another account failed
+        for task in sync_tasks.values():
+            task.cancel()
+        await asyncio.gather(*sync_tasks.values(), return_exceptions=True)
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
         await repo.close()
 
 
@@ -16,6 +16,12 @@ class SyncSettings(ClientSettings):
     mongodb_connection_string: SecretStr
     mongodb_database: str = "finance"
     depot_transactions_lookback_days: int = 365
+    # Incremental fetches start this many days before the stored watermark
+    depot_transactions_safety_margin_days: int = 7
+    # Ignore the watermarks and fetch the whole lookback window
+    depot_transactions_full_rescan: bool = False
+    # Requests per second shared by all accounts (they use the same OAuth client_id)
+    api_rate_limit_per_second: float = 10.0
 
     @property
     def depot_transactions_lookback(self) -> str:
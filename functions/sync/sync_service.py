@@ -1,12 +1,9 @@
 """Sync orchestration logic — testable independently of the Azure Function trigger."""
 
-import asyncio
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 
-import httpx
-
 from comdirect_api.client import ComdirectClient
 from functions.sync.mongo_repo import MongoRepo
 
@@ -26,6 +23,9 @@ class SyncService:
       position fully sold/closed). Otherwise only last_synced_at is updated.
       Latest state = most recent document for that depot_id.
     - transactions      : insert-only, idempotent (skipped if transaction_id exists).
+      Fetched incrementally from a per-depot watermark (latest booking date and
+      the ids booked on it) minus a safety margin; the first run, full_rescan,
+      or a watermark the bank no longer confirms fetch the whole lookback window.
     """
 
     def __init__(
@@ -35,12 +35,17 @@ class SyncService:
         account_name: str,
         display_name: str | None = None,
         depot_transactions_lookback: str = "-3650d",
+        watermark_margin_days: int = 7,
+        full_rescan: bool = False,
     ) -> None:
         self._client = client
         self._repo = repo
         self._account_name = account_name
         self._display_name = display_name
         self._depot_transactions_lookback = depot_transactions_lookback
+        # Late bookings can carry a booking date before the watermark
+        self._watermark_margin = timedelta(days=watermark_margin_days)
+        self._full_rescan = full_rescan
 
     @staticmethod
     def _extract_instrument_identifiers(txn) -> tuple[str | None, str | None]:
@@ -152,39 +157,14 @@ class SyncService:
             "purchase_price_at_entry": {"value": None, "unit": None},
         }
 
-    async def _fetch_depot_transactions_with_retry(
-        self,
-        depot_id: str,
-        min_booking_date: str,
-    ):
-        """Fetch depot transactions with retry on 429."""
-        for attempt in range(4):
-            try:
-                return await self._client.get_depot_transactions(
-                    depot_id=depot_id,
-                    min_booking_date=min_booking_date,
-                )
-            except httpx.HTTPStatusError as exc:
-                if exc.response.status_code == 429 and attempt < 3:
-                    wait = 2 ** (attempt + 1)
-                    logger.warning(
-                        (
-                            "Rate limited fetching depot %s transactions, "
-                            "retrying in %ds (attempt %d/3)…"
-                        ),
-                        depot_id,
-                        wait,
-                        attempt + 1,
-                    )
-                    await asyncio.sleep(wait)
-                else:
-                    raise
-
     async def sync_account_balances(self) -> dict:
         """Fetch all account balances. Insert snapshot on change, touch timestamp otherwise."""
         balances = await self._client.get_account_balances()
         inserted = 0
-        touched = 0
+        unchanged_ids = []  # _ids of latest docs to touch in one write
+        latest_by_account = await self._repo.get_latest_balances(
+            [ab.account.account_id for ab in balances.values if ab.account]
+        )
 
         for ab in balances.values:
             account_id = ab.account.account_id if ab.account else None
@@ -192,11 +172,10 @@ class SyncService:
                 continue
 
             new_value = ab.balance.value if ab.balance else None
-            latest = await self._repo.get_latest_balance(account_id)
+            latest = latest_by_account.get(account_id)
 
             if latest and latest.get("balance", {}).get("value") == str(new_value):
-                await self._repo.touch_balance_last_synced(account_id)
-                touched += 1
+                unchanged_ids.append(latest["_id"])
                 continue
 
             await self._repo.insert_balance(
@@ -215,9 +194,16 @@ class SyncService:
             inserted += 1
             logger.info("Balance snapshot inserted for account %s", account_id)
 
-        return {"inserted": inserted, "touched": touched}
+        await self._repo.touch_balances_last_synced(unchanged_ids)
+        return {"inserted": inserted, "touched": len(unchanged_ids)}
 
-    async def sync_depot_positions(self, depot_id: str, depot_transactions=None) -> dict:
+    async def sync_depot_positions(
+        self,
+        depot_id: str,
+        depot_transactions=None,
+        fetch_history: bool = False,
+        latest_snapshots: dict[str, dict] | None = None,
+    ) -> dict:
         """
         Snapshot the entire depot.
 
@@ -226,23 +212,17 @@ class SyncService:
           - a new position appears
           - a position is gone (fully sold)
         Otherwise only touch last_synced_at on the latest snapshot.
+
+        Entry metadata is derived from depot_transactions. With fetch_history
+        and no transactions given, the lookback window is fetched only when a
+        new snapshot is actually inserted. latest_snapshots, as returned by
+        MongoRepo.get_latest_depot_snapshots(), saves the per-depot lookup.
+
+        Rate limiting (429) is retried by the client's request pipeline.
         """
-        for attempt in range(4):
-            try:
-                positions = await self._client.get_depot_positions(
-                    depot_id=depot_id, with_attr="instrument"
-                )
-                break
-            except httpx.HTTPStatusError as exc:
-                if exc.response.status_code == 429 and attempt < 3:
-                    wait = 2 ** (attempt + 1)  # 2, 4, 8 seconds
-                    logger.warning(
-                        "Rate limited fetching depot %s positions, retrying in %ds (attempt %d/3)…",
-                        depot_id, wait, attempt + 1,
-                    )
-                    await asyncio.sleep(wait)
-                else:
-                    raise
+        positions = await self._client.get_depot_positions(
+            depot_id=depot_id, with_attr="instrument", lazy=True
+        )
 
         # Build current state as {position_id: quantity_str}
         current: dict[str, str] = {}
@@ -252,7 +232,10 @@ class SyncService:
                 current[pos.position_id] = str(qty) if qty is not None else "None"
 
         # Compare against latest snapshot fingerprint
-        latest = await self._repo.get_latest_depot_snapshot(depot_id)
+        if latest_snapshots is None:
+            latest = await self._repo.get_latest_depot_snapshot(depot_id)
+        else:
+            latest = latest_snapshots.get(depot_id)
         if latest:
             previous: dict[str, str] = {
                 p["position_id"]: p.get("quantity", {}).get("value", "None")
@@ -263,7 +246,7 @@ class SyncService:
             changed = True  # no snapshot yet
 
         if not changed:
-            await self._repo.touch_depot_last_synced(depot_id)
+            await self._repo.touch_depot_last_synced(depot_id, snapshot_id=latest["_id"])
             logger.info("Depot %s unchanged — touched last_synced_at", depot_id)
             return {"inserted": 0, "touched": 1}
 
@@ -278,6 +261,13 @@ class SyncService:
             """Return unit or None from an AmountValue-like object."""
             return amount_value.unit if amount_value else None
 
+        if depot_transactions is None and fetch_history:
+            # The holding period can start long before an incremental window
+            depot_transactions = await self._client.get_depot_transactions(
+                depot_id=depot_id,
+                min_booking_date=self._depot_transactions_lookback,
+                lazy=True,
+            )
         tx_values = depot_transactions.values if depot_transactions else []
 
         snapshot_positions = []
@@ -336,40 +326,90 @@ class SyncService:
     ) -> dict:
         """Insert any new depot transactions (idempotent)."""
         booking_date_filter = min_booking_date or self._depot_transactions_lookback
-        txns = depot_transactions or await self._fetch_depot_transactions_with_retry(
+        txns = depot_transactions or await self._client.get_depot_transactions(
             depot_id=depot_id,
             min_booking_date=booking_date_filter,
+            lazy=True,
+        )
+        fetched = [txn for txn in txns.values if txn.transaction_id]
+        existing = await self._repo.existing_transaction_ids(
+            [txn.transaction_id for txn in fetched]
         )
-        inserted = 0
-        skipped = 0
 
-        for txn in txns.values:
-            if not txn.transaction_id:
+        batch = []
+        for txn in fetched:
+            if txn.transaction_id in existing:
                 continue
-            if await self._repo.transaction_exists(txn.transaction_id):
-                skipped += 1
-                continue
-
-            await self._repo.insert_transaction(
-                transaction_id=txn.transaction_id,
-                depot_id=depot_id,
-                account_name=self._account_name,
-                display_name=self._display_name,
-                wkn=self._extract_instrument_identifiers(txn)[0],
-                booking_date=txn.booking_date,
-                transaction_type=txn.transaction_type,
-                quantity=txn.quantity.value if txn.quantity else None,
-                quantity_unit=txn.quantity.unit if txn.quantity else None,
-                execution_price=(
+            batch.append({
+                "transaction_id": txn.transaction_id,
+                "depot_id": depot_id,
+                "account_name": self._account_name,
+                "display_name": self._display_name,
+                "wkn": self._extract_instrument_identifiers(txn)[0],
+                "booking_date": txn.booking_date,
+                "transaction_type": txn.transaction_type,
+                "quantity": txn.quantity.value if txn.quantity else None,
+                "quantity_unit": txn.quantity.unit if txn.quantity else None,
+                "execution_price": (
                     txn.execution_price.value if txn.execution_price else None
                 ),
-                price_unit=(
+                "price_unit": (
                     txn.execution_price.unit if txn.execution_price else None
                 ),
+            })
+
+        # Upserts still skip ids stored concurrently since the lookup
+        result = await self._repo.insert_transactions_bulk(batch)
+        inserted = result["inserted"]
+        return {"inserted": inserted, "skipped": len(fetched) - inserted}
+
+    async def _fetch_depot_transactions(self, depot_id: str) -> tuple:
+        """
+        Fetch the depot transactions to persist.
+
+        Starts at the stored watermark minus the safety margin. The whole
+        lookback window is fetched instead on the first run, with full_rescan,
+        or if the overlap no longer contains the transactions booked on the
+        watermark date. Returns (transactions, incremental).
+        """
+        watermark = None
+        if not self._full_rescan:
+            watermark = await self._repo.get_transaction_watermark(depot_id)
+        if watermark is not None:
+            since = watermark["booking_date"] - self._watermark_margin
+            txns = await self._client.get_depot_transactions(
+                depot_id=depot_id, min_booking_date=since.isoformat(), lazy=True
+            )
+            fetched_ids = {txn.transaction_id for txn in txns.values}
+            if fetched_ids.issuperset(watermark["transaction_ids"]):
+                return txns, True
+            logger.warning(
+                "Depot %s: watermark %s not confirmed by the API — full rescan",
+                depot_id, watermark["booking_date"],
             )
-            inserted += 1
 
-        return {"inserted": inserted, "skipped": skipped}
+        txns = await self._client.get_depot_transactions(
+            depot_id=depot_id,
+            min_booking_date=self._depot_transactions_lookback,
+            lazy=True,
+        )
+        return txns, False
+
+    async def _advance_watermark(self, depot_id: str, transactions) -> None:
+        """Store the latest booking date of booked transactions and the ids booked on it."""
+        latest = date.min
+        ids: list[str] = []
+        for txn in transactions:
+            if not txn.transaction_id or getattr(txn, "booking_status", None) == "NOTBOOKED":
+                continue  # pending bookings may still change their date
+            booking_date, txn_id = self._booking_date_key(txn)
+            if booking_date > latest:
+                latest, ids = booking_date, [txn_id]
+            elif booking_date == latest:
+                ids.append(txn_id)
+        if latest == date.min:
+            return  # nothing booked in the window; keep the previous watermark
+        await self._repo.set_transaction_watermark(depot_id, latest, sorted(ids))
 
     async def run_full_sync(self) -> dict:
         """Run a complete sync: balances + all depots (positions + transactions)."""
@@ -378,20 +418,23 @@ class SyncService:
         result["account_balances"] = await self.sync_account_balances()
 
         depots = await self._client.get_account_depots()
+        latest_snapshots = await self._repo.get_latest_depot_snapshots(
+            [depot.depot_id for depot in depots.values]
+        )
         for depot in depots.values:
             depot_id = depot.depot_id
-            depot_transactions = await self._fetch_depot_transactions_with_retry(
-                depot_id=depot_id,
-                min_booking_date=self._depot_transactions_lookback,
-            )
+            depot_transactions, incremental = await self._fetch_depot_transactions(depot_id)
             positions_result = await self.sync_depot_positions(
                 depot_id,
-                depot_transactions=depot_transactions,
+                depot_transactions=None if incremental else depot_transactions,
+                fetch_history=incremental,
+                latest_snapshots=latest_snapshots,
             )
             transactions_result = await self.sync_depot_transactions(
                 depot_id,
                 depot_transactions=depot_transactions,
             )
+            await self._advance_watermark(depot_id, depot_transactions.values)
             result["depots"].append({
                 "depot_id": depot_id,
                 "positions": positions_result,
@@ -0,0 +1,174 @@
+"""
+Incremental local mirror of the comdirect postbox.
+
+`DocumentArchive.sync(client)` pages through all document metadata, skips
+documents already recorded in its SQLite index and downloads the rest with
+bounded concurrency. Files are stored once per content hash under
+`<root>/objects/`, so identical documents share one file. Interrupted runs
+resume: finished documents are in the index, and partial downloads are
+continued from their `.part` files.
+"""
+
+import asyncio
+import logging
+import mimetypes
+import sqlite3
+from contextlib import closing
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+from pydantic import BaseModel, Field
+
+from .client import ComdirectClient
+from .models.messages import Document
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveSyncResult(BaseModel):
+    """Outcome of one `DocumentArchive.sync()` run."""
+
+    listed: int = 0  # documents in the postbox
+    downloaded: int = 0  # newly archived documents
+    skipped: int = 0  # already in the index
+    deduplicated: int = 0  # downloaded, but content already stored
+    failed: dict[str, str] = Field(default_factory=dict)  # document_id -> error
+
+
+class DocumentArchive:
+    """
+    Content-addressed document store with a SQLite index.
+
+    Layout below `root`:
+      index.sqlite              document metadata, hash and stored path
+      objects/<ab>/<sha256>.pdf one file per distinct content
+      incoming/<document_id>    downloads in progress (resumable)
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.index_path = self.root / "index.sqlite"
+        self._objects = self.root / "objects"
+        self._incoming = self.root / "incoming"
+        self._incoming.mkdir(parents=True, exist_ok=True)
+        self._objects.mkdir(exist_ok=True)
+        # Serializes hash lookups and renames so equal contents are stored once
+        self._store_lock = asyncio.Lock()
+        with closing(sqlite3.connect(self.index_path)) as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "document_id TEXT PRIMARY KEY, name TEXT NOT NULL, "
+                "date_creation TEXT NOT NULL, mime_type TEXT NOT NULL, "
+                "sha256 TEXT NOT NULL, size INTEGER NOT NULL, path TEXT NOT NULL, "
+                "archived_at TEXT NOT NULL)"
+            )
+
+    async def sync(
+        self, client: ComdirectClient, concurrency: int = 4, page_size: int = 100
+    ) -> ArchiveSyncResult:
+        """
+        Download all documents that are not yet in the index.
+
+        Metadata is paged with `iter_documents()` while downloads already run,
+        at most `concurrency` at a time. A failing document is recorded in
+        `failed` and retried on the next run instead of aborting this one.
+
+        Args:
+            client: Authenticated client with banking access
+            concurrency: Maximum parallel downloads (default: 4)
+            page_size: Documents per metadata request (default: 100)
+
+        Returns:
+            ArchiveSyncResult with per-outcome counts
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        result = ArchiveSyncResult()
+        known = await asyncio.to_thread(self._known_ids)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def archive(document: Document) -> None:
+            async with semaphore:
+                try:
+                    stored = await self._archive_one(client, document)
+                except (httpx.HTTPError, OSError) as exc:
+                    logger.warning("Archiving document %s failed: %s", document.document_id, exc)
+                    result.failed[document.document_id] = str(exc)
+                    return
+            if stored:
+                result.downloaded += 1
+            else:
+                result.deduplicated += 1
+
+        async with asyncio.TaskGroup() as tg:
+            async for document in client.iter_documents(page_size=page_size):
+                result.listed += 1
+                if document.document_id in known:
+                    result.skipped += 1
+                    continue
+                known.add(document.document_id)  # the postbox may list a document twice
+                tg.create_task(archive(document))
+
+        logger.info(
+            "Archive sync: %d listed, %d downloaded, %d skipped, %d deduplicated, %d failed",
+            result.listed,
+            result.downloaded,
+            result.skipped,
+            result.deduplicated,
+            len(result.failed),
+        )
+        return result
+
+    def path_for(self, document_id: str) -> Path | None:
+        """Return the stored file of an archived document, or None."""
+        with closing(sqlite3.connect(self.index_path)) as db:
+            row = db.execute(
+                "SELECT path FROM documents WHERE document_id = ?", (document_id,)
+            ).fetchone()
+        return self.root / row[0] if row else None
+
+    async def _archive_one(self, client: ComdirectClient, document: Document) -> bool:
+        """Download and index one document; return False if its content was already stored."""
+        incoming = self._incoming / document.document_id
+        download = await client.download_document(document.document_id, incoming)
+
+        extension = mimetypes.guess_extension(document.mime_type) or ""
+        target = self._objects / download.sha256[:2] / f"{download.sha256}{extension}"
+        async with self._store_lock:
+            stored = await asyncio.to_thread(self._store_object, incoming, target)
+        await asyncio.to_thread(self._record, document, download.sha256, download.size, target)
+        return stored
+
+    @staticmethod
+    def _store_object(incoming: Path, target: Path) -> bool:
+        if target.exists():
+            incoming.unlink()
+            return False
+        target.parent.mkdir(exist_ok=True)
+        incoming.replace(target)
+        return True
+
+    def _known_ids(self) -> set[str]:
+        with closing(sqlite3.connect(self.index_path)) as db:
+            return {row[0] for row in db.execute("SELECT document_id FROM documents")}
+
+    def _record(self, document: Document, sha256: str, size: int, target: Path) -> None:
+        with closing(sqlite3.connect(self.index_path)) as db, db:
+            db.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    document.document_id,
+                    document.name,
+                    document.date_creation,
+                    document.mime_type,
+                    sha256,
+                    size,
+                    target.relative_to(self.root).as_posix(),
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
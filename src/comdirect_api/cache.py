@@ -0,0 +1,167 @@
+"""
+Response cache for rarely changing reference data.
+
+`ComdirectClient(cache=...)` serves the JSON bodies of cacheable endpoints
+(instrument data, the depot list) from a `ResponseCache` until their
+per-endpoint TTL expires. Share one cache between clients to share entries;
+user-specific endpoints are keyed by login, so clients never see each
+other's data.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+# Seconds an entry stays valid, per endpoint. Endpoints missing here are not cached.
+DEFAULT_TTLS: dict[str, float] = {
+    "instrument": 24 * 3600.0,  # static data, order dimensions, derivative data
+    "account_depots": 3600.0,
+}
+
+
+class ResponseCache(ABC):
+    """
+    Cache of raw JSON response bodies with per-endpoint TTLs.
+
+    `hits` and `misses` count lookups for cacheable endpoints. Implement
+    `_load()`, `_store()` and `invalidate()` to plug in another storage.
+    """
+
+    def __init__(self, ttls: Mapping[str, float] | None = None) -> None:
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        """Return True if responses of `endpoint` are cached (TTL > 0)."""
+        return self.ttls.get(endpoint, 0) > 0
+
+    async def get(self, endpoint: str, key: str) -> Any | None:
+        """Return the cached body for `key`, or None if missing or expired."""
+        if not self.is_cacheable(endpoint):
+            return None
+        value = await self._load(endpoint, key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, endpoint: str, key: str, value: Any) -> None:
+        """Store `value` for the endpoint's TTL (no-op for uncached endpoints)."""
+        if self.is_cacheable(endpoint):
+            await self._store(endpoint, key, value, self.ttls[endpoint])
+
+    @abstractmethod
+    async def _load(self, endpoint: str, key: str) -> Any | None:
+        """Return the unexpired value for `key`, or None."""
+
+    @abstractmethod
+    async def _store(self, endpoint: str, key: str, value: Any, ttl: float) -> None:
+        """Store `value` for `ttl` seconds."""
+
+    @abstractmethod
+    async def invalidate(self, endpoint: str | None = None) -> None:
+        """Drop all entries of `endpoint`, or everything if None."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache holding at most `max_entries` responses."""
+
+    def __init__(self, max_entries: int = 1024, ttls: Mapping[str, float] | None = None) -> None:
+        super().__init__(ttls)
+        self.max_entries = max_entries
+        # (endpoint, key) -> (monotonic expiry, value), least recently used first
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _load(self, endpoint: str, key: str) -> Any | None:
+        entry = self._entries.get((endpoint, key))
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[(endpoint, key)]
+            return None
+        self._entries.move_to_end((endpoint, key))
+        return value
+
+    async def _store(self, endpoint: str, key: str, value: Any, ttl: float) -> None:
+        self._entries[(endpoint, key)] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end((endpoint, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, endpoint: str | None = None) -> None:
+        if endpoint is None:
+            self._entries.clear()
+            return
+        for entry_key in [k for k in self._entries if k[0] == endpoint]:
+            del self._entries[entry_key]
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    SQLite-backed cache that survives restarts.
+
+    Keys are stored as SHA-256 digests, but the response bodies (depot list,
+    instrument data) are stored unencrypted; keep the file private.
+    """
+
+    def __init__(self, path: str | Path, ttls: Mapping[str, float] | None = None) -> None:
+        super().__init__(ttls)
+        self.path = Path(path)
+        with closing(sqlite3.connect(self.path)) as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "endpoint TEXT NOT NULL, key TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "value TEXT NOT NULL, PRIMARY KEY (endpoint, key))"
+            )
+
+    async def _load(self, endpoint: str, key: str) -> Any | None:
+        return await asyncio.to_thread(self._load_sync, endpoint, self._digest(key))
+
+    async def _store(self, endpoint: str, key: str, value: Any, ttl: float) -> None:
+        await asyncio.to_thread(
+            self._store_sync, endpoint, self._digest(key), json.dumps(value), time.time() + ttl
+        )
+
+    async def invalidate(self, endpoint: str | None = None) -> None:
+        await asyncio.to_thread(self._invalidate_sync, endpoint)
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _load_sync(self, endpoint: str, key: str) -> Any | None:
+        with closing(sqlite3.connect(self.path)) as db:
+            row = db.execute(
+                "SELECT value FROM responses WHERE endpoint = ? AND key = ? AND expires_at > ?",
+                (endpoint, key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _store_sync(self, endpoint: str, key: str, value: str, expires_at: float) -> None:
+        with closing(sqlite3.connect(self.path)) as db, db:
+            db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (endpoint, key, expires_at, value),
+            )
+
+    def _invalidate_sync(self, endpoint: str | None) -> None:
+        with closing(sqlite3.connect(self.path)) as db, db:
+            if endpoint is None:
+                db.execute("DELETE FROM responses")
+            else:
+                db.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,))
@@ -11,6 +11,9 @@ Dependencies:
     - uuid: For generating unique session/request IDs.
     - time: For token expiration handling.
     - json: For encoding/decoding request and response data.
+    - .retry.RetryPolicy: Retry/backoff policy used by the request pipeline.
+    - .cache.ResponseCache: Optional TTL cache for rarely changing reference data.
+    - .token_store.TokenStore: Optional persistence that lets create() skip the TAN flow.
     - .utils.timestamp: Utility function for generating timestamps.
 Usage:
     Instantiate `ComdirectClient` with your client credentials, then use its
@@ -20,33 +23,82 @@ Usage:
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import os
 import time
 import uuid
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Literal, Protocol, TypeVar, overload
 
 import httpx
+from pydantic import TypeAdapter
 
+from .cache import ResponseCache
 from .models.accounts import AccountBalance, AccountBalances
 from .models.auth import AuthResponse
 from .models.depots import AccountDepots, DepotPosition, DepotPositions
 from .models.instruments import Instruments
-from .models.messages import Documents
+from .models.lazy import LazyModel
+from .models.messages import Document, DocumentDownload, Documents
 from .models.orders import Order, Orders
 from .models.reports import AllBalances
-from .models.transactions import AccountTransactions, DepotTransactions
+from .models.transactions import AccountTransaction, AccountTransactions, DepotTransactions
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .tan_polling import TanPollingPolicy, TanPollProgress, TanProgressHook
+from .token_store import StoredSession, TokenStore
 from .utils import timestamp
 
 logger = logging.getLogger(__name__)
 
 
+class _Page(Protocol):
+    """A paginated response model: `values` plus `paging` ({"index", "matches"})."""
+
+    values: list[Any]
+    paging: dict | None
+
+
+PagedT = TypeVar("PagedT", AccountTransactions, Documents)
+ModelT = TypeVar("ModelT")
+
+
+@functools.cache
+def _adapter(model_type: type[ModelT]) -> TypeAdapter[ModelT]:
+    """Return the (cached) TypeAdapter used to parse responses into `model_type`."""
+    return TypeAdapter(model_type)
+
+
+class AsyncByteWriter(Protocol):
+    """Destination for streamed downloads, e.g. an aiofiles file or an upload stream."""
+
+    async def write(self, data: bytes, /) -> Any: ...
+
+
 class ComdirectClient:
     """Class to interact with the Comdirect API."""
 
     BASE_URL = "https://api.comdirect.de/api"
     OAUTH_URL = "https://api.comdirect.de/oauth/token"
 
+    # Seconds before token_expires_at at which background renewal refreshes
+    RENEWAL_MARGIN = 60.0
+    # Pause before retrying a failed background renewal
+    RENEWAL_RETRY_DELAY = 10.0
+
+    # Connection pool defaults for the shared httpx.AsyncClient
+    DEFAULT_LIMITS = httpx.Limits(
+        max_connections=20,
+        max_keepalive_connections=10,
+        keepalive_expiry=30.0,
+    )
+    DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
     # ==================== INITIALIZATION ====================
 
     def __init__(
@@ -55,12 +107,40 @@ class ComdirectClient:
         client_secret: str,
         zugangsnummer: str,
         pin: str,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | float | None = None,
+        http2: bool = False,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        token_store: TokenStore | None = None,
+        tan_polling: TanPollingPolicy | None = None,
+        on_tan_progress: TanProgressHook | None = None,
+        cache: ResponseCache | None = None,
     ):
         """
         Initialize ComdirectClient with credentials.
 
         Note: This only stores credentials. Use `await ComdirectClient.create()`
         to get a fully authenticated client ready for API calls.
+
+        Args:
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            zugangsnummer: Account login number
+            pin: Account PIN
+            limits: Connection pool limits (defaults to DEFAULT_LIMITS)
+            timeout: Request timeouts (defaults to DEFAULT_TIMEOUT)
+            http2: Negotiate HTTP/2 so concurrent calls are multiplexed over one
+                   connection (requires the ``http2`` extra)
+            retry: Retry policy for transient failures (defaults to RetryPolicy())
+            rate_limiter: Limiter paced per client_id; share one instance across
+                          clients so they share the API quota (default: none)
+            token_store: Persists rotated tokens after each authentication and
+                         refresh, keyed by zugangsnummer (default: none)
+            tan_polling: Schedule for push-TAN polling (defaults to TanPollingPolicy())
+            on_tan_progress: Called with a TanPollProgress after every TAN poll
+            cache: Response cache for reference data such as instruments and the
+                   depot list; share one instance across clients (default: none)
         """
         self.client_id = client_id
         self.client_secret = client_secret
@@ -88,6 +168,27 @@ class ComdirectClient:
         self.challenge_id: str | None = None
         self.challenge_link: str | None = None
 
+        # Shared connection pool, opened lazily and closed via aclose()
+        self._limits = limits or self.DEFAULT_LIMITS
+        self._timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self._http2 = http2
+        self._http: httpx.AsyncClient | None = None
+        self._retry = retry or RetryPolicy()
+        self._rate_limiter = rate_limiter
+        self._token_store = token_store
+        self._tan_polling = tan_polling or TanPollingPolicy()
+        self._on_tan_progress = on_tan_progress
+        self.cache = cache
+        # Static request headers for the current (token, session_id), see _request_headers()
+        self._header_template: tuple[tuple[str, str | None], dict[str, str], bytes] | None = None
+
+        # In-flight GETs by (url, params, token), see _request()
+        self._inflight: dict[tuple[str, str, str | None], asyncio.Future[httpx.Response]] = {}
+
+        # Single-flight token refresh and optional background renewal
+        self._refresh_task: asyncio.Task[dict[str, Any]] | None = None
+        self._renewal_task: asyncio.Task[None] | None = None
+
     @classmethod
     async def create(
         cls,
@@ -95,6 +196,16 @@ class ComdirectClient:
         client_secret: str | None = None,
         zugangsnummer: str | None = None,
         pin: str | None = None,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | float | None = None,
+        http2: bool = False,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        auto_renew_token: bool = False,
+        token_store: TokenStore | None = None,
+        tan_polling: TanPollingPolicy | None = None,
+        on_tan_progress: TanProgressHook | None = None,
+        cache: ResponseCache | None = None,
     ) -> "ComdirectClient":
         """Create and authenticate a ComdirectClient instance.
 
@@ -104,23 +215,44 @@ class ComdirectClient:
         3. TAN challenge (waits for push notification approval)
         4. Banking/brokerage access token retrieval
 
+        With a `token_store`, a previously stored session is resumed via
+        `refresh_access_token()` first; the flow above only runs if that fails.
+
+        The client owns a pooled httpx.AsyncClient that lives until `aclose()`
+        is called, or the client is used as an async context manager.
+
         Args:
             client_id: OAuth client ID (defaults to settings.client_id)
             client_secret: OAuth client secret (defaults to settings.client_secret)
             zugangsnummer: Account login number — must be provided explicitly.
             pin: Account PIN — must be provided explicitly.
+            limits: Connection pool limits (defaults to DEFAULT_LIMITS)
+            timeout: Request timeouts (defaults to DEFAULT_TIMEOUT)
+            http2: Multiplex concurrent calls over one HTTP/2 connection
+                   (requires the ``http2`` extra)
+            retry: Retry policy for 429/5xx/connect errors (defaults to RetryPolicy())
+            rate_limiter: Shared limiter that paces requests per client_id
+            auto_renew_token: Refresh the token in the background shortly before it
+                              expires, so API calls never wait for a refresh
+            token_store: Where sessions are persisted between runs (default: none)
+            tan_polling: Push-TAN polling schedule (defaults to TanPollingPolicy())
+            on_tan_progress: Hook called after every TAN poll, e.g. to show progress
+            cache: Response cache for instruments and the depot list (default: none)
 
         Returns:
             Fully authenticated ComdirectClient ready for API calls.
 
         Example:
-            >>> client = await ComdirectClient.create(zugangsnummer="...", pin="...")
-            >>> balances = await client.get_account_balances()
+            >>> async with await ComdirectClient.create(zugangsnummer="...", pin="...") as client:
+            ...     balances = await client.get_account_balances()
         """
-        from .settings import settings
+        _client_id, _client_secret = client_id, client_secret
+        if not _client_id or not _client_secret:
+            # Only read the environment / .env when the OAuth credentials are not passed
+            from .settings import settings
 
-        _client_id = client_id or settings.client_id.get_secret_value()
-        _client_secret = client_secret or settings.client_secret.get_secret_value()
+            _client_id = _client_id or settings.client_id.get_secret_value()
+            _client_secret = _client_secret or settings.client_secret.get_secret_value()
 
         if not zugangsnummer or not pin:
             raise ValueError(
@@ -134,13 +266,102 @@ class ComdirectClient:
             client_secret=_client_secret,
             zugangsnummer=zugangsnummer,
             pin=pin,
+            limits=limits,
+            timeout=timeout,
+            http2=http2,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            token_store=token_store,
+            tan_polling=tan_polling,
+            on_tan_progress=on_tan_progress,
+            cache=cache,
         )
 
-        # Run complete authentication flow
-        await instance._initialize()
+        # Open the connection pool up front so the whole auth flow shares it
+        instance._http_client()
+
+        # Resume a stored session, else run complete authentication flow
+        try:
+            if not await instance._resume_session():
+                await instance._initialize()
+                await instance._save_session()
+        except BaseException:
+            await instance.aclose()
+            raise
+
+        if auto_renew_token:
+            instance.start_token_renewal()
 
         return instance
 
+    @classmethod
+    async def authenticate_many(
+        cls,
+        credentials: Mapping[str, tuple[str, str]],
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[str, "ComdirectClient"]]:
+        """Authenticate several logins concurrently, yielding each as it is approved.
+
+        Every login's OAuth, session and TAN challenge starts at once and all
+        challenges are polled concurrently, so the total wait is roughly the
+        longest single approval instead of the sum of all approvals.
+
+        If one login fails, the remaining ones are cancelled and the error is
+        raised. Clients that have been yielded belong to the caller, who must
+        `aclose()` them. Logins that were not yet yielded are closed here, so
+        wrap the iterator in `contextlib.aclosing()` when breaking out early.
+
+        Args:
+            credentials: Name -> (zugangsnummer, pin) for each login
+            **kwargs: Passed to `create()` for every login (e.g. rate_limiter,
+                      token_store)
+
+        Yields:
+            (name, client) tuples in the order the TANs are approved.
+
+        Example:
+            >>> credentials = {"DEPOT11": ("...", "..."), "DEPOT21": ("...", "...")}
+            >>> async for name, client in ComdirectClient.authenticate_many(credentials):
+            ...     start_sync(name, client)
+        """
+        tasks = {
+            asyncio.create_task(cls.create(zugangsnummer=zugangsnummer, pin=pin, **kwargs)): name
+            for name, (zugangsnummer, pin) in credentials.items()
+        }
+        yielded: set[asyncio.Task[ComdirectClient]] = set()
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    client = task.result()
+                    yielded.add(task)
+                    yield tasks[task], client
+        finally:
+            for task in tasks:
+                task.cancel()  # no-op for finished tasks
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for task in tasks.keys() - yielded:
+                if not task.cancelled() and task.exception() is None:
+                    await task.result().aclose()
+
+    async def aclose(self) -> None:
+        """Stop background renewal and close the connection pool. Safe to call twice."""
+        await self.stop_token_renewal()
+        inflight = list(self._inflight.values())
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "ComdirectClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     async def _initialize(self) -> None:
         """Execute complete authentication flow.
 
@@ -164,27 +385,300 @@ class ComdirectClient:
 
         logger.info("Authentication complete! Client ready for API calls.")
 
+    async def _resume_session(self) -> bool:
+        """Restore the stored session and refresh it. Returns False if there is none."""
+        if self._token_store is None:
+            return False
+        stored = await self._token_store.load(self.zugangsnummer)
+        if stored is None:
+            return False
+
+        self.refresh_token = stored.refresh_token
+        self.session_id = stored.session_id
+        self.banking_access_token = stored.banking_access_token
+        try:
+            await self.refresh_access_token()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.info("Stored session could not be refreshed (%s); starting TAN flow", e)
+            self.refresh_token = None
+            self.session_id = None
+            self.banking_access_token = None
+            return False
+
+        logger.info("Resumed stored session, no TAN required.")
+        return True
+
+    async def _save_session(self) -> None:
+        """Persist the current tokens, if a token store is configured."""
+        if self._token_store is None:
+            return
+        if not (self.refresh_token and self.session_id and self.banking_access_token):
+            return
+        session = StoredSession(
+            refresh_token=self.refresh_token,
+            session_id=self.session_id,
+            banking_access_token=self.banking_access_token,
+        )
+        try:
+            await self._token_store.save(self.zugangsnummer, session)
+        except OSError as e:
+            # The live session is still valid; only the next restart needs a TAN
+            logger.warning("Could not persist session to token store: %s", e)
+
     # ==================== PRIVATE HELPERS ====================
 
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                limits=self._limits,
+                timeout=self._timeout,
+                http2=self._http2,
+                follow_redirects=False,
+            )
+        return self._http
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request through the shared pool, coalescing identical in-flight GETs.
+
+        Concurrent GETs with the same URL, params and bearer token share one
+        HTTP request and receive the same response (or exception). Everything
+        else is sent as is via `_send()`.
+        """
+        if method != "GET":
+            return await self._send(method, url, **kwargs)
+
+        headers = kwargs.get("headers") or {}
+        key = (
+            url,
+            json.dumps(kwargs.get("params"), sort_keys=True, default=str),
+            headers.get("Authorization"),
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, url, **kwargs))
+            task.add_done_callback(functools.partial(self._request_done, key))
+            self._inflight[key] = task
+        else:
+            logger.debug("Joining in-flight GET %s", url)
+        # Shield so a cancelled caller does not abort the request others wait on
+        return await asyncio.shield(task)
+
+    def _request_done(
+        self, key: tuple[str, str, str | None], task: asyncio.Future[httpx.Response]
+    ) -> None:
+        """Forget a finished shared request (also when it was cancelled before starting)."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, so a failure nobody waits for any more is not logged
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request through the shared pool, retrying transient failures.
+
+        Every API call goes through here. Each attempt first waits on the
+        client's rate limiter (if any). Retryable statuses and connection
+        errors are retried according to the client's RetryPolicy, honouring
+        Retry-After and the policy's total deadline. Once retries are exhausted
+        the last response is returned (callers still call raise_for_status())
+        or the last connection error is raised.
+        """
+        policy = self._retry
+        client = self._http_client()
+        deadline = time.monotonic() + policy.deadline
+        attempts: dict[int | str, int] = {}
+        delay = policy.base_delay
+
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(self.client_id)
+            try:
+                response = await client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+                key: int | str = "connect"
+                budget = policy.connect_retries
+                retry_after = None
+                error: Exception | None = exc
+            else:
+                budget = policy.retries_for(response.status_code, method)
+                if not budget:
+                    return response
+                key = response.status_code
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                error = None
+
+            attempts[key] = attempts.get(key, 0) + 1
+            delay = policy.next_delay(delay)
+            wait = retry_after if retry_after is not None else delay
+            if attempts[key] > budget or time.monotonic() + wait > deadline:
+                if error is not None:
+                    raise error
+                return response
+
+            logger.warning(
+                "%s %s failed (%s), retrying in %.2fs (attempt %d/%d)",
+                method,
+                url,
+                error or response.status_code,
+                wait,
+                attempts[key],
+                budget,
+            )
+            await asyncio.sleep(wait)
+
+    @asynccontextmanager
+    async def _stream(
+        self, method: str, url: str, extra_headers: dict[str, Any] | None = None
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streamed response with banking headers; raises on error statuses.
+
+        Streamed bodies cannot be replayed, so unlike `_send()` there is no
+        retry here; path downloads resume instead.
+        """
+        headers = self._request_headers(self.banking_access_token, extra_headers)
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(self.client_id)
+        async with self._http_client().stream(method, url, headers=headers) as response:
+            response.raise_for_status()
+            yield response
+
     def _request_headers(
         self, token: str, extra: dict[str, Any] | None = None
     ) -> dict[str, Any]:
+        template = self._header_template
+        if template is None or template[0] != (token, self.session_id):
+            template = self._header_template = self._build_header_template(token)
+        _, base_hdr, info_prefix = template
+
+        headers: dict[str, Any] = base_hdr.copy()
+        # Only the request ID changes per call; splice it into the pre-serialized JSON
+        headers["x-http-request-info"] = info_prefix + timestamp().encode() + b'"}}'
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _build_header_template(
+        self, token: str
+    ) -> tuple[tuple[str, str | None], dict[str, str], bytes]:
+        """Pre-build the static headers and x-http-request-info prefix for token/session."""
         base_hdr = {
             "Accept": "application/json",
             "Authorization": f"Bearer {token}",
-            "x-http-request-info": json.dumps(
-                {
-                    "clientRequestId": {
-                        "sessionId": self.session_id,
-                        "requestId": timestamp(),
-                    }
-                }
-            ),
             "Content-Type": "application/json",
         }
-        if extra:
-            base_hdr.update(extra)
-        return base_hdr
+        # Same bytes json.dumps() produces for
+        # {"clientRequestId": {"sessionId": ..., "requestId": ...}}
+        info_prefix = (
+            '{"clientRequestId": {"sessionId": '
+            + json.dumps(self.session_id)
+            + ', "requestId": "'
+        ).encode()
+        return (token, self.session_id), base_hdr, info_prefix
+
+    async def _get_json(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        user_scoped: bool = True,
+    ) -> str:
+        """
+        GET `url` with the banking token and return the raw JSON body.
+
+        Bodies of cacheable endpoints are served from / stored in `self.cache`.
+        User-specific endpoints are keyed by login, so a cache shared between
+        clients never mixes their data.
+        """
+        key = "\n".join(
+            (self.zugangsnummer if user_scoped else "", url, json.dumps(params, sort_keys=True))
+        )
+        if self.cache is not None:
+            cached = await self.cache.get(endpoint, key)
+            if cached is not None:
+                return cached
+
+        headers = self._request_headers(self.banking_access_token)
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        body = response.text
+        if self.cache is not None:
+            await self.cache.set(endpoint, key, body)
+        return body
+
+    def _parse(self, model_type: type[ModelT], body: bytes | str) -> ModelT:
+        """Validate a raw JSON body (response bytes or cached text) in one pass."""
+        return _adapter(model_type).validate_json(body)
+
+    def _parse_lazy(self, model_type: type[ModelT], body: bytes | str) -> LazyModel[ModelT]:
+        """
+        Decode a JSON response body into a `LazyModel` of `model_type`.
+
+        Fields are validated on first access, see `LazyModel`.
+        """
+        return LazyModel(model_type, json.loads(body))
+
+    async def invalidate_cache(self, endpoint: str | None = None) -> None:
+        """Drop cached responses of `endpoint` (e.g. "instrument"), or all if None."""
+        if self.cache is not None:
+            await self.cache.invalidate(endpoint)
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[_Page]],
+        paging_first: int,
+        prefetch: int,
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the values of consecutive pages, fetching ahead in the background.
+
+        A producer task requests the next page as soon as the caller starts on
+        the current one, holding at most `prefetch` unconsumed pages. Paging
+        stops once `paging.matches` values were fetched or a page is empty;
+        without `matches` (e.g. some Documents responses) it also stops at a
+        page shorter than the first one.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+
+        queue: asyncio.Queue[list[Any] | Exception | None] = asyncio.Queue()
+        slots = asyncio.Semaphore(prefetch)
+
+        async def produce() -> None:
+            offset = paging_first
+            page_size = None
+            try:
+                while True:
+                    await slots.acquire()
+                    page = await fetch_page(offset)
+                    queue.put_nowait(page.values)
+                    offset += len(page.values)
+                    page_size = page_size or len(page.values)
+                    matches = (page.paging or {}).get("matches")
+                    if not page.values:
+                        break
+                    if matches is None:
+                        if len(page.values) < page_size:
+                            break  # no total: a short page is the last one
+                    elif offset >= matches:
+                        break
+                queue.put_nowait(None)
+            except Exception as e:
+                queue.put_nowait(e)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (values := await queue.get()) is not None:
+                if isinstance(values, Exception):
+                    raise values
+                slots.release()  # let the producer fetch while this page is consumed
+                for value in values:
+                    yield value
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
 
     # ==================== AUTHENTICATION & SESSION ====================
 
@@ -210,31 +704,30 @@ class ComdirectClient:
             "grant_type": "password",
             "scope": scope,
         }
-        async with httpx.AsyncClient(follow_redirects=False) as client:
-            response = await client.post(self.OAUTH_URL, headers=headers, data=data)
-
-            # Log error response before raising exception
-            if response.status_code != httpx.codes.OK:
-                logger.error(
-                    "Authentication failed. Status code: %s, response: %s",
-                    response.status_code,
-                    response.text,
-                )
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse response using AuthResponse model for validation
-            auth_response = AuthResponse(**data)
-
-            # Save token info
-            self.primary_access_token = auth_response.access_token
-            self.refresh_token = auth_response.refresh_token
-            self.token_expires_at = auth_response.expires_at.timestamp()
-            self.scope = auth_response.scope
-            self.kdnr = auth_response.kdnr  # Kundennummer
-            self.bpid = auth_response.bpid  # Interne Identifikationsnummer
-            self.kontaktid = auth_response.kontakt_id  # Interne Identifikationsnummer
-            return data
+        response = await self._request("POST", self.OAUTH_URL, headers=headers, data=data)
+
+        # Log error response before raising exception
+        if response.status_code != httpx.codes.OK:
+            logger.error(
+                "Authentication failed. Status code: %s, response: %s",
+                response.status_code,
+                response.text,
+            )
+        response.raise_for_status()
+        data = response.json()
+
+        # Parse response using AuthResponse model for validation
+        auth_response = AuthResponse(**data)
+
+        # Save token info
+        self.primary_access_token = auth_response.access_token
+        self.refresh_token = auth_response.refresh_token
+        self.token_expires_at = auth_response.expires_at.timestamp()
+        self.scope = auth_response.scope
+        self.kdnr = auth_response.kdnr  # Kundennummer
+        self.bpid = auth_response.bpid  # Interne Identifikationsnummer
+        self.kontaktid = auth_response.kontakt_id  # Interne Identifikationsnummer
+        return data
 
     async def _get_session_status(self) -> dict[str, Any]:
         """
@@ -252,21 +745,20 @@ class ComdirectClient:
 
         headers = self._request_headers(self.primary_access_token)
 
-        async with httpx.AsyncClient(follow_redirects=False) as client:
-            response = await client.get(url, headers=headers)
-            # Log error response before raising exception
-            if response.status_code != httpx.codes.OK:
-                logger.error(
-                    "Session status error: %s, response: %s",
-                    response.status_code,
-                    response.text,
-                )
-            response.raise_for_status()
-            data = response.json()
-            self.session_id = data[0].get("identifier")
-            self.session_tan_active = data[0].get("sessionTanActive", False)
-            self.activated_2fa = data[0].get("activated2FA", False)
-            return data
+        response = await self._request("GET", url, headers=headers)
+        # Log error response before raising exception
+        if response.status_code != httpx.codes.OK:
+            logger.error(
+                "Session status error: %s, response: %s",
+                response.status_code,
+                response.text,
+            )
+        response.raise_for_status()
+        data = response.json()
+        self.session_id = data[0].get("identifier")
+        self.session_tan_active = data[0].get("sessionTanActive", False)
+        self.activated_2fa = data[0].get("activated2FA", False)
+        return data
 
     async def _create_validate_session_tan(self) -> dict[str, Any]:
         """
@@ -346,19 +838,18 @@ class ComdirectClient:
             "sessionTanActive": True,
             "activated2FA": True,
         }
-        async with httpx.AsyncClient(follow_redirects=False) as client:
-            response = await client.patch(url, headers=headers, json=payload)
-            # Log error response before raising exception
-            if response.status_code != httpx.codes.OK:
-                logger.error(
-                    "Error activating session TAN: %s, response: %s",
-                    response.status_code,
-                    response.text,
-                )
-            response.raise_for_status()
-            data = response.json()
-            logger.debug("Session TAN activation response: %s", data)
-            return data
+        response = await self._request("PATCH", url, headers=headers, json=payload)
+        # Log error response before raising exception
+        if response.status_code != httpx.codes.OK:
+            logger.error(
+                "Error activating session TAN: %s, response: %s",
+                response.status_code,
+                response.text,
+            )
+        response.raise_for_status()
+        data = response.json()
+        logger.debug("Session TAN activation response: %s", data)
+        return data
 
     async def _initiate_tan_challenge(self) -> dict[str, Any]:
         """
@@ -383,8 +874,7 @@ class ComdirectClient:
             "sessionTanActive": True,
             "activated2FA": True,
         }
-        async with httpx.AsyncClient(follow_redirects=False) as client:
-            response = await client.post(url, headers=headers, json=payload)
+        response = await self._request("POST", url, headers=headers, json=payload)
 
         # Log error response before raising exception
         if response.status_code != httpx.codes.CREATED:
@@ -429,9 +919,15 @@ class ComdirectClient:
         return data
 
     async def _wait_for_tan_confirmation(
-        self, auth_url: str, max_attempts: int = 30, delay: int = 2
+        self, auth_url: str, policy: TanPollingPolicy | None = None
     ) -> dict[str, Any]:
-        """Wait for TAN confirmation by polling the authentication URL."""
+        """
+        Wait for TAN confirmation by polling the authentication URL.
+
+        Polls on the schedule of `policy` (defaults to the client's tan_polling
+        policy) and reports every poll to the `on_tan_progress` hook.
+        """
+        policy = policy or self._tan_polling
         logger.info("Waiting for TAN confirmation...")
         logger.debug("TAN confirmation URL: %s", auth_url)
 
@@ -441,63 +937,87 @@ class ComdirectClient:
             raise ValueError("No access token available. Please authenticate first.")
 
         headers = self._request_headers(self.primary_access_token)
-
-        for attempt in range(max_attempts):
+        # All polls reuse a single pooled keep-alive connection
+
+        started = time.monotonic()
+        delays = policy.delays()
+        attempt = 0
+        while True:
+            attempt += 1
+            status: str | None = None
+            error: httpx.HTTPError | None = None
+            expired = False
             try:
                 # Poll the authentication status using the provided URL
-                async with httpx.AsyncClient(follow_redirects=False) as client:
-                    response = await client.get(full_url, headers=headers)
-
-                    if response.status_code == httpx.codes.OK:
-                        data = response.json()
-                        status = data.get("status")
-
-                        logger.debug(
-                            "TAN status check (attempt %d/%d): %s",
-                            attempt + 1,
-                            max_attempts,
-                            status,
-                        )
-
-                        match status:
-                            case "AUTHENTICATED":
-                                logger.info("TAN confirmed successfully!")
-                                return data
-                            case "PENDING" | "ACTIVE":
-                                logger.debug(
-                                    "TAN challenge still pending (status: %s), retrying...",
-                                    status,
-                                )
-                                await asyncio.sleep(delay)
-                                continue
-                            case _:
-                                # Unexpected status (e.g., FAILED, REJECTED) - fail immediately
-                                raise ValueError(
-                                    f"Unexpected TAN status: {status}. "
-                                    f"Expected AUTHENTICATED, PENDING, or ACTIVE."
-                                )
+                response = await self._request("GET", full_url, headers=headers)
+
+                if response.status_code == httpx.codes.OK:
+                    data = response.json()
+                    status = data.get("status")
+                    logger.debug("TAN status check (attempt %d): %s", attempt, status)
+                else:
+                    logger.warning(
+                        "Unexpected status code: %s, response: %s",
+                        response.status_code,
+                        response.text,
+                    )
+                    if response.status_code == httpx.codes.NOT_FOUND:
+                        logger.error("Authentication challenge not found. It may have expired.")
+                        expired = True
                     else:
-                        logger.warning(
-                            "Unexpected status code: %s, response: %s",
-                            response.status_code,
-                            response.text,
-                        )
-                        if response.status_code == httpx.codes.NOT_FOUND:
-                            logger.error(
-                                "Authentication challenge not found. It may have expired."
-                            )
-                            break
                         response.raise_for_status()
 
             except httpx.HTTPError as e:
-                logger.warning("HTTP error checking TAN status (attempt %d): %s", attempt + 1, e)
-                if attempt == max_attempts - 1:
-                    raise
-                await asyncio.sleep(delay)
+                logger.warning("HTTP error checking TAN status (attempt %d): %s", attempt, e)
+                error = e
+
+            # Decide on the next poll before reporting progress, so hooks see it
+            elapsed = time.monotonic() - started
+            next_delay: float | None = next(delays)
+            out_of_attempts = policy.max_attempts is not None and attempt >= policy.max_attempts
+            past_deadline = elapsed + next_delay > policy.deadline
+            if status == "AUTHENTICATED" or expired or out_of_attempts or past_deadline:
+                next_delay = None
+
+            if self._on_tan_progress is not None:
+                self._on_tan_progress(
+                    TanPollProgress(
+                        attempt=attempt,
+                        status=status,
+                        elapsed=elapsed,
+                        next_delay=next_delay,
+                        deadline=policy.deadline,
+                    )
+                )
+
+            if expired:
+                raise ValueError("TAN challenge not found (404); it has probably expired.")
+
+            match status:
+                case "AUTHENTICATED":
+                    logger.info("TAN confirmed successfully!")
+                    return data
+                case "PENDING" | "ACTIVE" | None:
+                    if next_delay is None:
+                        if error is not None:
+                            raise error
+                        break
+                    logger.debug(
+                        "TAN challenge still pending (status: %s), next check in %.1fs",
+                        status,
+                        next_delay,
+                    )
+                    await asyncio.sleep(next_delay)
+                case _:
+                    # Unexpected status (e.g., FAILED, REJECTED) - fail immediately
+                    raise ValueError(
+                        f"Unexpected TAN status: {status}. "
+                        f"Expected AUTHENTICATED, PENDING, or ACTIVE."
+                    )
 
         raise TimeoutError(
-            f"TAN confirmation timed out after {max_attempts} attempts "
-            f"({max_attempts * delay} seconds)"
+            f"TAN confirmation timed out after {attempt} attempts "
+            f"({time.monotonic() - started:.0f} seconds)"
         )
 
     # ==================== BANKING/BROKERAGE ACCESS ====================
@@ -522,35 +1042,56 @@ class ComdirectClient:
             # Must be the primary OAuth token from initial authentication
             "token": self.primary_access_token,
         }
-        async with httpx.AsyncClient(follow_redirects=False) as client:
-            response = await client.post(self.OAUTH_URL, headers=headers, data=data)
-
-            # Log error response before raising exception
-            if response.status_code != httpx.codes.OK:
-                logger.error(
-                    "Error cd_secondary access flow: %s, response: %s",
-                    response.status_code,
-                    response.text,
-                )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._request("POST", self.OAUTH_URL, headers=headers, data=data)
 
-            # Parse response using AuthResponse model for validation
-            auth_response = AuthResponse(**data)
+        # Log error response before raising exception
+        if response.status_code != httpx.codes.OK:
+            logger.error(
+                "Error cd_secondary access flow: %s, response: %s",
+                response.status_code,
+                response.text,
+            )
+        response.raise_for_status()
+        data = response.json()
 
-            # Save banking token info
-            self.banking_access_token = auth_response.access_token
-            self.refresh_token = auth_response.refresh_token
-            self.scope = auth_response.scope
-            self.kdnr = auth_response.kdnr  # Kundennummer
-            self.bpid = auth_response.bpid  # Interne Identifikationsnummer
-            self.kontaktid = auth_response.kontakt_id  # Interne Identifikationsnummer
-            return data
+        # Parse response using AuthResponse model for validation
+        auth_response = AuthResponse(**data)
+
+        # Save banking token info
+        self.banking_access_token = auth_response.access_token
+        self.refresh_token = auth_response.refresh_token
+        self.token_expires_at = auth_response.expires_at.timestamp()
+        self.scope = auth_response.scope
+        self.kdnr = auth_response.kdnr  # Kundennummer
+        self.bpid = auth_response.bpid  # Interne Identifikationsnummer
+        self.kontaktid = auth_response.kontakt_id  # Interne Identifikationsnummer
+        return data
 
     # ==================== TOKEN MANAGEMENT ====================
 
     async def refresh_access_token(self) -> dict[str, Any]:
-        """Refresh the access token using the refresh token."""
+        """
+        Refresh the access token using the refresh token.
+
+        Single-flight: concurrent callers share one in-flight refresh request
+        instead of racing each other with the same (single-use) refresh token.
+        """
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._refresh_access_token_once())
+        # Shield so a cancelled caller does not abort the refresh the others wait on
+        return await asyncio.shield(self._refresh_task)
+
+    async def _refresh_access_token_once(self) -> dict[str, Any]:
+        """Perform one refresh request; see `refresh_access_token()`."""
+        try:
+            data = await self._refresh_access_token_request()
+            # The refresh token is single-use, so persist the rotated one right away
+            await self._save_session()
+            return data
+        finally:
+            self._refresh_task = None
+
+    async def _refresh_access_token_request(self) -> dict[str, Any]:
         if not self.refresh_token:
             raise ValueError("No refresh token available. Please authenticate first.")
 
@@ -561,23 +1102,25 @@ class ComdirectClient:
             "refresh_token": self.refresh_token,
         }
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(self.OAUTH_URL, headers=headers, data=payload)
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse response using AuthResponse model for validation
-            auth_response = AuthResponse(**data)
-
-            # Update tokens
-            self.primary_access_token = auth_response.access_token
-            self.refresh_token = auth_response.refresh_token
-            self.token_expires_at = auth_response.expires_at.timestamp()
-            self.scope = auth_response.scope
-            self.kdnr = auth_response.kdnr  # Kundennummer
-            self.bpid = auth_response.bpid  # Interne Identifikationsnummer
-            self.kontaktid = auth_response.kontakt_id  # Interne Identifikationsnummer
-            return data
+        response = await self._request("POST", self.OAUTH_URL, headers=headers, data=payload)
+        response.raise_for_status()
+        data = response.json()
+
+        # Parse response using AuthResponse model for validation
+        auth_response = AuthResponse(**data)
+
+        # Update tokens. After cd_secondary the refresh token carries the banking
+        # scope, so the refreshed token replaces the banking token as well.
+        self.primary_access_token = auth_response.access_token
+        if self.banking_access_token:
+            self.banking_access_token = auth_response.access_token
+        self.refresh_token = auth_response.refresh_token
+        self.token_expires_at = auth_response.expires_at.timestamp()
+        self.scope = auth_response.scope
+        self.kdnr = auth_response.kdnr  # Kundennummer
+        self.bpid = auth_response.bpid  # Interne Identifikationsnummer
+        self.kontaktid = auth_response.kontakt_id  # Interne Identifikationsnummer
+        return data
 
     async def revoke_access_token(self) -> None:
         """
@@ -599,21 +1142,140 @@ class ComdirectClient:
             "Accept": "application/json",
         }
         revoke_url = self.OAUTH_URL.replace("/token", "/revoke")
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(revoke_url, headers=headers)
-            response.raise_for_status()
+        response = await self._request("DELETE", revoke_url, headers=headers)
+        response.raise_for_status()
 
         # Clear local token state
         self.primary_access_token = ""
         self.banking_access_token = ""
         self.refresh_token = ""
         self.token_expires_at = 0.0
+        if self._token_store is not None:
+            await self._token_store.delete(self.zugangsnummer)
         logger.info("Access token revoked successfully.")
 
     def is_token_expired(self) -> bool:
         """Check if the access token is expired."""
         return time.time() >= self.token_expires_at
 
+    async def _ensure_fresh_token(self) -> None:
+        """Refresh the token if it has expired (joins any refresh already in flight)."""
+        if self.is_token_expired():
+            await self.refresh_access_token()
+
+    def start_token_renewal(self, margin: float | None = None) -> None:
+        """
+        Start a background task that refreshes the token before it expires.
+
+        The task refreshes `margin` seconds (default RENEWAL_MARGIN) before
+        `token_expires_at`, so API calls never pay the refresh round trip.
+        Network errors are retried after RENEWAL_RETRY_DELAY; a rejected refresh
+        (HTTP error status, e.g. an expired refresh token) ends the task.
+        Stopped by `stop_token_renewal()` or `aclose()`.
+        """
+        if self._renewal_task is not None and not self._renewal_task.done():
+            return
+        margin = self.RENEWAL_MARGIN if margin is None else margin
+        self._renewal_task = asyncio.create_task(self._renew_token_loop(margin))
+
+    async def stop_token_renewal(self) -> None:
+        """Cancel the background renewal task, if running."""
+        task, self._renewal_task = self._renewal_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _renew_token_loop(self, margin: float) -> None:
+        while True:
+            delay = self.token_expires_at - margin - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self.refresh_access_token()
+                logger.debug("Access token renewed in background")
+            except (httpx.HTTPStatusError, ValueError) as e:
+                # Retrying cannot help; the next API call refreshes or fails itself
+                logger.error("Background token renewal stopped: %s", e)
+                return
+            except httpx.HTTPError as e:
+                logger.warning("Background token renewal failed: %s", e)
+                await asyncio.sleep(self.RENEWAL_RETRY_DELAY)
+
+    # ==================== PAGINATION ====================
+
+    async def fetch_all(
+        self,
+        get_page: Callable[..., Awaitable[PagedT]],
+        *args: Any,
+        concurrency: int = 4,
+        **kwargs: Any,
+    ) -> PagedT:
+        """
+        Fetch every page of a paginated list concurrently and merge them in order.
+
+        The first page reveals the page size and `paging.matches`; the remaining
+        offsets are then requested in parallel, at most `concurrency` at a time,
+        and reassembled in offset order into one result. Responses without
+        `matches` are paged sequentially until a page is short or empty.
+
+        Args:
+            get_page: `get_account_transactions` or `get_documents` of this client
+            *args: Positional arguments for `get_page` (e.g. account_id)
+            concurrency: Maximum number of page requests in flight (default: 4)
+            **kwargs: Keyword arguments for `get_page`; `paging_first` sets the start
+
+        Returns:
+            One AccountTransactions/Documents with all values and
+            paging {"index": start, "matches": total}
+
+        Example:
+            >>> txs = await client.fetch_all(client.get_account_transactions, account_id)
+            >>> docs = await client.fetch_all(client.get_documents, paging_count=500)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        start = kwargs.pop("paging_first", 0)
+        first = await get_page(*args, paging_first=start, **kwargs)
+        matches = (first.paging or {}).get("matches")
+        page_size = len(first.values)
+        if matches is None:
+
+            async def page_at(offset: int) -> PagedT:
+                if offset == start:
+                    return first  # already fetched
+                return await get_page(*args, paging_first=offset, **kwargs)
+
+            values = [value async for value in self._iter_pages(page_at, start, 1)]
+            return first.model_copy(
+                update={"values": values, "paging": {"index": start, "matches": len(values)}}
+            )
+        if not page_size or start + page_size >= matches:
+            return first
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(offset: int) -> PagedT:
+            async with semaphore:
+                return await get_page(*args, paging_first=offset, **kwargs)
+
+        offsets = range(start + page_size, matches, page_size)
+        logger.debug(
+            "Fetching %d more pages of %d (concurrency %d)", len(offsets), page_size, concurrency
+        )
+        pages = await asyncio.gather(*(fetch(offset) for offset in offsets))
+
+        values = list(first.values)
+        for page in pages:
+            values.extend(page.values)
+        return first.model_copy(
+            update={"values": values, "paging": {"index": start, "matches": matches}}
+        )
+
     # ==================== BANKING API ====================
 
     async def get_account_balances(self) -> AccountBalances:
@@ -624,21 +1286,15 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/banking/clients/user/v2/accounts/balances"
+        url = f"{self.BASE_URL}/banking/clients/user/v2/accounts/balances"
 
-            headers = self._request_headers(self.banking_access_token)
+        headers = self._request_headers(self.banking_access_token)
 
-            response = await client.get(
-                url=url,
-                headers=headers,
-            )
-            response.raise_for_status()
-            account_balances = response.json()
-            return AccountBalances(**account_balances)
+        response = await self._request("GET", url, headers=headers)
+        response.raise_for_status()
+        return self._parse(AccountBalances, response.content)
 
     async def get_account_balance(self, account_id: str) -> AccountBalance:
         """
@@ -655,16 +1311,14 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/banking/v2/accounts/{account_id}/balances"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/banking/v2/accounts/{account_id}/balances"
+        headers = self._request_headers(self.banking_access_token)
 
-            response = await client.get(url=url, headers=headers)
-            response.raise_for_status()
-            return AccountBalance(**response.json())
+        response = await self._request("GET", url, headers=headers)
+        response.raise_for_status()
+        return self._parse(AccountBalance, response.content)
 
     async def get_account_depots(self) -> AccountDepots:
         """Get the account depots."""
@@ -674,20 +1328,11 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
-
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/brokerage/clients/user/v3/depots"
-            headers = self._request_headers(self.banking_access_token)
+        await self._ensure_fresh_token()
 
-            response = await client.get(
-                url=url,
-                headers=headers,
-            )
-            response.raise_for_status()
-            depots = response.json()
-            return AccountDepots(**depots)
+        url = f"{self.BASE_URL}/brokerage/clients/user/v3/depots"
+        body = await self._get_json("account_depots", url)
+        return self._parse(AccountDepots, body)
 
     async def get_account_transactions(
         self,
@@ -715,35 +1360,98 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
+
+        url = f"{self.BASE_URL}/banking/v1/accounts/{account_id}/transactions"
+        headers = self._request_headers(self.banking_access_token)
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/banking/v1/accounts/{account_id}/transactions"
-            headers = self._request_headers(self.banking_access_token)
+        params = {
+            "transactionState": transaction_state,
+            "transactionDirection": transaction_direction,
+            "paging-first": paging_first,
+        }
+        if with_attr:
+            params["with-attr"] = with_attr
 
-            params = {
-                "transactionState": transaction_state,
-                "transactionDirection": transaction_direction,
-                "paging-first": paging_first,
-            }
-            if with_attr:
-                params["with-attr"] = with_attr
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        return self._parse(AccountTransactions, response.content)
 
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            transactions = response.json()
-            return AccountTransactions(**transactions)
+    async def iter_account_transactions(
+        self,
+        account_id: str,
+        transaction_state: str = "BOTH",
+        transaction_direction: str = "CREDIT_AND_DEBIT",
+        paging_first: int = 0,
+        with_attr: str | None = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[AccountTransaction]:
+        """
+        Iterate over all transactions of an account, page by page.
+
+        The next page is fetched while the caller processes the current one;
+        at most `prefetch` pages are held ahead, so memory stays flat however
+        long the history is.
+
+        Args:
+            account_id: Account identifier (UUID)
+            transaction_state: BOOKED, NOTBOOKED, or BOTH (default)
+            transaction_direction: CREDIT, DEBIT, or CREDIT_AND_DEBIT (default)
+            paging_first: Index of the first transaction (default: 0)
+            with_attr: Additional attributes to load (e.g., "account")
+            prefetch: Pages fetched ahead of the one being consumed (default: 1)
+
+        Yields:
+            AccountTransaction objects in API order
+
+        Example:
+            >>> async for tx in client.iter_account_transactions(account_id):
+            ...     print(tx.booking_date, tx.amount.value)
+        """
+
+        async def fetch_page(offset: int) -> AccountTransactions:
+            return await self.get_account_transactions(
+                account_id,
+                transaction_state=transaction_state,
+                transaction_direction=transaction_direction,
+                paging_first=offset,
+                with_attr=with_attr,
+            )
+
+        async for transaction in self._iter_pages(fetch_page, paging_first, prefetch):
+            yield transaction
 
     # ==================== BROKERAGE API ====================
 
+    @overload
     async def get_depot_positions(
         self,
         depot_id: str,
         instrument_id: str | None = None,
         with_attr: str | None = None,
         without_attr: list[str] | None = None,
-    ) -> DepotPositions:
+        lazy: Literal[False] = False,
+    ) -> DepotPositions: ...
+
+    @overload
+    async def get_depot_positions(
+        self,
+        depot_id: str,
+        instrument_id: str | None = None,
+        with_attr: str | None = None,
+        without_attr: list[str] | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModel[DepotPositions]: ...
+
+    async def get_depot_positions(
+        self,
+        depot_id: str,
+        instrument_id: str | None = None,
+        with_attr: str | None = None,
+        without_attr: list[str] | None = None,
+        lazy: bool = False,
+    ) -> DepotPositions | LazyModel[DepotPositions]:
         """
         Get securities positions for a specific depot.
 
@@ -752,6 +1460,7 @@ class ComdirectClient:
             instrument_id: Optional filter by instrument (WKN, ISIN, or UUID)
             with_attr: Additional attributes to enable (e.g., "instrument")
             without_attr: Attributes to disable (e.g., ["depot", "positions"])
+            lazy: Return a LazyModel that builds fields only when they are read
 
         Returns:
             DepotPositions object with list of positions
@@ -761,25 +1470,24 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/brokerage/v3/depots/{depot_id}/positions"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/brokerage/v3/depots/{depot_id}/positions"
+        headers = self._request_headers(self.banking_access_token)
 
-            params = {}
-            if instrument_id:
-                params["instrumentId"] = instrument_id
-            if with_attr:
-                params["with-attr"] = with_attr
-            if without_attr:
-                params["without-attr"] = without_attr
+        params = {}
+        if instrument_id:
+            params["instrumentId"] = instrument_id
+        if with_attr:
+            params["with-attr"] = with_attr
+        if without_attr:
+            params["without-attr"] = without_attr
 
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            positions = response.json()
-            return DepotPositions(**positions)
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        if lazy:
+            return self._parse_lazy(DepotPositions, response.content)
+        return self._parse(DepotPositions, response.content)
 
     async def get_depot_position(
         self, depot_id: str, position_id: str, with_attr: str | None = None
@@ -800,25 +1508,23 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = (
-                f"{self.BASE_URL}/brokerage/v3/depots/{depot_id}"
-                f"/positions/{position_id}"
-            )
-            headers = self._request_headers(self.banking_access_token)
+        url = (
+            f"{self.BASE_URL}/brokerage/v3/depots/{depot_id}"
+            f"/positions/{position_id}"
+        )
+        headers = self._request_headers(self.banking_access_token)
 
-            params = {}
-            if with_attr:
-                params["with-attr"] = with_attr
+        params = {}
+        if with_attr:
+            params["with-attr"] = with_attr
 
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            position = response.json()
-            return DepotPosition(**position)
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        return self._parse(DepotPosition, response.content)
 
+    @overload
     async def get_depot_transactions(
         self,
         depot_id: str,
@@ -826,7 +1532,30 @@ class ComdirectClient:
         wkn: str | None = None,
         instrument_id: str | None = None,
         min_booking_date: str = "-180d",
-    ) -> DepotTransactions:
+        lazy: Literal[False] = False,
+    ) -> DepotTransactions: ...
+
+    @overload
+    async def get_depot_transactions(
+        self,
+        depot_id: str,
+        isin: str | None = None,
+        wkn: str | None = None,
+        instrument_id: str | None = None,
+        min_booking_date: str = "-180d",
+        *,
+        lazy: Literal[True],
+    ) -> LazyModel[DepotTransactions]: ...
+
+    async def get_depot_transactions(
+        self,
+        depot_id: str,
+        isin: str | None = None,
+        wkn: str | None = None,
+        instrument_id: str | None = None,
+        min_booking_date: str = "-180d",
+        lazy: bool = False,
+    ) -> DepotTransactions | LazyModel[DepotTransactions]:
         """
         Get transactions for a specific depot.
 
@@ -836,6 +1565,7 @@ class ComdirectClient:
             wkn: Optional filter by WKN
             instrument_id: Optional filter by instrument ID (UUID)
             min_booking_date: Earliest booking date (YYYY-MM-DD or offset like "-180d")
+            lazy: Return a LazyModel that builds fields only when they are read
 
         Returns:
             DepotTransactions object with list of transactions
@@ -845,25 +1575,24 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/brokerage/v3/depots/{depot_id}/transactions"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/brokerage/v3/depots/{depot_id}/transactions"
+        headers = self._request_headers(self.banking_access_token)
 
-            params = {"min-bookingDate": min_booking_date}
-            if isin:
-                params["isin"] = isin
-            if wkn:
-                params["wkn"] = wkn
-            if instrument_id:
-                params["instrumentId"] = instrument_id
+        params = {"min-bookingDate": min_booking_date}
+        if isin:
+            params["isin"] = isin
+        if wkn:
+            params["wkn"] = wkn
+        if instrument_id:
+            params["instrumentId"] = instrument_id
 
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            transactions = response.json()
-            return DepotTransactions(**transactions)
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        if lazy:
+            return self._parse_lazy(DepotTransactions, response.content)
+        return self._parse(DepotTransactions, response.content)
 
     async def get_instrument(
         self,
@@ -888,23 +1617,73 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/brokerage/v1/instruments/{instrument_id}"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/brokerage/v1/instruments/{instrument_id}"
 
-            params = {}
-            if with_attr:
-                params["with-attr"] = with_attr
-            if without_attr:
-                params["without-attr"] = without_attr
+        params = {}
+        if with_attr:
+            params["with-attr"] = with_attr
+        if without_attr:
+            params["without-attr"] = without_attr
 
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            instruments = response.json()
-            return Instruments(**instruments)
+        # Instrument data is the same for every login
+        body = await self._get_json("instrument", url, params, user_scoped=False)
+        return self._parse(Instruments, body)
+
+    async def get_instruments(
+        self,
+        instrument_ids: Iterable[str],
+        with_attr: list[str] | None = None,
+        without_attr: list[str] | None = None,
+        concurrency: int = 8,
+    ) -> dict[str, Instruments | Exception]:
+        """
+        Resolve many instruments concurrently.
+
+        Duplicate IDs are requested once, cached instruments (see `cache`) are
+        served without a request, and the rest fan out with at most
+        `concurrency` lookups in flight. A failing ID does not fail the batch:
+        its entry holds the exception instead.
+
+        Args:
+            instrument_ids: WKNs, ISINs or symbols
+            with_attr: Additional attributes to enable (see `get_instrument()`)
+            without_attr: Attributes to disable (see `get_instrument()`)
+            concurrency: Maximum number of lookups in flight (default: 8)
+
+        Returns:
+            Dict keyed by requested ID, in first-seen order, with an Instruments
+            object or the exception raised for that ID (httpx.HTTPError or
+            ValueError, e.g. for an unknown ID)
+
+        Example:
+            >>> results = await client.get_instruments(["A0B1C2", "DE0005140008"])
+            >>> for wkn, result in results.items():
+            ...     if isinstance(result, Exception):
+            ...         print(f"{wkn}: {result}")
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        # Fail the whole batch up front rather than once per ID
+        if not self.banking_access_token:
+            raise ValueError(
+                "No banking access token available. Please obtain banking access first."
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def resolve(instrument_id: str) -> Instruments | Exception:
+            async with semaphore:
+                try:
+                    return await self.get_instrument(instrument_id, with_attr, without_attr)
+                except (httpx.HTTPError, ValueError) as e:
+                    logger.warning("Instrument lookup failed for %s: %s", instrument_id, e)
+                    return e
+
+        unique_ids = list(dict.fromkeys(instrument_ids))
+        results = await asyncio.gather(*(resolve(instrument_id) for instrument_id in unique_ids))
+        return dict(zip(unique_ids, results))
 
     # ==================== MESSAGES ====================
 
@@ -934,26 +1713,49 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/messages/clients/user/v2/documents"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/messages/clients/user/v2/documents"
+        headers = self._request_headers(self.banking_access_token)
 
-            params = {
-                "paging-first": paging_first,
-                "paging-count": min(paging_count, 1000),  # API max is 1000
-            }
+        params = {
+            "paging-first": paging_first,
+            "paging-count": min(paging_count, 1000),  # API max is 1000
+        }
 
-            logger.debug(f"Fetching documents list with params: {params}")
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            documents = response.json()
-            logger.info(
-                f"Retrieved {len(documents.get('values', []))} documents"
-            )
-            return Documents(**documents)
+        logger.debug(f"Fetching documents list with params: {params}")
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        documents = self._parse(Documents, response.content)
+        logger.info(f"Retrieved {len(documents.values)} documents")
+        return documents
+
+    async def iter_documents(
+        self,
+        paging_first: int = 0,
+        page_size: int = 100,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Document]:
+        """
+        Iterate over all documents of the customer, page by page.
+
+        The next page is fetched while the caller processes the current one,
+        holding at most `prefetch` pages ahead.
+
+        Args:
+            paging_first: Index of the first document (default: 0)
+            page_size: Documents per request (default: 100, max: 1000)
+            prefetch: Pages fetched ahead of the one being consumed (default: 1)
+
+        Yields:
+            Document objects in API order
+        """
+
+        async def fetch_page(offset: int) -> Documents:
+            return await self.get_documents(paging_first=offset, paging_count=page_size)
+
+        async for document in self._iter_pages(fetch_page, paging_first, prefetch):
+            yield document
 
     async def get_document(
         self,
@@ -978,21 +1780,19 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/messages/v2/documents/{document_id}"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/messages/v2/documents/{document_id}"
+        headers = self._request_headers(self.banking_access_token)
 
-            logger.debug(f"Downloading document: {document_id}")
-            response = await client.get(url=url, headers=headers)
-            response.raise_for_status()
-            logger.info(
-                f"Downloaded document {document_id} "
-                f"({len(response.content)} bytes, {response.headers.get('content-type')})"
-            )
-            return response.content
+        logger.debug(f"Downloading document: {document_id}")
+        response = await self._request("GET", url, headers=headers)
+        response.raise_for_status()
+        logger.info(
+            f"Downloaded document {document_id} "
+            f"({len(response.content)} bytes, {response.headers.get('content-type')})"
+        )
+        return response.content
 
     async def get_predocument(
         self,
@@ -1017,21 +1817,191 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/messages/v2/documents/{document_id}/predocument"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/messages/v2/documents/{document_id}/predocument"
+        headers = self._request_headers(self.banking_access_token)
 
-            logger.debug(f"Downloading predocument for: {document_id}")
-            response = await client.get(url=url, headers=headers)
-            response.raise_for_status()
+        logger.debug(f"Downloading predocument for: {document_id}")
+        response = await self._request("GET", url, headers=headers)
+        response.raise_for_status()
+        logger.info(
+            f"Downloaded predocument for {document_id} "
+            f"({len(response.content)} bytes, {response.headers.get('content-type')})"
+        )
+        return response.content
+
+    async def download_document(
+        self,
+        document_id: str,
+        destination: str | os.PathLike[str] | AsyncByteWriter,
+        chunk_size: int = 64 * 1024,
+        resume: bool = True,
+    ) -> DocumentDownload:
+        """
+        Stream a document to a file or async writer without buffering it in memory.
+
+        Size and SHA-256 are computed while the chunks are written. A file is
+        first written to "<path>.part" and renamed once complete; if a previous
+        attempt left such a file and `resume` is True, only the missing bytes
+        are requested with a Range header (falling back to a full download if
+        the server ignores it).
+
+        Args:
+            document_id: The unique ID (UUID) of the document
+            destination: File path, or an object with `async write(bytes)`
+            chunk_size: Bytes per chunk read from the response (default: 64 KiB)
+            resume: Continue a partial "<path>.part" file (paths only, default: True)
+
+        Returns:
+            DocumentDownload with size, SHA-256, content type and path
+
+        Raises:
+            ValueError: If no banking access token is available
+        """
+        url = f"{self.BASE_URL}/messages/v2/documents/{document_id}"
+        return await self._download(document_id, url, destination, chunk_size, resume)
+
+    async def download_predocument(
+        self,
+        document_id: str,
+        destination: str | os.PathLike[str] | AsyncByteWriter,
+        chunk_size: int = 64 * 1024,
+        resume: bool = True,
+    ) -> DocumentDownload:
+        """
+        Stream a predocument to a file or async writer; see `download_document()`.
+
+        Args:
+            document_id: The unique ID (UUID) of the document
+            destination: File path, or an object with `async write(bytes)`
+            chunk_size: Bytes per chunk read from the response (default: 64 KiB)
+            resume: Continue a partial "<path>.part" file (paths only, default: True)
+
+        Returns:
+            DocumentDownload with size, SHA-256, content type and path
+
+        Raises:
+            ValueError: If no banking access token is available
+        """
+        url = f"{self.BASE_URL}/messages/v2/documents/{document_id}/predocument"
+        return await self._download(document_id, url, destination, chunk_size, resume)
+
+    async def _download(
+        self,
+        document_id: str,
+        url: str,
+        destination: str | os.PathLike[str] | AsyncByteWriter,
+        chunk_size: int,
+        resume: bool,
+    ) -> DocumentDownload:
+        if not self.banking_access_token:
+            raise ValueError(
+                "No banking access token available. Please obtain banking access first."
+            )
+
+        await self._ensure_fresh_token()
+
+        if isinstance(destination, (str, os.PathLike)):
+            return await self._download_to_path(
+                document_id, url, Path(destination), chunk_size, resume
+            )
+
+        digest = hashlib.sha256()
+        async with self._stream("GET", url) as response:
+            size = await self._copy_stream(response, destination.write, digest, chunk_size)
+            content_type = response.headers.get("content-type")
+        logger.info("Streamed document %s (%d bytes, %s)", document_id, size, content_type)
+        return DocumentDownload(
+            document_id=document_id,
+            size=size,
+            sha256=digest.hexdigest(),
+            content_type=content_type,
+        )
+
+    async def _download_to_path(
+        self, document_id: str, url: str, path: Path, chunk_size: int, resume: bool
+    ) -> DocumentDownload:
+        partial = path.with_name(path.name + ".part")
+        offset = partial.stat().st_size if resume and partial.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+
+        try:
+            async with self._stream("GET", url, headers) as response:
+                return await self._write_partial(
+                    document_id, response, path, partial, offset, chunk_size
+                )
+        except httpx.HTTPStatusError as exc:
+            if not offset or exc.response.status_code != 416:
+                raise
+        # 416: the partial file does not fit the document (changed or already complete)
+        logger.info("Range rejected for document %s, downloading from start", document_id)
+        async with self._stream("GET", url) as response:
+            return await self._write_partial(document_id, response, path, partial, 0, chunk_size)
+
+    async def _write_partial(
+        self,
+        document_id: str,
+        response: httpx.Response,
+        path: Path,
+        partial: Path,
+        offset: int,
+        chunk_size: int,
+    ) -> DocumentDownload:
+        """Write `response` to `partial` (appending after `offset` on 206), then rename."""
+        content_range = response.headers.get("content-range", "")
+        if offset and not (
+            response.status_code == 206 and content_range.startswith(f"bytes {offset}-")
+        ):
             logger.info(
-                f"Downloaded predocument for {document_id} "
-                f"({len(response.content)} bytes, {response.headers.get('content-type')})"
+                "Server ignored range for document %s, downloading from start", document_id
+            )
+            offset = 0
+
+        digest = hashlib.sha256()
+        if offset:
+            await asyncio.to_thread(_hash_file, partial, digest)
+        file = await asyncio.to_thread(open, partial, "ab" if offset else "wb")
+        try:
+            size = offset + await self._copy_stream(
+                response, lambda chunk: asyncio.to_thread(file.write, chunk), digest, chunk_size
             )
-            return response.content
+        finally:
+            await asyncio.to_thread(file.close)
+        await asyncio.to_thread(partial.replace, path)
+
+        content_type = response.headers.get("content-type")
+        logger.info(
+            "Downloaded document %s to %s (%d bytes, %s, resumed from %d)",
+            document_id,
+            path,
+            size,
+            content_type,
+            offset,
+        )
+        return DocumentDownload(
+            document_id=document_id,
+            size=size,
+            sha256=digest.hexdigest(),
+            content_type=content_type,
+            path=path,
+            resumed_from=offset,
+        )
+
+    @staticmethod
+    async def _copy_stream(
+        response: httpx.Response,
+        write: Callable[[bytes], Awaitable[Any]],
+        digest: Any,
+        chunk_size: int,
+    ) -> int:
+        """Pass each body chunk to `digest` and `write`; return the bytes copied."""
+        size = 0
+        async for chunk in response.aiter_bytes(chunk_size):
+            digest.update(chunk)
+            await write(chunk)
+            size += len(chunk)
+        return size
 
     # ==================== ORDERS API ====================
 
@@ -1078,40 +2048,58 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
+
+        url = f"{self.BASE_URL}/brokerage/depots/{depot_id}/v3/orders"
+        headers = self._request_headers(self.banking_access_token)
+
+        params: dict = {}
+        if with_attr:
+            params["with-attr"] = with_attr
+        if without_attr:
+            params["without-attr"] = without_attr
+        if instrument_id:
+            params["instrumentId"] = instrument_id
+        if isin:
+            params["isin"] = isin
+        if wkn:
+            params["wkn"] = wkn
+        if order_status:
+            params["orderStatus"] = order_status
+        if venue_id:
+            params["venueId"] = venue_id
+        if order_type:
+            params["orderType"] = order_type
+        if min_creation_timestamp:
+            params["min-creationTimeStamp"] = min_creation_timestamp
+        if max_creation_timestamp:
+            params["max-creationTimeStamp"] = max_creation_timestamp
+        if side:
+            params["side"] = side
+
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        return self._parse(Orders, response.content)
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/brokerage/depots/{depot_id}/v3/orders"
-            headers = self._request_headers(self.banking_access_token)
-
-            params: dict = {}
-            if with_attr:
-                params["with-attr"] = with_attr
-            if without_attr:
-                params["without-attr"] = without_attr
-            if instrument_id:
-                params["instrumentId"] = instrument_id
-            if isin:
-                params["isin"] = isin
-            if wkn:
-                params["wkn"] = wkn
-            if order_status:
-                params["orderStatus"] = order_status
-            if venue_id:
-                params["venueId"] = venue_id
-            if order_type:
-                params["orderType"] = order_type
-            if min_creation_timestamp:
-                params["min-creationTimeStamp"] = min_creation_timestamp
-            if max_creation_timestamp:
-                params["max-creationTimeStamp"] = max_creation_timestamp
-            if side:
-                params["side"] = side
-
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            return Orders(**response.json())
+    async def iter_depot_orders(self, depot_id: str, **filters: Any) -> AsyncIterator[Order]:
+        """
+        Iterate over the orders of a depot.
+
+        The orders endpoint takes no paging parameters and returns all matching
+        orders in one response, so this is a single request. It mirrors
+        `iter_account_transactions()` / `iter_documents()` so callers can treat
+        all three lists alike; narrow large histories with the filters instead.
+
+        Args:
+            depot_id: Depot identifier (UUID)
+            **filters: Keyword filters of `get_depot_orders()` (e.g. order_status, side)
+
+        Yields:
+            Order objects in API order
+        """
+        orders = await self.get_depot_orders(depot_id, **filters)
+        for order in orders.values:
+            yield order
 
     async def get_order(self, order_id: str, without_attr: str | None = None) -> Order:
         """
@@ -1129,20 +2117,18 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/brokerage/v3/orders/{order_id}"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/brokerage/v3/orders/{order_id}"
+        headers = self._request_headers(self.banking_access_token)
 
-            params: dict = {}
-            if without_attr:
-                params["without-attr"] = without_attr
+        params: dict = {}
+        if without_attr:
+            params["without-attr"] = without_attr
 
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            return Order(**response.json())
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        return self._parse(Order, response.content)
 
     # ==================== REPORTS API ====================
 
@@ -1170,19 +2156,24 @@ class ComdirectClient:
                 "No banking access token available. Please obtain banking access first."
             )
 
-        if self.is_token_expired():
-            await self.refresh_access_token()
+        await self._ensure_fresh_token()
 
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/reports/participants/user/v1/allbalances"
-            headers = self._request_headers(self.banking_access_token)
+        url = f"{self.BASE_URL}/reports/participants/user/v1/allbalances"
+        headers = self._request_headers(self.banking_access_token)
 
-            params: dict = {}
-            if product_type:
-                params["productType"] = product_type
-            if client_connection_type:
-                params["clientConnectionType"] = client_connection_type
+        params: dict = {}
+        if product_type:
+            params["productType"] = product_type
+        if client_connection_type:
+            params["clientConnectionType"] = client_connection_type
 
-            response = await client.get(url=url, headers=headers, params=params)
-            response.raise_for_status()
-            return AllBalances(**response.json())
+        response = await self._request("GET", url, headers=headers, params=params)
+        response.raise_for_status()
+        return self._parse(AllBalances, response.content)
+
+
+def _hash_file(path: Path, digest: Any, chunk_size: int = 1024 * 1024) -> None:
+    """Feed the contents of `path` into `digest` chunk by chunk."""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
@@ -88,6 +88,7 @@ async def run_account(
             print(f"Depot Type: {depot.depot_type}")
 
             print(f"\n--- Positions for Depot {depot_id} ---")
+            positions = None
             try:
                 positions = await client.get_depot_positions(
                     depot_id=depot_id, with_attr="instrument"
@@ -123,24 +124,22 @@ async def run_account(
             except Exception as e:
                 print(f"No depot transactions found: {e}")
 
-            if positions and positions.values and positions.values[0].wkn:
-                wkn = positions.values[0].wkn
-                print(f"\n--- Instrument Details for WKN {wkn} ---")
-                try:
-                    instruments = await client.get_instrument(
-                        instrument_id=wkn,
-                        with_attr=["orderDimensions", "derivativeData"],
-                    )
-                    if instruments.values:
-                        instrument = instruments.values[0]
-                        print(f"Name: {instrument.name}")
-                        print(f"ISIN: {instrument.isin}")
-                        print(f"WKN: {instrument.wkn}")
-                        if instrument.static_data:
-                            print(f"Type: {instrument.static_data.instrument_type}")
-                            print(f"Currency: {instrument.static_data.currency}")
-                except Exception as e:
-                    print(f"Instrument details not available: {e}")
+            wkns = [pos.wkn for pos in positions.values if pos.wkn] if positions else []
+            if wkns:
+                print(f"\n--- Instrument Details for {len(wkns)} Positions ---")
+                instrument_results = await client.get_instruments(
+                    wkns, with_attr=["orderDimensions", "derivativeData"]
+                )
+                for wkn, result in instrument_results.items():
+                    if isinstance(result, Exception):
+                        print(f"  - {wkn}: details not available: {result}")
+                    elif result.values:
+                        instrument = result.values[0]
+                        static = instrument.static_data
+                        details = (
+                            f" ({static.instrument_type}, {static.currency})" if static else ""
+                        )
+                        print(f"  - {wkn}: {instrument.name} [{instrument.isin}]{details}")
 
             print(f"\n--- Orders for Depot {depot_id} ---")
             try:
@@ -279,13 +278,17 @@ async def main() -> None:
     """Authenticate and display portfolio summary for every configured account."""
     from .settings import settings
 
+    token_store = settings.token_store()
+    cache = settings.response_cache()  # shared, so instruments are fetched once
     for account_name, account in settings.accounts.items():
-        print(f"\nAuthenticating {account_name} — approve push TAN on your phone...")
-        client = await ComdirectClient.create(
+        print(f"\nAuthenticating {account_name} — approve push TAN on your phone if asked...")
+        async with await ComdirectClient.create(
             zugangsnummer=account.zugangsnummer.get_secret_value(),
             pin=account.pin.get_secret_value(),
-        )
-        await run_account(account_name, client, display_name=account.display_name)
+            token_store=token_store,
+            cache=cache,
+        ) as client:
+            await run_account(account_name, client, display_name=account.display_name)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,8 @@ from .accounts import AccountBalance, AccountBalances
 from .base import AmountValue
 from .depots import AccountDepots, DepotPosition, DepotPositions
 from .instruments import Instruments
-from .messages import Documents
+from .lazy import LazyModel
+from .messages import DocumentDownload, Documents
 from .orders import Order, Orders
 from .reports import AllBalances
 from .transactions import AccountTransactions, DepotTransactions
@@ -22,7 +23,9 @@ __all__ = [
     "DepotPosition",        # from get_depot_position()
     "DepotTransactions",    # from get_depot_transactions()
     "Instruments",          # from get_instrument()
+    "LazyModel",            # from get_depot_positions/transactions(lazy=True)
     "Documents",            # from get_documents()
+    "DocumentDownload",     # from download_document() / download_predocument()
     "AllBalances",          # from get_all_balances()
     "Orders",               # from get_depot_orders()
     "Order",                # from get_order()
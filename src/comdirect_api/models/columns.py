@@ -0,0 +1,161 @@
+"""
+Columnar export of list responses for analytics.
+
+List models (`DepotPositions`, `DepotTransactions`, `AccountTransactions`,
+`Orders`) declare their columns once as `Column(name, path, kind)`. Both
+exports walk `values` in a single pass, collecting one Python list per column,
+and then build typed arrays from them:
+
+- `to_arrow()` returns a `pyarrow.Table`: amounts as `decimal128(38, 6)`,
+  dates as `date32`, timestamps as `timestamp[us, UTC]`, and category columns
+  (WKN, ISIN, units, types) dictionary-encoded.
+- `to_columns()` returns NumPy arrays: amounts as int64 fixed-point with
+  `AMOUNT_SCALE` decimal places (`1.5 EUR` -> `1_500_000`), dates as
+  `datetime64[D]`, timestamps as UTC `datetime64[us]` (NaT when missing);
+  nullable numbers and flags are masked arrays, strings are object arrays.
+
+An amount column `x` (an `AmountValue`) yields two columns, `x` and `x_unit`.
+Requires the ``columnar`` extra (numpy, pyarrow).
+"""
+
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import Any, ClassVar, Literal, NamedTuple
+
+AMOUNT_SCALE = 6  # decimal places kept by both exports
+
+Kind = Literal["string", "category", "amount", "decimal", "date", "datetime", "bool"]
+
+
+class Column(NamedTuple):
+    """One exported column: `path` is a dotted attribute path from the list item."""
+
+    name: str
+    path: str
+    kind: Kind = "string"
+
+
+class ColumnarList:
+    """Mixin for list models whose `values` can be exported as typed columns."""
+
+    columns: ClassVar[tuple[Column, ...]] = ()
+
+    def to_columns(self) -> dict[str, Any]:
+        """Return `values` as NumPy arrays keyed by column name."""
+        np = _require("numpy")
+        arrays = {}
+        for name, kind, data in _extract(self.values, self.columns):
+            arrays[name] = _numpy_array(np, kind, data)
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """Return `values` as a `pyarrow.Table`."""
+        pa = _require("pyarrow")
+        arrays = {}
+        for name, kind, data in _extract(self.values, self.columns):
+            arrays[name] = _arrow_array(pa, kind, data)
+        return pa.table(arrays)
+
+
+def _extract(items: Iterable[Any], columns: tuple[Column, ...]) -> list[tuple[str, Kind, list]]:
+    """Collect the column values of all items in one pass."""
+    plan = [(column, column.path.split("."), []) for column in columns]
+    units = {column.name: [] for column in columns if column.kind == "amount"}
+    for item in items:
+        for column, steps, data in plan:
+            value = item
+            for step in steps:
+                if value is None:
+                    break
+                # Untyped payload parts (e.g. DepotTransaction.instrument) are dicts
+                value = value.get(step) if isinstance(value, dict) else getattr(value, step)
+            kind = column.kind
+            if kind == "amount":
+                units[column.name].append(value.unit if value is not None else None)
+                value = value.value if value is not None else None
+            elif value is None:
+                pass
+            elif kind == "date":
+                value = _to_date(value)
+            elif kind == "datetime":
+                value = _to_utc(value)
+            data.append(value)
+
+    result = []
+    for column, _, data in plan:
+        if column.kind == "amount":
+            result.append((column.name, "decimal", data))
+            result.append((f"{column.name}_unit", "category", units[column.name]))
+        else:
+            result.append((column.name, column.kind, data))
+    return result
+
+
+def _to_date(value: date | str) -> date | None:
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None  # free-text dates (e.g. valuta_date) that are not ISO
+
+
+def _to_utc(value: datetime | str) -> datetime | None:
+    """Return a naive UTC datetime (what datetime64 and timestamp[UTC] expect)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+def _numpy_array(np: Any, kind: Kind, data: list) -> Any:
+    if kind == "decimal":
+        return np.ma.masked_array(
+            [0 if v is None else _fixed_point(v) for v in data],
+            mask=[v is None for v in data],
+            dtype=np.int64,
+        )
+    if kind == "bool":
+        return np.ma.masked_array(
+            [bool(v) for v in data], mask=[v is None for v in data], dtype=np.bool_
+        )
+    if kind == "date":
+        return np.array(data, dtype="datetime64[D]")
+    if kind == "datetime":
+        return np.array(data, dtype="datetime64[us]")
+    return np.array(data, dtype=object)
+
+
+def _arrow_array(pa: Any, kind: Kind, data: list) -> Any:
+    if kind == "decimal":
+        return pa.array(data, pa.decimal128(38, AMOUNT_SCALE))
+    if kind == "bool":
+        return pa.array(data, pa.bool_())
+    if kind == "date":
+        return pa.array(data, pa.date32())
+    if kind == "datetime":
+        return pa.array(data, pa.timestamp("us", tz="UTC"))
+    array = pa.array(data, pa.string())
+    return array.dictionary_encode() if kind == "category" else array
+
+
+def _fixed_point(value: Decimal) -> int:
+    scaled = Decimal(value).scaleb(AMOUNT_SCALE)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"{value} has more than {AMOUNT_SCALE} decimal places")
+    return int(scaled)
+
+
+def _require(module: str) -> Any:
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(
+            f"Columnar export requires {module} (the 'columnar' extra): "
+            "pip install 'comdirect-api[columnar]'"
+        ) from e
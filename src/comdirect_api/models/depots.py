@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import ClassVar
 
 from .base import AmountValue, ComdirectBaseModel
+from .columns import Column, ColumnarList
 from .instruments import Instrument, Price
 
 
@@ -70,9 +72,30 @@ class DepotPosition(ComdirectBaseModel):
     version: str | None = None
 
 
-class DepotPositions(ComdirectBaseModel):
+class DepotPositions(ComdirectBaseModel, ColumnarList):
     """List of depot positions."""
 
     paging: dict
     values: list[DepotPosition]
     aggregated: dict | None = None
+
+    columns: ClassVar[tuple[Column, ...]] = (
+        Column("depot_id", "depot_id", "category"),
+        Column("position_id", "position_id"),
+        Column("wkn", "wkn", "category"),
+        Column("isin", "instrument.isin", "category"),
+        Column("instrument_name", "instrument.name"),
+        Column("custody_type", "custody_type", "category"),
+        Column("quantity", "quantity", "amount"),
+        Column("available_quantity", "available_quantity", "amount"),
+        Column("current_price", "current_price.price", "amount"),
+        Column("current_price_datetime", "current_price.price_datetime", "datetime"),
+        Column("purchase_price", "purchase_price", "amount"),
+        Column("current_value", "current_value", "amount"),
+        Column("purchase_value", "purchase_value", "amount"),
+        Column("prev_day_value", "prev_day_value", "amount"),
+        Column("profit_loss_purchase_abs", "profit_loss_purchase_abs", "amount"),
+        Column("profit_loss_purchase_rel", "profit_loss_purchase_rel", "decimal"),
+        Column("profit_loss_prev_day_abs", "profit_loss_prev_day_abs", "amount"),
+        Column("profit_loss_prev_day_rel", "profit_loss_prev_day_rel", "decimal"),
+    )
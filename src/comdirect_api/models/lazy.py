@@ -0,0 +1,118 @@
+"""
+Lazy response models that build submodels only when they are accessed.
+
+`LazyModel(DepotPositions, data)` wraps the decoded JSON of a response and
+offers the attribute API of the wrapped model. Nothing is validated up front:
+
+- list-of-model fields (e.g. `values`) become lists of `LazyModel` wrappers,
+  one small object per item;
+- any other field is validated on first access (a nested field such as
+  `position.instrument` becomes a real pydantic `Instrument` then) and
+  cached on the wrapper.
+
+Code that reads a few fields of many items (`position_id`, `quantity`,
+`instrument.isin`) therefore never builds the `Price`, `DerivativeData` or
+`AmountValue` objects it does not touch. `materialize()` returns the fully
+validated model; other attributes, such as model methods like
+`to_columns()`, are looked up on that model, built once on first use.
+"""
+
+import functools
+import typing
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class LazyModel(Generic[ModelT]):
+    """Attribute-compatible stand-in for `model_type` over undecoded JSON fields."""
+
+    __slots__ = ("_model_type", "_data", "__dict__")
+
+    def __init__(self, model_type: type[ModelT], data: dict[str, Any]):
+        self._model_type = model_type
+        self._data = data
+
+    @property
+    def model_type(self) -> type[ModelT]:
+        return self._model_type
+
+    def materialize(self) -> ModelT:
+        """Build the complete, validated `model_type`."""
+        return self._model_type.model_validate(self._data)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not cached in __dict__ yet
+        spec = _fields(self._model_type).get(name)
+        if spec is None:
+            if name.startswith("_"):  # private/dunder lookups (copy, pickle) stay local
+                raise AttributeError(name)
+            model = self.__dict__.get(_MODEL)
+            if model is None:
+                model = self.__dict__[_MODEL] = self.materialize()
+            return getattr(model, name)  # methods and properties of the full model
+        alias, field, item_model, exact = spec
+
+        raw = self._data.get(alias, self._data.get(name, _MISSING))
+        if raw is _MISSING:
+            if field.is_required():
+                raise ValidationError.from_exception_data(
+                    self._model_type.__name__,
+                    [{"type": "missing", "loc": (alias,), "input": self._data}],
+                )
+            value = field.get_default(call_default_factory=True)
+        elif raw is None or type(raw) in exact:
+            value = raw  # JSON scalar that already has the field's type
+        elif item_model is not None:
+            value = [LazyModel(item_model, item) for item in raw]
+        else:
+            value = _adapter(self._model_type, name).validate_python(raw)
+        self.__dict__[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyModel({self._model_type.__name__}, {len(self._data)} keys)"
+
+
+_MISSING = object()
+_MODEL = "__model__"  # __dict__ key of the materialized model
+
+
+_FieldSpec = tuple[str, FieldInfo, type[BaseModel] | None, frozenset[type]]
+
+
+@functools.cache
+def _fields(model_type: type[BaseModel]) -> dict[str, _FieldSpec]:
+    """Field name -> (JSON key, FieldInfo, list item model, types taken as is)."""
+    fields = {}
+    for name, field in model_type.model_fields.items():
+        exact = frozenset()
+        if not field.metadata:  # constrained fields are always validated
+            options = typing.get_args(field.annotation) or (field.annotation,)
+            exact = frozenset(t for t in options if t in (str, int, bool))
+        fields[name] = (field.alias or name, field, _list_item_model(field.annotation), exact)
+    return fields
+
+
+def _list_item_model(annotation: Any) -> type[BaseModel] | None:
+    """Return M for list[M] / list[M] | None annotations, else None."""
+    options = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if typing.get_origin(annotation) is not list and len(options) == 1:
+        annotation = options[0]  # Optional[list[M]]
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation) or (Any,)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return item
+    return None
+
+
+@functools.cache
+def _adapter(model_type: type[BaseModel], name: str) -> TypeAdapter:
+    """TypeAdapter validating one field of `model_type` (with its constraints)."""
+    field = model_type.model_fields[name]
+    if field.metadata:
+        return TypeAdapter(typing.Annotated[(field.annotation, *field.metadata)])
+    return TypeAdapter(field.annotation)
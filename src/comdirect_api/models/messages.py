@@ -1,6 +1,8 @@
 """Messages models for Comdirect API."""
 
-from pydantic import Field
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from .base import ComdirectBaseModel
 
@@ -71,3 +73,16 @@ class Documents(ComdirectBaseModel):
     aggregated: dict | None = Field(
         default=None, description="Aggregated information"
     )
+
+
+class DocumentDownload(BaseModel):
+    """Result of a streaming document download (not an API response)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    document_id: str
+    size: int  # total bytes of the document, including a resumed prefix
+    sha256: str  # hex digest of the complete document
+    content_type: str | None
+    path: Path | None = None  # None when streamed to a writer
+    resumed_from: int = 0  # bytes kept from an earlier partial download
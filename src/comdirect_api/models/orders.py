@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from typing import ClassVar
+
 from .base import AmountValue, ComdirectBaseModel
+from .columns import Column, ColumnarList
 
 
 class PercentageValue(ComdirectBaseModel):
@@ -59,9 +62,28 @@ class Order(ComdirectBaseModel):
 Order.model_rebuild()
 
 
-class Orders(ComdirectBaseModel):
-    """List of orders with pagination."""
+class Orders(ComdirectBaseModel, ColumnarList):
+    """List of orders with pagination (columns cover top-level orders, not sub_orders)."""
 
     paging: dict | None = None
     aggregated: dict | None = None
     values: list[Order] = []
+
+    columns: ClassVar[tuple[Column, ...]] = (
+        Column("order_id", "order_id"),
+        Column("depot_id", "depot_id", "category"),
+        Column("creation_timestamp", "creation_timestamp", "datetime"),
+        Column("order_type", "order_type", "category"),
+        Column("order_status", "order_status", "category"),
+        Column("side", "side", "category"),
+        Column("instrument_id", "instrument_id", "category"),
+        Column("venue_id", "venue_id", "category"),
+        Column("validity_type", "validity_type", "category"),
+        Column("validity", "validity", "date"),
+        Column("quantity", "quantity", "amount"),
+        Column("open_quantity", "open_quantity", "amount"),
+        Column("executed_quantity", "executed_quantity", "amount"),
+        Column("cancelled_quantity", "cancelled_quantity", "amount"),
+        Column("limit", "limit", "amount"),
+        Column("expected_value", "expected_value", "amount"),
+    )
@@ -1,8 +1,10 @@
 """Transaction models for Comdirect API."""
 
 from datetime import date, datetime
+from typing import ClassVar
 
 from .base import AmountValue, ComdirectBaseModel
+from .columns import Column, ColumnarList
 
 
 class AccountInformation(ComdirectBaseModel):
@@ -39,13 +41,27 @@ class AccountTransaction(ComdirectBaseModel):
     transaction_type: EnumText | None = None
 
 
-class AccountTransactions(ComdirectBaseModel):
+class AccountTransactions(ComdirectBaseModel, ColumnarList):
     """List of account transactions."""
 
     paging: dict
     values: list[AccountTransaction]
     aggregated: dict | None = None
 
+    columns: ClassVar[tuple[Column, ...]] = (
+        Column("reference", "reference"),
+        Column("booking_status", "booking_status", "category"),
+        Column("booking_date", "booking_date", "date"),
+        Column("valuta_date", "valuta_date", "date"),
+        Column("amount", "amount", "amount"),
+        Column("transaction_type", "transaction_type.key", "category"),
+        Column("remitter_name", "remitter.holder_name"),
+        Column("creditor_name", "creditor.holder_name"),
+        Column("creditor_iban", "creditor.iban", "category"),
+        Column("remittance_info", "remittance_info"),
+        Column("new_transaction", "new_transaction", "bool"),
+    )
+
 
 class DepotTransaction(ComdirectBaseModel):
     """Depot transaction model."""
@@ -65,9 +81,25 @@ class DepotTransaction(ComdirectBaseModel):
     fx_rate: dict | None = None  # FXRateEUR
 
 
-class DepotTransactions(ComdirectBaseModel):
+class DepotTransactions(ComdirectBaseModel, ColumnarList):
     """List of depot transactions."""
 
     paging: dict
     values: list[DepotTransaction]
     aggregated: dict | None = None
+
+    columns: ClassVar[tuple[Column, ...]] = (
+        Column("transaction_id", "transaction_id"),
+        Column("booking_status", "booking_status", "category"),
+        Column("booking_date", "booking_date", "date"),
+        Column("settlement_date", "settlement_date", "datetime"),
+        Column("business_date", "business_date", "date"),
+        Column("instrument_id", "instrument_id", "category"),
+        Column("wkn", "instrument.wkn", "category"),
+        Column("isin", "instrument.isin", "category"),
+        Column("transaction_type", "transaction_type", "category"),
+        Column("transaction_direction", "transaction_direction", "category"),
+        Column("quantity", "quantity", "amount"),
+        Column("execution_price", "execution_price", "amount"),
+        Column("transaction_value", "transaction_value", "amount"),
+    )
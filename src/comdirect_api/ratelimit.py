@@ -0,0 +1,58 @@
+"""Client-side rate limiting shared by ComdirectClient instances."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+
+
+class RateLimiter(ABC):
+    """
+    Async rate limiter consulted by `ComdirectClient._request()` before every attempt.
+
+    Requests are keyed by the OAuth client_id, so several clients that share one
+    limiter instance also share one quota. Implement `acquire()` to plug in a
+    different pacing strategy (e.g. a distributed limiter).
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str) -> None:
+        """Wait until a request for `key` may be sent."""
+
+
+class TokenBucketLimiter(RateLimiter):
+    """
+    Token bucket per key: `rate` requests per second with bursts up to `burst`.
+
+    Waiters for the same key are served in FIFO order, so concurrent callers
+    are paced evenly instead of bursting into the API's rate limit.
+
+    Example:
+        >>> limiter = TokenBucketLimiter(rate=10)
+        >>> a = await ComdirectClient.create(..., rate_limiter=limiter)
+        >>> b = await ComdirectClient.create(..., rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        # key -> (available tokens, monotonic time of last refill)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, key: str) -> None:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            tokens = self._refill(key)
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / self.rate)
+                tokens = self._refill(key)
+            self._buckets[key] = (tokens - 1, time.monotonic())
+
+    def _refill(self, key: str) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+        self._buckets[key] = (tokens, now)
+        return tokens
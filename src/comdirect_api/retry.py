@@ -0,0 +1,71 @@
+"""Retry policy for the ComdirectClient request pipeline."""
+
+import random
+import time
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+
+from pydantic import BaseModel, ConfigDict
+
+# Methods that may be replayed after the server has possibly acted on them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy(BaseModel):
+    """
+    How `ComdirectClient._request()` retries transient failures.
+
+    Every status code has its own retry budget. 429 and 503 mean the server did
+    not process the request, so they are retried for any method; 502 and 504
+    may hide a processed request and are only retried for idempotent methods.
+    Connection failures happen before anything is sent and are always retried.
+
+    Waits use decorrelated jitter between `base_delay` and `max_delay` unless
+    the server sends `Retry-After`, which always wins. No retry is started if
+    its wait would end after `deadline` seconds from the first attempt.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    status_retries: dict[int, int] = {429: 5, 502: 2, 503: 3, 504: 2}
+    idempotent_only: frozenset[int] = frozenset({502, 504})
+    connect_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    deadline: float = 120.0
+
+    def retries_for(self, status_code: int, method: str) -> int:
+        """Return the retry budget for a response status (0 = do not retry)."""
+        retries = self.status_retries.get(status_code, 0)
+        if status_code in self.idempotent_only and method.upper() not in IDEMPOTENT_METHODS:
+            return 0
+        return retries
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: uniform in [base_delay, 3 * previous], capped at max_delay."""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+
+NO_RETRY = RetryPolicy(status_retries={}, connect_retries=0)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Accepts both delta-seconds ("120") and HTTP-date formats. Returns None if
+    the header is missing or unparsable.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, retry_at.timestamp() - time.time())
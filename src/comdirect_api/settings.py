@@ -1,6 +1,11 @@
+from pathlib import Path
+
 from pydantic import BaseModel, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .cache import DiskResponseCache, MemoryResponseCache, ResponseCache
+from .token_store import EncryptedFileTokenStore
+
 
 class AccountSettings(BaseModel):
     """Credentials for a single Comdirect bank connection."""
@@ -18,11 +23,32 @@ class ClientSettings(BaseSettings):
     via env_nested_delimiter="__":
         ACCOUNTS__DEPOT11__ZUGANGSNUMMER = ...
         ACCOUNTS__DEPOT11__PIN = ...
+
+    Setting TOKEN_STORE_KEY (a Fernet key) enables the encrypted token store at
+    TOKEN_STORE_PATH, so restarts resume the session instead of asking for a TAN.
+    Setting RESPONSE_CACHE_PATH keeps cached reference data across runs.
     """
 
     client_id: SecretStr
     client_secret: SecretStr
     accounts: dict[str, AccountSettings]
+    token_store_path: Path = Path(".comdirect-tokens")
+    token_store_key: SecretStr | None = None
+    response_cache_path: Path | None = None
+
+    def token_store(self) -> EncryptedFileTokenStore | None:
+        """Return the configured encrypted token store, or None if no key is set."""
+        if self.token_store_key is None:
+            return None
+        return EncryptedFileTokenStore(
+            self.token_store_path, self.token_store_key.get_secret_value()
+        )
+
+    def response_cache(self) -> ResponseCache:
+        """Return an on-disk cache if RESPONSE_CACHE_PATH is set, else an in-memory one."""
+        if self.response_cache_path is not None:
+            return DiskResponseCache(self.response_cache_path)
+        return MemoryResponseCache()
 
     model_config = SettingsConfigDict(
         env_file=".env",
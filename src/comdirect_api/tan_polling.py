@@ -0,0 +1,50 @@
+"""Polling schedule and progress reporting for push-TAN confirmation."""
+
+from collections.abc import Callable, Iterator
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TanPollingPolicy(BaseModel):
+    """
+    How `ComdirectClient` polls a TAN challenge until it is approved.
+
+    The first poll is sent right after the challenge starts, then the interval
+    grows from `first_delay` by `factor` up to `max_delay`. Most approvals
+    happen within the first seconds after the push arrives, so short early
+    intervals detect them quickly while the long tail costs few requests.
+
+    Polling stops with a TimeoutError once the next poll would start after
+    `deadline` seconds, or after `max_attempts` polls if set.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    first_delay: float = 0.5
+    factor: float = 1.5
+    max_delay: float = 5.0
+    deadline: float = 300.0
+    max_attempts: int | None = None
+
+    def delays(self) -> Iterator[float]:
+        """Yield the wait before each subsequent poll (endless)."""
+        delay = self.first_delay
+        while True:
+            yield delay
+            delay = min(self.max_delay, delay * self.factor)
+
+
+class TanPollProgress(BaseModel):
+    """Snapshot passed to the `on_tan_progress` hook after every poll."""
+
+    model_config = ConfigDict(frozen=True)
+
+    attempt: int
+    status: str | None  # None if the poll failed with an HTTP error
+    elapsed: float  # seconds since the first poll
+    next_delay: float | None  # None when polling stops after this poll
+    deadline: float
+
+
+# Hook type for ComdirectClient(on_tan_progress=...), e.g. to drive a progress bar
+TanProgressHook = Callable[[TanPollProgress], None]
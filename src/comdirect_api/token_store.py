@@ -0,0 +1,121 @@
+"""
+Persistent token storage so a restarted client can skip the push-TAN flow.
+
+`ComdirectClient.create(..., token_store=...)` loads the stored session for the
+login, tries `refresh_access_token()` and only falls back to the full
+OAuth + TAN flow when that fails. Every successful authentication or refresh
+saves the rotated tokens again.
+
+`EncryptedFileTokenStore` requires the ``token-store`` extra (cryptography).
+"""
+
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class StoredSession(BaseModel):
+    """Token state needed to resume an authenticated session."""
+
+    refresh_token: str
+    session_id: str
+    banking_access_token: str
+
+
+class TokenStore(ABC):
+    """
+    Backend for persisted sessions, keyed by Zugangsnummer.
+
+    Implement `load()`, `save()` and `delete()` to keep sessions elsewhere
+    (e.g. a key vault or database).
+    """
+
+    @abstractmethod
+    async def load(self, key: str) -> StoredSession | None:
+        """Return the stored session for `key`, or None if there is none."""
+
+    @abstractmethod
+    async def save(self, key: str, session: StoredSession) -> None:
+        """Store (or replace) the session for `key`."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Forget the session for `key`. No-op if none is stored."""
+
+
+class EncryptedFileTokenStore(TokenStore):
+    """
+    Local file holding all sessions, encrypted with a Fernet key.
+
+    Generate a key once and keep it out of the repository:
+        >>> from cryptography.fernet import Fernet
+        >>> Fernet.generate_key().decode()
+
+    A file that cannot be decrypted (wrong key, corrupted) is treated as empty,
+    so the client simply falls back to the TAN flow and overwrites it.
+
+    Example:
+        >>> store = EncryptedFileTokenStore(".comdirect-tokens", key)
+        >>> client = await ComdirectClient.create(..., token_store=store)
+    """
+
+    def __init__(self, path: str | Path, key: str | bytes) -> None:
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError as e:
+            raise ImportError(
+                "EncryptedFileTokenStore requires the 'token-store' extra: "
+                "pip install 'comdirect-api[token-store]'"
+            ) from e
+
+        self.path = Path(path)
+        self._fernet = Fernet(key)
+        # Serializes read-modify-write cycles of clients sharing this store
+        self._lock = asyncio.Lock()
+
+    async def load(self, key: str) -> StoredSession | None:
+        async with self._lock:
+            sessions = await asyncio.to_thread(self._read)
+        data = sessions.get(key)
+        return StoredSession(**data) if data else None
+
+    async def save(self, key: str, session: StoredSession) -> None:
+        async with self._lock:
+            sessions = await asyncio.to_thread(self._read)
+            sessions[key] = session.model_dump()
+            await asyncio.to_thread(self._write, sessions)
+
+    async def delete(self, key: str) -> None:
+        async with self._lock:
+            sessions = await asyncio.to_thread(self._read)
+            if sessions.pop(key, None) is not None:
+                await asyncio.to_thread(self._write, sessions)
+
+    def _read(self) -> dict[str, dict]:
+        from cryptography.fernet import InvalidToken
+
+        try:
+            token = self.path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        try:
+            return json.loads(self._fernet.decrypt(token))
+        except (InvalidToken, ValueError):
+            logger.warning("Token store %s could not be decrypted; ignoring it", self.path)
+            return {}
+
+    def _write(self, sessions: dict[str, dict]) -> None:
+        token = self._fernet.encrypt(json.dumps(sessions).encode())
+        # Write to a private temp file and rename, so readers never see a partial file
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+        os.replace(tmp, self.path)
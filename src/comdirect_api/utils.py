@@ -1,5 +1,25 @@
-import datetime
+import time
 
+# Last issued timestamp in microseconds and the cached "YYYYmmddHHMMSS" prefix
+_last_us = 0
+_prefix_second = -1
+_prefix = ""
 
-def timestamp():
-    return datetime.datetime.now(datetime.UTC).strftime("%Y%m%d%H%M%S%f")
+
+def timestamp() -> str:
+    """
+    Return a UTC timestamp "YYYYmmddHHMMSSffffff" for use as a request ID.
+
+    Values are strictly increasing within the process, even for calls in the
+    same microsecond or after a backwards clock step. The date/time prefix is
+    formatted once per second and only the microseconds are spliced in.
+    """
+    global _last_us, _prefix_second, _prefix
+
+    now_us = max(time.time_ns() // 1000, _last_us + 1)
+    _last_us = now_us
+    second, micros = divmod(now_us, 1_000_000)
+    if second != _prefix_second:
+        _prefix = time.strftime("%Y%m%d%H%M%S", time.gmtime(second))
+        _prefix_second = second
+    return f"{_prefix}{micros:06d}"
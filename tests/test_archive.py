@@ -0,0 +1,128 @@
+"""Tests for the incremental document archive."""
+
+import hashlib
+import sqlite3
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from comdirect_api.archive import DocumentArchive
+from comdirect_api.models.messages import Document, DocumentDownload
+
+
+def _document(document_id: str, mime_type: str = "application/pdf") -> Document:
+    return Document(
+        document_id=document_id,
+        name=f"Statement {document_id}",
+        date_creation="2024-01-31",
+        mime_type=mime_type,
+    )
+
+
+def _archive_client(documents: list[Document], bodies: dict[str, bytes]):
+    """Mock client listing `documents` and writing `bodies` on download."""
+    client = MagicMock()
+    downloads = []
+
+    async def iter_documents(page_size=100):
+        for document in documents:
+            yield document
+
+    async def download_document(document_id, destination):
+        downloads.append(document_id)
+        body = bodies[document_id]
+        if isinstance(body, Exception):
+            raise body
+        destination.write_bytes(body)
+        return DocumentDownload(
+            document_id=document_id,
+            size=len(body),
+            sha256=hashlib.sha256(body).hexdigest(),
+            content_type="application/pdf",
+            path=destination,
+        )
+
+    client.iter_documents = iter_documents
+    client.download_document = download_document
+    return client, downloads
+
+
+@pytest.mark.asyncio
+async def test_sync_stores_documents_by_content_hash(tmp_path):
+    """New documents are downloaded and stored under their SHA-256."""
+    archive = DocumentArchive(tmp_path)
+    client, _ = _archive_client(
+        [_document("doc_1"), _document("doc_2", "text/html")],
+        {"doc_1": b"%PDF one", "doc_2": b"<html>two</html>"},
+    )
+
+    result = await archive.sync(client)
+
+    assert (result.listed, result.downloaded, result.skipped) == (2, 2, 0)
+    digest = hashlib.sha256(b"%PDF one").hexdigest()
+    assert archive.path_for("doc_1") == tmp_path / "objects" / digest[:2] / f"{digest}.pdf"
+    assert archive.path_for("doc_1").read_bytes() == b"%PDF one"
+    assert archive.path_for("doc_2").suffix == ".html"
+    assert not any((tmp_path / "incoming").iterdir())
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_indexed_documents(tmp_path):
+    """A second run downloads only documents that are not in the index yet."""
+    archive = DocumentArchive(tmp_path)
+    bodies = {"doc_1": b"%PDF one", "doc_2": b"%PDF two"}
+    client, downloads = _archive_client([_document("doc_1")], bodies)
+    await archive.sync(client)
+
+    client, downloads = _archive_client([_document("doc_1"), _document("doc_2")], bodies)
+    result = await DocumentArchive(tmp_path).sync(client)
+
+    assert downloads == ["doc_2"]
+    assert (result.downloaded, result.skipped) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_sync_stores_identical_content_once(tmp_path):
+    """Documents with the same content share one stored file."""
+    archive = DocumentArchive(tmp_path)
+    client, _ = _archive_client(
+        [_document("doc_1"), _document("doc_2")], {"doc_1": b"same", "doc_2": b"same"}
+    )
+
+    result = await archive.sync(client, concurrency=1)
+
+    assert (result.downloaded, result.deduplicated) == (1, 1)
+    assert archive.path_for("doc_1") == archive.path_for("doc_2")
+    assert len(list((tmp_path / "objects").rglob("*.pdf"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_records_failures_and_retries_them(tmp_path):
+    """A failed download does not abort the run and is retried next time."""
+    archive = DocumentArchive(tmp_path)
+    documents = [_document("doc_1"), _document("doc_2")]
+    client, _ = _archive_client(
+        documents, {"doc_1": httpx.ConnectError("boom"), "doc_2": b"%PDF two"}
+    )
+
+    result = await archive.sync(client)
+
+    assert list(result.failed) == ["doc_1"]
+    assert result.downloaded == 1
+    assert archive.path_for("doc_1") is None
+
+    client, downloads = _archive_client(documents, {"doc_1": b"%PDF one"})
+    result = await archive.sync(client)
+
+    assert downloads == ["doc_1"]
+    assert result.downloaded == 1
+    with sqlite3.connect(tmp_path / "index.sqlite") as db:
+        assert db.execute("SELECT COUNT(*) FROM documents").fetchone()[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_rejects_invalid_concurrency(tmp_path):
+    """concurrency must allow at least one download."""
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await DocumentArchive(tmp_path).sync(MagicMock(), concurrency=0)
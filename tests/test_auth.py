@@ -16,6 +16,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from comdirect_api.tan_polling import TanPollingPolicy
+
 
 @pytest.mark.asyncio
 async def test_get_session_status_success(client_instance):
@@ -36,10 +38,10 @@ async def test_get_session_status_success(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._get_session_status()
 
@@ -79,10 +81,10 @@ async def test_get_banking_brokerage_access_success(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._get_banking_brokerage_access()
 
@@ -122,10 +124,10 @@ async def test_refresh_access_token_success(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.refresh_access_token()
 
@@ -168,15 +170,15 @@ async def test_activate_session_tan_success(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.patch.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._activate_session_tan("challenge_123")
 
         assert result == mock_response_data
-        mock_http_client.patch.assert_called_once()
+        mock_http_client.request.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -193,13 +195,13 @@ async def test_wait_for_tan_confirmation_authenticated(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._wait_for_tan_confirmation(
-            "/api/session/v1/authentications/ABC123", max_attempts=1
+            "/api/session/v1/authentications/ABC123", policy=TanPollingPolicy(max_attempts=1)
         )
 
         assert result == mock_response_data
@@ -220,12 +222,13 @@ async def test_wait_for_tan_confirmation_timeout(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(TimeoutError, match="TAN confirmation timed out"):
             await client_instance._wait_for_tan_confirmation(
-                "/api/session/v1/authentications/ABC123", max_attempts=2, delay=0.1
+                "/api/session/v1/authentications/ABC123",
+                policy=TanPollingPolicy(max_attempts=2, first_delay=0.1),
             )
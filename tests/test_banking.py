@@ -7,6 +7,7 @@ Tests cover:
 - Automatic token refresh on expiry
 """
 
+import json
 import time
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -47,13 +48,14 @@ async def test_get_account_balances_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_account_balances()
 
@@ -103,21 +105,20 @@ async def test_get_account_balances_with_refresh(client_instance):
     mock_balances_response = MagicMock()
     mock_balances_response.status_code = 200
     mock_balances_response.json.return_value = mock_balances_data
+    mock_balances_response.content = json.dumps(mock_balances_data).encode()
     mock_balances_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_refresh_response
-    mock_http_client.get.return_value = mock_balances_response
+    mock_http_client.request.side_effect = [mock_refresh_response, mock_balances_response]
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         _ = await client_instance.get_account_balances()
 
-        # Verify token was refreshed
-        mock_http_client.post.assert_called_once()
-        # Verify balances were retrieved
-        mock_http_client.get.assert_called_once()
+        # Verify token was refreshed, then balances were retrieved
+        methods = [call.args[0] for call in mock_http_client.request.call_args_list]
+        assert methods == ["POST", "GET"]
 
 
 @pytest.mark.asyncio
@@ -152,13 +153,14 @@ async def test_get_account_transactions_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_account_transactions(
             account_id="account_123",
@@ -185,13 +187,14 @@ async def test_get_account_transactions_with_filters(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         _ = await client_instance.get_account_transactions(
             account_id="account_123",
@@ -202,7 +205,7 @@ async def test_get_account_transactions_with_filters(client_instance):
         )
 
         # Verify the request was made with correct parameters
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.request.call_args
         assert call_args.kwargs["params"]["transactionState"] == "NOTBOOKED"
         assert call_args.kwargs["params"]["transactionDirection"] == "CREDIT"
         assert call_args.kwargs["params"]["paging-first"] == 10
@@ -5,16 +5,21 @@ Tests cover:
 - Depot retrieval
 - Depot position retrieval (all and single)
 - Depot transaction retrieval
-- Instrument information retrieval
+- Instrument information retrieval (single and bulk)
 - Automatic token refresh on expiry
 """
 
+import asyncio
+import json
 import time
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from comdirect_api.cache import MemoryResponseCache
+
 
 @pytest.mark.asyncio
 async def test_get_account_depots_success(client_instance):
@@ -41,13 +46,14 @@ async def test_get_account_depots_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.text = json.dumps(mock_response_data)
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_account_depots()
 
@@ -96,13 +102,14 @@ async def test_get_depot_positions_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_depot_positions(depot_id="depot_123")
 
@@ -127,13 +134,14 @@ async def test_get_depot_positions_with_filters(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         _ = await client_instance.get_depot_positions(
             depot_id="depot_123",
@@ -143,7 +151,7 @@ async def test_get_depot_positions_with_filters(client_instance):
         )
 
         # Verify the request was made with correct parameters
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.request.call_args
         assert call_args.kwargs["params"]["instrumentId"] == "A1B2C3"
         assert call_args.kwargs["params"]["with-attr"] == "instrument"
         assert call_args.kwargs["params"]["without-attr"] == ["depot", "positions"]
@@ -167,13 +175,14 @@ async def test_get_depot_position_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_depot_position(
             depot_id="depot_123", position_id="pos_123"
@@ -216,13 +225,14 @@ async def test_get_depot_transactions_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_depot_transactions(depot_id="depot_123")
 
@@ -247,13 +257,14 @@ async def test_get_depot_transactions_with_filters(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         _ = await client_instance.get_depot_transactions(
             depot_id="depot_123",
@@ -264,7 +275,7 @@ async def test_get_depot_transactions_with_filters(client_instance):
         )
 
         # Verify the request was made with correct parameters
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.request.call_args
         assert call_args.kwargs["params"]["isin"] == "DE000A1B2C34"
         assert call_args.kwargs["params"]["wkn"] == "A1B2C3"
         assert call_args.kwargs["params"]["instrumentId"] == "inst_123"
@@ -298,13 +309,14 @@ async def test_get_instrument_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.text = json.dumps(mock_response_data)
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_instrument(instrument_id="A1B2C3")
 
@@ -329,13 +341,14 @@ async def test_get_instrument_with_attributes(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.text = json.dumps(mock_response_data)
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         _ = await client_instance.get_instrument(
             instrument_id="A1B2C3",
@@ -344,7 +357,7 @@ async def test_get_instrument_with_attributes(client_instance):
         )
 
         # Verify the request was made with correct parameters
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.request.call_args
         assert call_args.kwargs["params"]["with-attr"] == [
             "derivativeData",
             "fundDistribution",
@@ -352,6 +365,99 @@ async def test_get_instrument_with_attributes(client_instance):
         assert call_args.kwargs["params"]["without-attr"] == ["staticData"]
 
 
+def _instrument_http_client(unknown: set[str] = frozenset()) -> tuple[AsyncMock, dict]:
+    """Mock serving one instrument per URL; IDs in `unknown` answer 404."""
+    in_flight = {"now": 0, "max": 0}
+
+    async def request(method, url, **kwargs):
+        instrument_id = url.rsplit("/", 1)[1]
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.001)
+        in_flight["now"] -= 1
+
+        response = MagicMock()
+        if instrument_id in unknown:
+            response.status_code = 404
+            response.raise_for_status.side_effect = httpx.HTTPStatusError(
+                "404 Not Found", request=MagicMock(), response=response
+            )
+            return response
+        response.status_code = 200
+        response.text = json.dumps({
+            "paging": {"index": 0, "matches": 1},
+            "values": [{"wkn": instrument_id, "name": f"Name {instrument_id}"}],
+        })
+        response.raise_for_status.return_value = None
+        return response
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = request
+    return mock_http_client, in_flight
+
+
+@pytest.mark.asyncio
+async def test_get_instruments_dedupes_and_limits_concurrency(client_instance):
+    """Each distinct ID is fetched once, with at most `concurrency` lookups in flight."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.session_id = "session_123"
+    client_instance.token_expires_at = time.time() + 3600
+    ids = [f"WKN{n:03d}" for n in range(20)]
+    mock_http_client, in_flight = _instrument_http_client()
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        results = await client_instance.get_instruments(ids + ids[:5], concurrency=4)
+
+    assert list(results) == ids
+    assert all(results[wkn].values[0].wkn == wkn for wkn in ids)
+    assert mock_http_client.request.call_count == 20
+    assert in_flight["max"] == 4
+
+
+@pytest.mark.asyncio
+async def test_get_instruments_reports_errors_per_id(client_instance):
+    """A failing ID yields its exception while the others resolve."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.session_id = "session_123"
+    client_instance.token_expires_at = time.time() + 3600
+    mock_http_client, _ = _instrument_http_client(unknown={"BAD"})
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        results = await client_instance.get_instruments(["GOOD", "BAD"])
+
+    assert results["GOOD"].values[0].name == "Name GOOD"
+    assert isinstance(results["BAD"], httpx.HTTPStatusError)
+
+
+@pytest.mark.asyncio
+async def test_get_instruments_serves_cached_ids(client_instance):
+    """IDs already in the response cache are not requested again."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.session_id = "session_123"
+    client_instance.token_expires_at = time.time() + 3600
+    client_instance.cache = MemoryResponseCache()
+    mock_http_client, _ = _instrument_http_client()
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        await client_instance.get_instruments(["A", "B"])
+        results = await client_instance.get_instruments(["A", "B", "C"])
+
+    assert set(results) == {"A", "B", "C"}
+    assert mock_http_client.request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_instruments_no_token(client_instance):
+    """Missing banking access fails the whole batch up front."""
+    client_instance.banking_access_token = None
+
+    with pytest.raises(ValueError, match="No banking access token available"):
+        await client_instance.get_instruments(["A0B1C2"])
+
+
 @pytest.mark.asyncio
 async def test_get_depot_positions_no_token(client_instance):
     """Test depot position retrieval without banking token."""
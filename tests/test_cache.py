@@ -0,0 +1,147 @@
+"""Tests for the response cache and its use by ComdirectClient."""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from comdirect_api.cache import DiskResponseCache, MemoryResponseCache
+from comdirect_api.client import ComdirectClient
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_counts_hits_and_misses():
+    """Lookups of cacheable endpoints are counted; uncached endpoints are ignored."""
+    cache = MemoryResponseCache()
+
+    assert await cache.get("instrument", "k") is None
+    await cache.set("instrument", "k", {"v": 1})
+    assert await cache.get("instrument", "k") == {"v": 1}
+
+    await cache.set("account_balances", "k", {"v": 2})  # no TTL configured
+    assert await cache.get("account_balances", "k") is None
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_entries():
+    """Entries disappear once their endpoint TTL has passed."""
+    cache = MemoryResponseCache(ttls={"instrument": 10})
+    with patch("comdirect_api.cache.time.monotonic", return_value=1000.0):
+        await cache.set("instrument", "k", {"v": 1})
+    with patch("comdirect_api.cache.time.monotonic", return_value=1010.0):
+        assert await cache.get("instrument", "k") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    """Beyond max_entries the least recently used entry is dropped."""
+    cache = MemoryResponseCache(max_entries=2)
+    await cache.set("instrument", "a", 1)
+    await cache.set("instrument", "b", 2)
+    await cache.get("instrument", "a")  # b is now least recently used
+    await cache.set("instrument", "c", 3)
+
+    assert await cache.get("instrument", "b") is None
+    assert await cache.get("instrument", "a") == 1
+    assert await cache.get("instrument", "c") == 3
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_invalidate_by_endpoint():
+    """Invalidation can target a single endpoint or everything."""
+    cache = MemoryResponseCache()
+    await cache.set("instrument", "k", 1)
+    await cache.set("account_depots", "k", 2)
+
+    await cache.invalidate("instrument")
+    assert await cache.get("instrument", "k") is None
+    assert await cache.get("account_depots", "k") == 2
+
+    await cache.invalidate()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_survives_new_instance(tmp_path):
+    """The SQLite backend keeps entries across instances until they expire."""
+    path = tmp_path / "responses.sqlite"
+    await DiskResponseCache(path).set("instrument", "k", {"v": [1, 2]})
+
+    cache = DiskResponseCache(path)
+    assert await cache.get("instrument", "k") == {"v": [1, 2]}
+
+    await cache.invalidate("instrument")
+    assert await cache.get("instrument", "k") is None
+
+    expired = DiskResponseCache(path, ttls={"instrument": 1})
+    await expired.set("instrument", "old", 1)
+    with patch("comdirect_api.cache.time.time", return_value=time.time() + 2):
+        assert await expired.get("instrument", "old") is None
+
+
+def _client(creds, cache, zugangsnummer="user") -> ComdirectClient:
+    client = ComdirectClient(
+        client_id=creds["client_id"],
+        client_secret=creds["client_secret"],
+        zugangsnummer=zugangsnummer,
+        pin=creds["password"],
+        cache=cache,
+    )
+    client.banking_access_token = "banking_token"
+    client.session_id = "session_123"
+    client.token_expires_at = time.time() + 3600
+    return client
+
+
+def _json_response(data: dict) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.text = json.dumps(data)
+    response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.mark.asyncio
+async def test_get_instrument_is_served_from_cache(creds):
+    """Repeated instrument lookups send one request, shared across logins."""
+    cache = MemoryResponseCache()
+    first, second = _client(creds, cache, "user_a"), _client(creds, cache, "user_b")
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _json_response(
+        {"paging": {"index": 0, "matches": 1}, "values": [{"wkn": "A0B1C2"}]}
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        await first.get_instrument("A0B1C2", with_attr=["staticData"])
+        result = await second.get_instrument("A0B1C2", with_attr=["staticData"])
+        await first.get_instrument("A0B1C2")  # different params: separate entry
+
+    assert result.values[0].wkn == "A0B1C2"
+    assert mock_http_client.request.call_count == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_get_account_depots_cache_is_per_login(creds):
+    """The depot list is cached per login and refetched after invalidation."""
+    cache = MemoryResponseCache()
+    first, second = _client(creds, cache, "user_a"), _client(creds, cache, "user_b")
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _json_response(
+        {"paging": {"index": 0, "matches": 0}, "values": []}
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        await first.get_account_depots()
+        await first.get_account_depots()
+        await second.get_account_depots()
+        await first.invalidate_cache("account_depots")
+        await first.get_account_depots()
+
+    assert mock_http_client.request.call_count == 3
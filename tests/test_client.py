@@ -22,7 +22,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
-from comdirect_api.client import ComdirectClient
+from comdirect_api.client import ComdirectClient, _adapter
+from comdirect_api.models import DepotPositions
 
 
 @pytest.mark.asyncio
@@ -45,10 +46,10 @@ async def test_authenticate_success(client_instance, creds):
 
     # Mock the HTTP client
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         # Call the authenticate method
         result = await client_instance._authenticate(
@@ -63,7 +64,8 @@ async def test_authenticate_success(client_instance, creds):
         assert client_instance.scope == "read write"
 
         # Verify the HTTP call was made correctly
-        mock_http_client.post.assert_called_once_with(
+        mock_http_client.request.assert_called_once_with(
+            "POST",
             "https://api.comdirect.de/oauth/token",
             headers={
                 "Accept": "application/json",
@@ -93,10 +95,10 @@ async def test_authenticate_http_error(client_instance, creds):
 
     # Mock the HTTP client
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         # Call authenticate and expect it to raise an exception
         with pytest.raises(httpx.HTTPStatusError):
@@ -123,10 +125,10 @@ async def test_authenticate_invalid_credentials(client_instance, creds):
 
     # Mock the HTTP client
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         # Call authenticate and expect it to raise an exception
         with pytest.raises(httpx.HTTPStatusError):
@@ -138,15 +140,20 @@ async def test_authenticate_network_error(client_instance, creds):
     """Test authentication with network connectivity issues."""
     # Mock the HTTP client to raise a network error
     mock_http_client = AsyncMock()
-    mock_http_client.post.side_effect = httpx.ConnectError("Connection failed")
+    mock_http_client.request.side_effect = httpx.ConnectError("Connection failed")
 
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ):
+        mock_client_class.return_value = mock_http_client
 
-        # Call authenticate and expect it to raise a ConnectError
+        # Call authenticate and expect it to raise a ConnectError once retries run out
         with pytest.raises(httpx.ConnectError):
             await client_instance._authenticate(creds["username"], creds["password"])
 
+        # Initial attempt plus the default policy's connect retries
+        assert mock_http_client.request.call_count == 4
+
 
 @pytest.mark.asyncio
 async def test_authenticate_missing_tokens_in_response(client_instance, creds):
@@ -165,10 +172,10 @@ async def test_authenticate_missing_tokens_in_response(client_instance, creds):
 
     # Mock the HTTP client
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         # Call authenticate and expect ValidationError for missing required fields
         from pydantic import ValidationError
@@ -188,10 +195,10 @@ async def test_authenticate_malformed_json_response(client_instance, creds):
 
     # Mock the HTTP client
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         # Call authenticate and expect it to raise a JSONDecodeError
         with pytest.raises(json.JSONDecodeError):
@@ -215,10 +222,10 @@ async def test_authenticate_token_expiration_calculation(client_instance, creds)
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         # Record time before call
         before_time = time.time()
@@ -249,12 +256,12 @@ async def test_authenticate_debug_output_on_error(client_instance, creds):
     )
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class, patch(
         "comdirect_api.client.logger"
     ) as mock_logger:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         # Call authenticate and expect it to raise an exception
         with pytest.raises(httpx.HTTPStatusError):
@@ -294,16 +301,63 @@ async def test_authenticate_with_empty_credentials(client_instance):
     )
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(httpx.HTTPStatusError):
             await client_instance._authenticate("", "")
 
         # Verify the call was made with empty credentials
-        mock_http_client.post.assert_called_once()
-        call_args = mock_http_client.post.call_args
+        mock_http_client.request.assert_called_once()
+        call_args = mock_http_client.request.call_args
         assert call_args[1]["data"]["username"] == ""
         assert call_args[1]["data"]["password"] == ""
+
+
+def test_request_headers_match_json_layout(client_instance):
+    """The pre-serialized x-http-request-info is valid JSON with session and request ID."""
+    client_instance.session_id = "session_123"
+
+    headers = client_instance._request_headers("token", extra={"x-extra": "1"})
+
+    info = json.loads(headers["x-http-request-info"])
+    assert info["clientRequestId"]["sessionId"] == "session_123"
+    assert len(info["clientRequestId"]["requestId"]) == 20
+    assert headers["Authorization"] == "Bearer token"
+    assert headers["x-extra"] == "1"
+
+
+def test_request_headers_template_follows_token_and_session(client_instance):
+    """A new token or session ID rebuilds the cached template; calls get fresh IDs."""
+    client_instance.session_id = "session_a"
+    first = client_instance._request_headers("token_a")
+    second = client_instance._request_headers("token_a")
+    assert first["x-http-request-info"] != second["x-http-request-info"]
+
+    client_instance.session_id = "session_b"
+    third = client_instance._request_headers("token_b")
+
+    info = json.loads(third["x-http-request-info"])
+    assert info["clientRequestId"]["sessionId"] == "session_b"
+    assert third["Authorization"] == "Bearer token_b"
+    # Callers may mutate the returned dict without touching the template
+    third["Authorization"] = "changed"
+    assert client_instance._request_headers("token_b")["Authorization"] == "Bearer token_b"
+
+
+def test_parse_validates_raw_response_bytes(client_instance):
+    """Responses are parsed from bytes with one cached TypeAdapter per model."""
+    body = (
+        b'{"paging": {"index": 0, "matches": 1},'
+        b' "values": [{"positionId": "pos_1",'
+        b' "currentValue": {"value": "5000.00", "unit": "EUR"}}]}'
+    )
+
+    result = client_instance._parse(DepotPositions, body)
+
+    assert isinstance(result, DepotPositions)
+    assert result.values[0].position_id == "pos_1"
+    assert str(result.values[0].current_value.value) == "5000.00"
+    assert _adapter(DepotPositions) is _adapter(DepotPositions)
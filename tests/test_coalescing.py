@@ -0,0 +1,185 @@
+"""Tests for coalescing identical in-flight GET requests."""
+
+import asyncio
+import gc
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+
+def _slow_http_client(data: dict) -> AsyncMock:
+    async def request(method, url, **kwargs):
+        await asyncio.sleep(0.01)
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = data
+        response.content = json.dumps(data).encode()
+        response.text = json.dumps(data)
+        response.raise_for_status.return_value = None
+        return response
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = request
+    return mock_http_client
+
+
+@pytest.fixture
+def banking_client(client_instance):
+    client_instance.banking_access_token = "banking_token"
+    client_instance.session_id = "session_123"
+    client_instance.token_expires_at = time.time() + 3600
+    return client_instance
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_share_one_request(banking_client):
+    """Concurrent identical calls send one request and all get the result."""
+    mock_http_client = _slow_http_client({"paging": {"index": 0, "matches": 0}, "values": []})
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        results = await asyncio.gather(
+            *(banking_client.get_depot_positions("depot_1") for _ in range(10))
+        )
+
+    assert len(results) == 10
+    assert mock_http_client.request.call_count == 1
+    assert banking_client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_different_params_are_not_coalesced(banking_client):
+    """Requests that differ in URL or params are sent separately."""
+    mock_http_client = _slow_http_client({"paging": {"index": 0, "matches": 0}, "values": []})
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        await asyncio.gather(
+            banking_client.get_depot_positions("depot_1"),
+            banking_client.get_depot_positions("depot_2"),
+            banking_client.get_instrument("A0B1C2"),
+            banking_client.get_instrument("A0B1C2", with_attr=["staticData"]),
+        )
+
+    assert mock_http_client.request.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_sequential_gets_are_not_coalesced(banking_client):
+    """Only in-flight requests are shared; a later call sends a new request."""
+    mock_http_client = _slow_http_client({"paging": {"index": 0, "matches": 0}, "values": []})
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        await banking_client.get_depot_positions("depot_1")
+        await banking_client.get_depot_positions("depot_1")
+
+    assert mock_http_client.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_non_get_requests_are_not_coalesced(banking_client):
+    """POSTs are never shared, even with identical arguments."""
+    mock_http_client = _slow_http_client({})
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        await asyncio.gather(
+            banking_client._request("POST", "https://example.test/x", json={}),
+            banking_client._request("POST", "https://example.test/x", json={}),
+        )
+
+    assert mock_http_client.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_error_reaches_every_caller(banking_client):
+    """A failed shared request raises in every waiting caller."""
+
+    async def request(method, url, **kwargs):
+        await asyncio.sleep(0.01)
+        raise httpx.ReadTimeout("timeout")
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = request
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        results = await asyncio.gather(
+            *(banking_client.get_depot_positions("depot_1") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, httpx.ReadTimeout) for result in results)
+    assert mock_http_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request(banking_client):
+    """Cancelling one waiter leaves the request running for the others."""
+    mock_http_client = _slow_http_client({"paging": {"index": 0, "matches": 0}, "values": []})
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        first = asyncio.create_task(banking_client.get_depot_positions("depot_1"))
+        second = asyncio.create_task(banking_client.get_depot_positions("depot_1"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+
+    assert result.values == []
+    assert mock_http_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_request_without_waiters_is_not_reported(banking_client):
+    """A shared request that fails after every waiter was cancelled logs nothing."""
+    loop = asyncio.get_running_loop()
+    reported = []
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+
+    async def request(method, url, **kwargs):
+        await asyncio.sleep(0.01)
+        raise httpx.ReadTimeout("timeout")
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = request
+
+    try:
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value = mock_http_client
+            waiter = asyncio.create_task(banking_client.get_depot_positions("depot_1"))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            del waiter
+            await asyncio.sleep(0.02)  # the shared request fails with nobody waiting
+            gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert reported == []
+    assert banking_client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_inflight_requests(banking_client):
+    """aclose() cancels shared requests that are still running."""
+    mock_http_client = _slow_http_client({"paging": {"index": 0, "matches": 0}, "values": []})
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        waiter = asyncio.create_task(banking_client.get_depot_positions("depot_1"))
+        await asyncio.sleep(0)
+        (shared,) = banking_client._inflight.values()
+
+        await banking_client.aclose()
+
+    assert shared.cancelled()
+    assert banking_client._inflight == {}
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
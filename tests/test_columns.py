@@ -0,0 +1,108 @@
+"""Tests for the columnar export of list models."""
+
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from comdirect_api.models import AccountTransactions, DepotPositions, DepotTransactions, Orders
+
+from .test_lazy import POSITIONS
+
+DEPOT_TRANSACTIONS = {
+    "paging": {},
+    "values": [
+        {
+            "transactionId": "tx_1",
+            "bookingDate": "2026-03-02",
+            "settlementDate": "2026-03-04T10:00:00+01:00",
+            "instrument": {"wkn": "A1B2C3", "isin": "DE000A1B2C33"},
+            "transactionType": "BUY",
+            "quantity": {"value": "10", "unit": "XXX"},
+            "executionPrice": {"value": "50.123456", "unit": "EUR"},
+        },
+        {"transactionId": "tx_2", "transactionType": "BUY"},
+    ],
+}
+
+
+def test_to_arrow_builds_typed_columns():
+    """Amounts are decimal128, dates date32/timestamps and categories dictionary-encoded."""
+    table = DepotTransactions.model_validate(DEPOT_TRANSACTIONS).to_arrow()
+
+    assert table.num_rows == 2
+    assert table.schema.field("execution_price").type == pa.decimal128(38, 6)
+    assert table.schema.field("booking_date").type == pa.date32()
+    assert table.schema.field("settlement_date").type == pa.timestamp("us", tz="UTC")
+    assert pa.types.is_dictionary(table.schema.field("isin").type)
+    assert pa.types.is_dictionary(table.schema.field("execution_price_unit").type)
+
+    rows = table.to_pylist()
+    assert rows[0]["execution_price"] == Decimal("50.123456")
+    assert rows[0]["isin"] == "DE000A1B2C33"  # read from the untyped instrument dict
+    assert rows[0]["settlement_date"].hour == 9  # converted to UTC
+    assert rows[1]["quantity"] is None
+    assert table.column("transaction_type").to_pylist() == ["BUY", "BUY"]
+
+
+def test_to_columns_uses_fixed_point_and_masks():
+    """NumPy amounts are int64 fixed-point; missing values are masked or NaT."""
+    columns = DepotTransactions.model_validate(DEPOT_TRANSACTIONS).to_columns()
+
+    price = columns["execution_price"]
+    assert price.dtype == np.int64
+    assert price[0] == 50_123_456
+    assert price.mask.tolist() == [False, True]
+    assert columns["booking_date"][0] == np.datetime64("2026-03-02")
+    assert np.isnat(columns["booking_date"][1])
+    assert columns["wkn"].tolist() == ["A1B2C3", None]
+
+
+def test_position_columns_follow_nested_paths():
+    """Nested attributes (instrument.isin, current_price.price) become flat columns."""
+    columns = DepotPositions.model_validate(POSITIONS).to_columns()
+
+    assert columns["position_id"].tolist() == ["pos_1"]
+    assert columns["current_price"][0] == 50_250_000
+    assert columns["current_price_unit"].tolist() == ["EUR"]
+    assert columns["profit_loss_purchase_rel"][0] == 17_520_000
+    assert columns["current_value"].sum() == 502_500_000
+
+
+def test_account_transaction_and_order_columns():
+    """Account transactions and orders export their own column sets."""
+    transactions = AccountTransactions.model_validate(
+        {
+            "paging": {},
+            "values": [
+                {
+                    "bookingDate": "2026-02-20",
+                    "valutaDate": "not a date",
+                    "amount": {"value": "-12.5", "unit": "EUR"},
+                    "transactionType": {"key": "DIRECT_DEBIT", "text": "Lastschrift"},
+                    "newTransaction": True,
+                }
+            ],
+        }
+    ).to_arrow()
+    row = transactions.to_pylist()[0]
+    assert row["booking_date"] == date(2026, 2, 20)
+    assert row["valuta_date"] is None  # free text is not a date
+    assert row["transaction_type"] == "DIRECT_DEBIT"
+    assert row["new_transaction"] is True
+
+    orders = Orders(values=[{"orderId": "o1", "limit": {"value": "12.5", "unit": "EUR"}}])
+    assert orders.to_columns()["limit"][0] == 12_500_000
+    assert Orders().to_arrow().num_rows == 0
+
+
+def test_to_columns_rejects_excess_precision():
+    """Amounts with more than six decimal places are not silently rounded."""
+    orders = Orders(values=[{"limit": {"value": "1.0000001", "unit": "EUR"}}])
+
+    with pytest.raises(ValueError, match="more than 6 decimal places"):
+        orders.to_columns()
+    with pytest.raises(ValueError):
+        orders.to_arrow()
@@ -0,0 +1,139 @@
+"""Tests for the shared, pooled httpx.AsyncClient owned by ComdirectClient."""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from comdirect_api.client import ComdirectClient
+
+
+def _ok_response(data: dict) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = data
+    response.content = json.dumps(data).encode()
+    response.text = json.dumps(data)
+    response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.mark.asyncio
+async def test_pool_is_reused_across_calls(client_instance):
+    """Several API calls share a single httpx.AsyncClient instance."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.session_id = "session_123"
+    client_instance.token_expires_at = time.time() + 3600
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _ok_response(
+        {"paging": {"index": 0, "matches": 0}, "values": []}
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        await client_instance.get_account_balances()
+        await client_instance.get_account_depots()
+        await client_instance.get_account_balances()
+
+        mock_client_class.assert_called_once()
+        assert mock_http_client.request.call_count == 3
+
+
+def test_pool_uses_configured_limits_and_timeout(creds):
+    """Custom limits and timeout are passed to the pooled client."""
+    limits = httpx.Limits(max_connections=3, keepalive_expiry=5.0)
+    timeout = httpx.Timeout(7.0)
+    client = ComdirectClient(
+        client_id=creds["client_id"],
+        client_secret=creds["client_secret"],
+        zugangsnummer=creds["username"],
+        pin=creds["password"],
+        limits=limits,
+        timeout=timeout,
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        client._http_client()
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["limits"] is limits
+        assert kwargs["timeout"] is timeout
+        assert kwargs["http2"] is False
+        assert kwargs["follow_redirects"] is False
+
+
+def test_pool_http2_opt_in(creds):
+    """http2=True is forwarded to the pooled client."""
+    client = ComdirectClient(
+        client_id=creds["client_id"],
+        client_secret=creds["client_secret"],
+        zugangsnummer=creds["username"],
+        pin=creds["password"],
+        http2=True,
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        client._http_client()
+
+        assert mock_client_class.call_args.kwargs["http2"] is True
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_pool_and_is_idempotent(client_instance):
+    """aclose() closes the pool once and a later call opens a fresh one."""
+    mock_http_client = AsyncMock()
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        client_instance._http_client()
+
+        await client_instance.aclose()
+        await client_instance.aclose()
+
+        mock_http_client.aclose.assert_awaited_once()
+        assert client_instance._http is None
+
+        client_instance._http_client()
+        assert mock_client_class.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_pool(client_instance):
+    """Leaving the async with block closes the pool."""
+    mock_http_client = AsyncMock()
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        async with client_instance as client:
+            assert client is client_instance
+            client._http_client()
+
+        mock_http_client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_closes_pool_when_authentication_fails():
+    """A failed authentication flow does not leak the connection pool."""
+    mock_http_client = AsyncMock()
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch.object(
+        ComdirectClient, "_initialize", new_callable=AsyncMock
+    ) as mock_init:
+        mock_client_class.return_value = mock_http_client
+        mock_init.side_effect = ValueError("TAN rejected")
+
+        with pytest.raises(ValueError, match="TAN rejected"):
+            await ComdirectClient.create(
+                client_id="test_id",
+                client_secret="test_secret",
+                zugangsnummer="test_user",
+                pin="test_pin",
+            )
+
+        mock_client_class.assert_called_once()
+        mock_http_client.aclose.assert_awaited_once()
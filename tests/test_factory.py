@@ -1,6 +1,9 @@
 """Tests for factory method and initialization."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import time
+from contextlib import aclosing
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -74,3 +77,77 @@ async def test_initialize_calls_auth_flow_in_order():
         assert mock_session.await_count == 1
         assert mock_tan.await_count == 1
         assert mock_banking.await_count == 1
+
+
+def _fake_create(delays: dict[str, float], failing: str | None = None):
+    """Build a create() stand-in whose TAN approval takes delays[zugangsnummer] seconds."""
+    created: list[MagicMock] = []
+
+    async def create(zugangsnummer: str, pin: str, **kwargs):
+        await asyncio.sleep(delays[zugangsnummer])
+        if zugangsnummer == failing:
+            raise ValueError("TAN rejected")
+        client = MagicMock(spec=ComdirectClient)
+        client.zugangsnummer = zugangsnummer
+        client.create_kwargs = kwargs
+        created.append(client)
+        return client
+
+    return create, created
+
+
+@pytest.mark.asyncio
+async def test_authenticate_many_yields_in_approval_order():
+    """Clients are yielded as soon as their TAN is approved, not in input order."""
+    create, _ = _fake_create({"slow": 0.1, "fast": 0.0, "medium": 0.05})
+    credentials = {"A": ("slow", "pin"), "B": ("fast", "pin"), "C": ("medium", "pin")}
+    limiter = object()
+
+    with patch.object(ComdirectClient, "create", side_effect=create):
+        start = time.perf_counter()
+        results = [
+            (name, client)
+            async for name, client in ComdirectClient.authenticate_many(
+                credentials, rate_limiter=limiter
+            )
+        ]
+        elapsed = time.perf_counter() - start
+
+    assert [name for name, _ in results] == ["B", "C", "A"]
+    assert all(client.create_kwargs == {"rate_limiter": limiter} for _, client in results)
+    # Concurrent: roughly the longest wait, not the sum
+    assert elapsed < 0.14
+
+
+@pytest.mark.asyncio
+async def test_authenticate_many_failure_cancels_and_closes_the_rest():
+    """A failing login raises; pending logins are cancelled, yielded ones are kept."""
+    create, created = _fake_create({"ok": 0.0, "bad": 0.01, "pending": 1.0}, failing="bad")
+    credentials = {"A": ("ok", "pin"), "B": ("bad", "pin"), "C": ("pending", "pin")}
+
+    yielded = []
+    with patch.object(ComdirectClient, "create", side_effect=create):
+        with pytest.raises(ValueError, match="TAN rejected"):
+            async for name, _client in ComdirectClient.authenticate_many(credentials):
+                yielded.append(name)
+
+    assert yielded == ["A"]
+    assert [client.zugangsnummer for client in created] == ["ok"]
+    created[0].aclose.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_authenticate_many_closes_unyielded_clients_on_early_exit():
+    """Breaking out early closes clients that were authenticated but not yet yielded."""
+    create, created = _fake_create({"first": 0.0, "second": 0.01})
+    credentials = {"A": ("first", "pin"), "B": ("second", "pin")}
+
+    with patch.object(ComdirectClient, "create", side_effect=create):
+        async with aclosing(ComdirectClient.authenticate_many(credentials)) as authenticated:
+            async for _name, _client in authenticated:
+                await asyncio.sleep(0.02)  # let the second login finish meanwhile
+                break
+
+    first, second = created
+    first.aclose.assert_not_called()
+    second.aclose.assert_awaited_once()
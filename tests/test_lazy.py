@@ -0,0 +1,101 @@
+"""Tests for lazy response models."""
+
+import json
+import time
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from comdirect_api.models import DepotPositions, DepotTransactions, LazyModel
+from comdirect_api.models.instruments import Instrument
+
+POSITIONS = {
+    "paging": {"index": 0, "matches": 1},
+    "values": [
+        {
+            "positionId": "pos_1",
+            "wkn": "A1B2C3",
+            "quantity": {"value": "10", "unit": "XXX"},
+            "currentPrice": {
+                "price": {"value": "50.25", "unit": "EUR"},
+                "priceDateTime": "2026-10-16T17:35:00+02:00",
+            },
+            "currentValue": {"value": 502.5, "unit": "EUR"},
+            "profitLossPurchaseRel": "17.52",
+            "instrument": {"wkn": "A1B2C3", "name": "Example AG"},
+            "purchasePrice": None,
+        }
+    ],
+}
+
+
+def test_lazy_model_builds_fields_on_access():
+    """Nested models are validated when read and cached afterwards."""
+    lazy = LazyModel(DepotPositions, json.loads(json.dumps(POSITIONS)))
+
+    position = lazy.values[0]
+    assert isinstance(position, LazyModel)
+    assert "instrument" not in position.__dict__
+    assert position.position_id == "pos_1"
+    assert position.quantity.value == Decimal("10")
+    assert isinstance(position.instrument, Instrument)
+    assert position.instrument is position.instrument
+    assert position.current_price.price.value == Decimal("50.25")
+    assert position.purchase_price is None
+    assert position.available_quantity is None  # missing key -> field default
+    assert "current_value" not in position.__dict__
+
+
+def test_lazy_model_materialize_matches_validation():
+    """materialize() returns the same model as eager parsing."""
+    expected = DepotPositions.model_validate(POSITIONS).model_dump()
+
+    assert LazyModel(DepotPositions, POSITIONS).materialize().model_dump() == expected
+
+
+def test_lazy_model_missing_required_field():
+    """A required field that is absent raises ValidationError like eager parsing."""
+    lazy = LazyModel(DepotPositions, {"paging": {}})
+
+    with pytest.raises(ValidationError, match="values"):
+        lazy.values  # noqa: B018
+
+
+def test_lazy_model_forwards_other_attributes():
+    """Non-field attributes are looked up on the materialized model."""
+    lazy = LazyModel(DepotTransactions, {"paging": {"index": 0, "matches": 0}, "values": []})
+
+    assert lazy.values == []
+    assert lazy.model_dump()["values"] == []
+    assert lazy.__dict__["__model__"] is not None  # built once, then reused
+    with pytest.raises(AttributeError, match="nope"):
+        lazy.nope  # noqa: B018
+
+
+@pytest.mark.asyncio
+async def test_get_depot_positions_lazy(client_instance):
+    """lazy=True returns a LazyModel over the response body."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.session_id = "session_123"
+    client_instance.token_expires_at = time.time() + 3600
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps(POSITIONS).encode()
+    mock_response.raise_for_status.return_value = None
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = mock_response
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        result = await client_instance.get_depot_positions("depot_123", lazy=True)
+
+        assert isinstance(result, LazyModel)
+        assert result.values[0].instrument.name == "Example AG"
+
+        columns = result.to_columns()
+        assert list(columns["position_id"]) == ["pos_1"]
@@ -5,12 +5,17 @@ Tests cover:
 - Document list retrieval with pagination
 - Document download
 - Predocument download
+- Streaming downloads to files and writers, including resume
 - Error handling for missing tokens
 """
 
+import hashlib
+import json
 import time
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 
@@ -57,13 +62,14 @@ async def test_get_documents_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_documents()
 
@@ -93,20 +99,21 @@ async def test_get_documents_with_pagination(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         _ = await client_instance.get_documents(
             paging_first=10, paging_count=50
         )
 
         # Verify the request was made with correct parameters
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.request.call_args
         assert call_args.kwargs["params"]["paging-first"] == 10
         assert call_args.kwargs["params"]["paging-count"] == 50
 
@@ -123,18 +130,19 @@ async def test_get_documents_max_count_limit(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         await client_instance.get_documents(paging_count=5000)
 
         # Verify the count was capped at 1000
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.request.call_args
         assert call_args.kwargs["params"]["paging-count"] == 1000
 
 
@@ -164,10 +172,10 @@ async def test_get_document_success(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_document("doc_123")
 
@@ -200,10 +208,10 @@ async def test_get_predocument_success(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_predocument("doc_456")
 
@@ -246,18 +254,185 @@ async def test_get_documents_with_token_refresh(client_instance):
     mock_documents_response = MagicMock()
     mock_documents_response.status_code = 200
     mock_documents_response.json.return_value = mock_documents_data
+    mock_documents_response.content = json.dumps(mock_documents_data).encode()
     mock_documents_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_refresh_response
-    mock_http_client.get.return_value = mock_documents_response
+    mock_http_client.request.side_effect = [mock_refresh_response, mock_documents_response]
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         _ = await client_instance.get_documents()
 
-        # Verify refresh was called
-        mock_http_client.post.assert_called_once()
-        # Verify documents endpoint was called
-        mock_http_client.get.assert_called_once()
+        # Verify refresh was called, then the documents endpoint
+        methods = [call.args[0] for call in mock_http_client.request.call_args_list]
+        assert methods == ["POST", "GET"]
+
+
+def _stream_response(body: bytes, status_code: int = 200, headers: dict | None = None):
+    """Build a streamed response mock yielding `body` in small chunks."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"content-type": "application/pdf", **(headers or {})}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "error", request=MagicMock(), response=response
+        )
+    else:
+        response.raise_for_status.return_value = None
+
+    async def aiter_bytes(chunk_size=None):
+        for i in range(0, len(body), 4):
+            yield body[i:i + 4]
+
+    response.aiter_bytes = aiter_bytes
+    return response
+
+
+def _streaming_http_client(*responses):
+    """Mock HTTP client whose stream() serves `responses` in order, recording headers."""
+    mock_http_client = AsyncMock()
+    pending = list(responses)
+    sent_headers = []
+
+    @asynccontextmanager
+    async def stream(method, url, headers=None):
+        sent_headers.append(headers)
+        yield pending.pop(0)
+
+    mock_http_client.stream = MagicMock(side_effect=stream)
+    return mock_http_client, sent_headers
+
+
+@pytest.mark.asyncio
+async def test_download_document_to_path(client_instance, tmp_path):
+    """Test streaming a document to a file computes size, hash and content type."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.token_expires_at = time.time() + 3600
+    body = b"%PDF-1.4\n%mock pdf content"
+    mock_http_client, sent_headers = _streaming_http_client(_stream_response(body))
+    target = tmp_path / "statement.pdf"
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        result = await client_instance.download_document("doc_123", target)
+
+    assert target.read_bytes() == body
+    assert not (tmp_path / "statement.pdf.part").exists()
+    assert result.size == len(body)
+    assert result.sha256 == hashlib.sha256(body).hexdigest()
+    assert result.content_type == "application/pdf"
+    assert result.path == target
+    assert result.resumed_from == 0
+    assert "Range" not in sent_headers[0]
+    mock_http_client.request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_download_predocument_to_writer(client_instance):
+    """Test streaming a predocument to an async writer."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.token_expires_at = time.time() + 3600
+    body = b"<html><body>Predocument preview</body></html>"
+    mock_http_client, _ = _streaming_http_client(
+        _stream_response(body, headers={"content-type": "text/html"})
+    )
+    chunks = []
+
+    class Writer:
+        async def write(self, data):
+            chunks.append(data)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        result = await client_instance.download_predocument("doc_456", Writer())
+
+    assert b"".join(chunks) == body
+    assert len(chunks) > 1
+    assert result.size == len(body)
+    assert result.sha256 == hashlib.sha256(body).hexdigest()
+    assert result.content_type == "text/html"
+    assert result.path is None
+    url = mock_http_client.stream.call_args.args[1]
+    assert url.endswith("/messages/v2/documents/doc_456/predocument")
+
+
+@pytest.mark.asyncio
+async def test_download_document_resumes_partial_file(client_instance, tmp_path):
+    """Test a partial download is continued with a Range request."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.token_expires_at = time.time() + 3600
+    body = b"%PDF-1.4\n%mock pdf content"
+    target = tmp_path / "statement.pdf"
+    (tmp_path / "statement.pdf.part").write_bytes(body[:10])
+    mock_http_client, sent_headers = _streaming_http_client(
+        _stream_response(
+            body[10:], 206, {"content-range": f"bytes 10-{len(body) - 1}/{len(body)}"}
+        )
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        result = await client_instance.download_document("doc_123", target)
+
+    assert sent_headers[0]["Range"] == "bytes=10-"
+    assert target.read_bytes() == body
+    assert result.size == len(body)
+    assert result.sha256 == hashlib.sha256(body).hexdigest()
+    assert result.resumed_from == 10
+
+
+@pytest.mark.asyncio
+async def test_download_document_restarts_when_range_ignored(client_instance, tmp_path):
+    """Test a full 200 response to a Range request overwrites the partial file."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.token_expires_at = time.time() + 3600
+    body = b"%PDF-1.4\n%mock pdf content"
+    target = tmp_path / "statement.pdf"
+    (tmp_path / "statement.pdf.part").write_bytes(b"stale bytes")
+    mock_http_client, _ = _streaming_http_client(_stream_response(body))
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        result = await client_instance.download_document("doc_123", target)
+
+    assert target.read_bytes() == body
+    assert result.sha256 == hashlib.sha256(body).hexdigest()
+    assert result.resumed_from == 0
+
+
+@pytest.mark.asyncio
+async def test_download_document_restarts_after_416(client_instance, tmp_path):
+    """Test an unsatisfiable range falls back to a full download."""
+    client_instance.banking_access_token = "banking_token"
+    client_instance.token_expires_at = time.time() + 3600
+    body = b"%PDF-1.4\n%mock pdf content"
+    target = tmp_path / "statement.pdf"
+    (tmp_path / "statement.pdf.part").write_bytes(body + b"extra")
+    mock_http_client, sent_headers = _streaming_http_client(
+        _stream_response(b"", 416), _stream_response(body)
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        result = await client_instance.download_document("doc_123", target)
+
+    assert "Range" in sent_headers[0]
+    assert "Range" not in sent_headers[1]
+    assert target.read_bytes() == body
+    assert result.size == len(body)
+
+
+@pytest.mark.asyncio
+async def test_download_document_no_token(client_instance, tmp_path):
+    """Test streaming download without banking token."""
+    client_instance.banking_access_token = None
+
+    with pytest.raises(ValueError, match="No banking access token available"):
+        await client_instance.download_document("doc_123", tmp_path / "doc.pdf")
@@ -8,6 +8,7 @@ Tests cover:
 - Missing token validation
 """
 
+import json
 import time
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -58,13 +59,14 @@ async def test_get_depot_orders_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = SAMPLE_ORDERS_LIST
+    mock_response.content = json.dumps(SAMPLE_ORDERS_LIST).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_depot_orders(depot_id="depot_123")
 
@@ -89,13 +91,14 @@ async def test_get_depot_orders_empty(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"paging": {"index": 0, "matches": 0}, "values": []}
+    mock_response.content = b'{"paging": {"index": 0, "matches": 0}, "values": []}'
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_depot_orders(depot_id="depot_123")
 
@@ -112,13 +115,14 @@ async def test_get_depot_orders_with_filters(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"paging": {"index": 0, "matches": 0}, "values": []}
+    mock_response.content = b'{"paging": {"index": 0, "matches": 0}, "values": []}'
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_depot_orders(  # noqa: F841
             depot_id="depot_123",
@@ -134,7 +138,7 @@ async def test_get_depot_orders_with_filters(client_instance):
             max_creation_timestamp="2026-03-31T23:59:59,999999+01",
         )
 
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.request.call_args
         params = call_args.kwargs["params"]
         assert params["with-attr"] == "instrument"
         assert params["without-attr"] == "executions"
@@ -158,18 +162,19 @@ async def test_get_depot_orders_url(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"paging": {"index": 0, "matches": 0}, "values": []}
+    mock_response.content = b'{"paging": {"index": 0, "matches": 0}, "values": []}'
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         await client_instance.get_depot_orders(depot_id="depot_abc")
 
-        call_args = mock_http_client.get.call_args
-        assert "brokerage/depots/depot_abc/v3/orders" in call_args.kwargs["url"]
+        call_args = mock_http_client.request.call_args
+        assert "brokerage/depots/depot_abc/v3/orders" in call_args.args[1]
 
 
 @pytest.mark.asyncio
@@ -191,13 +196,14 @@ async def test_get_depot_orders_token_refresh(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"paging": {"index": 0, "matches": 0}, "values": []}
+    mock_response.content = b'{"paging": {"index": 0, "matches": 0}, "values": []}'
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
         with patch.object(
             client_instance, "refresh_access_token", new_callable=AsyncMock
         ) as mock_refresh:
@@ -220,13 +226,14 @@ async def test_get_order_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = SAMPLE_ORDER
+    mock_response.content = json.dumps(SAMPLE_ORDER).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_order(order_id="order_abc123")
 
@@ -247,17 +254,18 @@ async def test_get_order_without_attr(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = SAMPLE_ORDER
+    mock_response.content = json.dumps(SAMPLE_ORDER).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         await client_instance.get_order(order_id="order_abc123", without_attr="executions")
 
-        call_args = mock_http_client.get.call_args
+        call_args = mock_http_client.request.call_args
         assert call_args.kwargs["params"]["without-attr"] == "executions"
 
 
@@ -271,18 +279,19 @@ async def test_get_order_url(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = SAMPLE_ORDER
+    mock_response.content = json.dumps(SAMPLE_ORDER).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         await client_instance.get_order(order_id="order_abc123")
 
-        call_args = mock_http_client.get.call_args
-        assert "brokerage/v3/orders/order_abc123" in call_args.kwargs["url"]
+        call_args = mock_http_client.request.call_args
+        assert "brokerage/v3/orders/order_abc123" in call_args.args[1]
 
 
 @pytest.mark.asyncio
@@ -304,13 +313,14 @@ async def test_get_order_token_refresh(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = SAMPLE_ORDER
+    mock_response.content = json.dumps(SAMPLE_ORDER).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
         with patch.object(
             client_instance, "refresh_access_token", new_callable=AsyncMock
         ) as mock_refresh:
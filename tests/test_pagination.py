@@ -0,0 +1,270 @@
+"""Tests for the auto-paginating async iterators."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+
+def _transaction(n: int) -> dict:
+    return {
+        "bookingStatus": "BOOKED",
+        "bookingDate": "2026-02-20",
+        "amount": {"value": n, "unit": "EUR"},
+        "remittanceInfo": f"Payment {n}",
+        "transactionType": {"key": "CREDIT", "text": "Gutschrift"},
+    }
+
+
+def _document(n: int) -> dict:
+    return {
+        "documentId": f"doc_{n}",
+        "name": f"Statement {n}",
+        "dateCreation": "2024-01-31",
+        "mimeType": "application/pdf",
+        "deletable": False,
+        "advertisement": False,
+    }
+
+
+def _paged_http_client(
+    make_item, total: int, page_size: int, with_matches: bool = True
+) -> AsyncMock:
+    """Mock that serves `total` items in pages of `page_size`, honouring paging-first."""
+
+    async def request(method, url, **kwargs):
+        first = kwargs["params"]["paging-first"]
+        paging = {"index": first, "matches": total} if with_matches else {"index": first}
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            "paging": paging,
+            "values": [make_item(n) for n in range(first, min(first + page_size, total))],
+        }
+        response.content = json.dumps(response.json.return_value).encode()
+        response.raise_for_status.return_value = None
+        return response
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = request
+    return mock_http_client
+
+
+@pytest.fixture
+def banking_client(client_instance):
+    client_instance.banking_access_token = "banking_token"
+    client_instance.session_id = "session_123"
+    client_instance.token_expires_at = time.time() + 3600
+    return client_instance
+
+
+def _offsets(mock_http_client: AsyncMock) -> list[int]:
+    return [c.kwargs["params"]["paging-first"] for c in mock_http_client.request.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_iter_account_transactions_follows_paging(banking_client):
+    """All pages are fetched in order until paging.matches is reached."""
+    mock_http_client = _paged_http_client(_transaction, total=5, page_size=2)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        amounts = [
+            tx.amount.value async for tx in banking_client.iter_account_transactions("acc")
+        ]
+
+    assert amounts == [0, 1, 2, 3, 4]
+    assert _offsets(mock_http_client) == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_iter_documents_uses_page_size(banking_client):
+    """Documents are requested with the given page size and paging-first offsets."""
+    mock_http_client = _paged_http_client(_document, total=7, page_size=3)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        ids = [doc.document_id async for doc in banking_client.iter_documents(page_size=3)]
+
+    assert ids == [f"doc_{n}" for n in range(7)]
+    assert _offsets(mock_http_client) == [0, 3, 6]
+    assert mock_http_client.request.call_args.kwargs["params"]["paging-count"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("total", "offsets"), [(250, [0, 100, 200]), (200, [0, 100, 200])])
+async def test_iter_documents_without_matches(banking_client, total, offsets):
+    """Without paging.matches, paging continues until a short or empty page."""
+    mock_http_client = _paged_http_client(_document, total=total, page_size=100, with_matches=False)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        ids = [doc.document_id async for doc in banking_client.iter_documents(page_size=100)]
+
+    assert ids == [f"doc_{n}" for n in range(total)]
+    assert _offsets(mock_http_client) == offsets
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_read_ahead_is_bounded(banking_client):
+    """While the caller holds page 0, only `prefetch` further pages are fetched."""
+    mock_http_client = _paged_http_client(_transaction, total=100, page_size=10)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        transactions = banking_client.iter_account_transactions("acc", prefetch=2)
+
+        await anext(transactions)
+        for _ in range(10):
+            await asyncio.sleep(0)  # give the producer every chance to run ahead
+        assert _offsets(mock_http_client) == [0, 10, 20]
+
+        await transactions.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_propagates_errors(banking_client):
+    """A failing page request surfaces in the caller after the earlier values."""
+    ok = _paged_http_client(_transaction, total=4, page_size=2).request.side_effect
+    failed = MagicMock()
+    failed.status_code = 500
+    failed.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "500", request=MagicMock(), response=failed
+    )
+
+    async def request(method, url, **kwargs):
+        if kwargs["params"]["paging-first"] == 2:
+            return failed
+        return await ok(method, url, **kwargs)
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = request
+
+    seen = []
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        with pytest.raises(httpx.HTTPStatusError):
+            async for tx in banking_client.iter_account_transactions("acc"):
+                seen.append(tx.amount.value)
+
+    assert seen == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_rejects_zero_prefetch(banking_client):
+    """Read-ahead must hold at least one page."""
+    with pytest.raises(ValueError, match="prefetch must be at least 1"):
+        async for _ in banking_client.iter_documents(prefetch=0):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_iter_depot_orders_yields_orders(banking_client):
+    """Orders come from a single request; filters are passed through."""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "paging": {"index": 0, "matches": 2},
+        "values": [
+            {"orderId": "order_1", "side": "BUY"},
+            {"orderId": "order_2", "side": "BUY"},
+        ],
+    }
+    response.content = json.dumps(response.json.return_value).encode()
+    response.raise_for_status.return_value = None
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = response
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        orders = [
+            order async for order in banking_client.iter_depot_orders("depot", side="BUY")
+        ]
+
+    assert [order.order_id for order in orders] == ["order_1", "order_2"]
+    assert mock_http_client.request.call_args.kwargs["params"] == {"side": "BUY"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_merges_pages_in_order(banking_client):
+    """Remaining pages are fetched concurrently and reassembled by offset."""
+    mock_http_client = _paged_http_client(_transaction, total=25, page_size=10)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        result = await banking_client.fetch_all(
+            banking_client.get_account_transactions, "acc", concurrency=2
+        )
+
+    assert [tx.amount.value for tx in result.values] == list(range(25))
+    assert result.paging == {"index": 0, "matches": 25}
+    assert sorted(_offsets(mock_http_client)) == [0, 10, 20]
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_respects_concurrency(banking_client):
+    """No more than `concurrency` page requests are in flight at once."""
+    serve = _paged_http_client(_document, total=50, page_size=5).request.side_effect
+    in_flight = {"now": 0, "max": 0}
+
+    async def request(method, url, **kwargs):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.001)
+        in_flight["now"] -= 1
+        return await serve(method, url, **kwargs)
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = request
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        result = await banking_client.fetch_all(
+            banking_client.get_documents, paging_count=5, concurrency=3
+        )
+
+    assert [doc.document_id for doc in result.values] == [f"doc_{n}" for n in range(50)]
+    assert in_flight["max"] == 3
+    assert mock_http_client.request.call_count == 10
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_single_page(banking_client):
+    """A result that fits in the first page needs exactly one request."""
+    mock_http_client = _paged_http_client(_document, total=3, page_size=20)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        result = await banking_client.fetch_all(banking_client.get_documents)
+
+    assert len(result.values) == 3
+    assert mock_http_client.request.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("paging", [None, {}, {"matches": None}])
+async def test_fetch_all_without_matches(banking_client, paging):
+    """Without paging.matches, pages are fetched one by one until a short page."""
+
+    async def request(method, url, **kwargs):
+        first = kwargs["params"]["paging-first"]
+        values = [_document(n) for n in range(first, min(first + 100, 250))]
+        response = MagicMock()
+        response.status_code = 200
+        response.content = json.dumps({"paging": paging, "values": values}).encode()
+        response.raise_for_status.return_value = None
+        return response
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = request
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        result = await banking_client.fetch_all(banking_client.get_documents, paging_count=100)
+
+    assert [doc.document_id for doc in result.values] == [f"doc_{n}" for n in range(250)]
+    assert result.paging == {"index": 0, "matches": 250}
+    assert _offsets(mock_http_client) == [0, 100, 200]
@@ -0,0 +1,106 @@
+"""Tests for the client-side rate limiter."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from comdirect_api.client import ComdirectClient
+from comdirect_api.ratelimit import RateLimiter, TokenBucketLimiter
+
+
+class _FakeClock:
+    """Monotonic clock that only advances when the limiter sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = _FakeClock()
+    with patch("comdirect_api.ratelimit.time.monotonic", fake.monotonic), patch(
+        "comdirect_api.ratelimit.asyncio.sleep", fake.sleep
+    ):
+        yield fake
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces(clock):
+    """Up to `burst` requests pass immediately, later ones wait 1/rate each."""
+    limiter = TokenBucketLimiter(rate=10, burst=3)
+
+    for _ in range(5):
+        await limiter.acquire("client")
+
+    assert clock.sleeps == pytest.approx([0.1, 0.1])
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills_over_time(clock):
+    """Idle time refills the bucket up to the burst size."""
+    limiter = TokenBucketLimiter(rate=10, burst=2)
+    await limiter.acquire("client")
+    await limiter.acquire("client")
+
+    clock.now += 60  # long idle period
+    await limiter.acquire("client")
+    await limiter.acquire("client")
+
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_keys_are_independent(clock):
+    """Different client_ids have separate quotas."""
+    limiter = TokenBucketLimiter(rate=1, burst=1)
+
+    await limiter.acquire("client_a")
+    await limiter.acquire("client_b")
+
+    assert clock.sleeps == []
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    """A zero rate would block forever."""
+    with pytest.raises(ValueError, match="rate must be positive"):
+        TokenBucketLimiter(rate=0)
+
+
+@pytest.mark.asyncio
+async def test_clients_share_limiter_by_client_id(creds):
+    """Every request attempt of every sharing client acquires under its client_id."""
+    limiter = MagicMock(spec=RateLimiter)
+    limiter.acquire = AsyncMock()
+    clients = [
+        ComdirectClient(
+            client_id=creds["client_id"],
+            client_secret=creds["client_secret"],
+            zugangsnummer=creds["username"],
+            pin=creds["password"],
+            rate_limiter=limiter,
+        )
+        for _ in range(2)
+    ]
+
+    ok = MagicMock()
+    ok.status_code = 200
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = ok
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        for client in clients:
+            await client._request("GET", "https://example.test/x")
+
+    assert limiter.acquire.await_count == 2
+    for call in limiter.acquire.await_args_list:
+        assert call.args == (creds["client_id"],)
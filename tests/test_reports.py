@@ -7,6 +7,7 @@ Tests cover:
 - revoke_access_token() — token revocation
 """
 
+import json
 import time
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -43,13 +44,14 @@ async def test_get_account_balance_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_account_balance("account_abc")
 
@@ -57,7 +59,7 @@ async def test_get_account_balance_success(client_instance):
         assert result.balance.value == Decimal("2500.00")
         assert result.balance.unit == "EUR"
 
-        called_url = mock_http_client.get.call_args[1]["url"]
+        called_url = mock_http_client.request.call_args[0][1]
         assert "account_abc" in called_url
 
 
@@ -122,13 +124,14 @@ async def test_get_all_balances_success(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance.get_all_balances()
 
@@ -154,17 +157,18 @@ async def test_get_all_balances_with_product_type_filter(client_instance):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_response_data
+    mock_response.content = json.dumps(mock_response_data).encode()
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         await client_instance.get_all_balances(product_type="ACCOUNT,DEPOT")
 
-        call_kwargs = mock_http_client.get.call_args[1]
+        call_kwargs = mock_http_client.request.call_args[1]
         assert call_kwargs["params"]["productType"] == "ACCOUNT,DEPOT"
 
 
@@ -192,15 +196,15 @@ async def test_revoke_access_token_success(client_instance):
     mock_response.raise_for_status.return_value = None
 
     mock_http_client = AsyncMock()
-    mock_http_client.delete.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         await client_instance.revoke_access_token()
 
-        mock_http_client.delete.assert_called_once()
-        called_url = mock_http_client.delete.call_args[0][0]
+        mock_http_client.request.assert_called_once()
+        called_url = mock_http_client.request.call_args[0][1]
         assert "revoke" in called_url
 
     # Tokens should be cleared after revocation
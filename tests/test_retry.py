@@ -0,0 +1,168 @@
+"""Tests for the retrying request pipeline (ComdirectClient._request / RetryPolicy)."""
+
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from comdirect_api.retry import NO_RETRY, RetryPolicy, parse_retry_after
+
+
+def _response(status_code: int, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+@pytest.mark.asyncio
+async def test_request_returns_success_without_retry(client_instance):
+    """A 200 response is returned straight away."""
+    ok = _response(200)
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = ok
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        mock_client_class.return_value = mock_http_client
+
+        response = await client_instance._request("GET", "https://example.test/x")
+
+        assert response is ok
+        mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_request_honours_retry_after(client_instance):
+    """A 429 with Retry-After waits exactly that long before retrying."""
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = [
+        _response(429, {"Retry-After": "3"}),
+        _response(200),
+    ]
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        mock_client_class.return_value = mock_http_client
+
+        response = await client_instance._request("GET", "https://example.test/x")
+
+        assert response.status_code == 200
+        mock_sleep.assert_awaited_once_with(3.0)
+
+
+@pytest.mark.asyncio
+async def test_request_returns_last_response_when_budget_exhausted(client_instance):
+    """After the per-status budget is used up the last response is returned."""
+    client_instance._retry = RetryPolicy(status_retries={503: 2})
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _response(503)
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        mock_client_class.return_value = mock_http_client
+
+        response = await client_instance._request("GET", "https://example.test/x")
+
+        assert response.status_code == 503
+        assert mock_http_client.request.call_count == 3
+        assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_does_not_replay_post_on_gateway_errors(client_instance):
+    """502/504 are only retried for idempotent methods."""
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = [_response(502), _response(200)]
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ):
+        mock_client_class.return_value = mock_http_client
+
+        response = await client_instance._request("POST", "https://example.test/x")
+        assert response.status_code == 502
+
+        mock_http_client.request.side_effect = [_response(502), _response(200)]
+        response = await client_instance._request("GET", "https://example.test/x")
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_request_retries_connect_errors(client_instance):
+    """Connection failures are retried, then the request succeeds."""
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = [
+        httpx.ConnectError("refused"),
+        httpx.ConnectTimeout("slow"),
+        _response(200),
+    ]
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ):
+        mock_client_class.return_value = mock_http_client
+
+        response = await client_instance._request("GET", "https://example.test/x")
+
+        assert response.status_code == 200
+        assert mock_http_client.request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_request_stops_when_retry_after_exceeds_deadline(client_instance):
+    """A Retry-After beyond the total deadline returns immediately."""
+    client_instance._retry = RetryPolicy(deadline=10.0)
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _response(429, {"Retry-After": "60"})
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        mock_client_class.return_value = mock_http_client
+
+        response = await client_instance._request("GET", "https://example.test/x")
+
+        assert response.status_code == 429
+        mock_http_client.request.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_no_retry_policy_returns_first_failure(client_instance):
+    """NO_RETRY disables all retries."""
+    client_instance._retry = NO_RETRY
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _response(429)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        response = await client_instance._request("GET", "https://example.test/x")
+
+        assert response.status_code == 429
+        mock_http_client.request.assert_awaited_once()
+
+
+def test_next_delay_stays_within_bounds():
+    """Decorrelated jitter never drops below base_delay or exceeds max_delay."""
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+    delay = policy.base_delay
+    for _ in range(100):
+        delay = policy.next_delay(delay)
+        assert 0.5 <= delay <= 4.0
+
+
+def test_parse_retry_after_formats():
+    """Retry-After accepts delta-seconds and HTTP-dates; garbage yields None."""
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    in_ten_seconds = formatdate(time.time() + 10, usegmt=True)
+    assert 8.0 <= parse_retry_after(in_ten_seconds) <= 10.0
@@ -5,8 +5,9 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pymongo.errors import BulkWriteError
 
-from functions.sync.mongo_repo import _date_to_datetime, _decimal_to_str
+from functions.sync.mongo_repo import MongoRepo, _date_to_datetime, _decimal_to_str
 from functions.sync.sync_service import SyncService
 
 # ---------------------------------------------------------------------------
@@ -88,7 +89,7 @@ async def test_sync_balances_new_account_inserts():
 
     ab = _account_balance("ACC1", Decimal("100.00"))
     client.get_account_balances.return_value = MagicMock(values=[ab])
-    repo.get_latest_balance.return_value = None  # no existing doc
+    repo.get_latest_balances.return_value = {}  # no existing doc
 
     service = SyncService(client, repo, account_name="TEST")
     result = await service.sync_account_balances()
@@ -102,7 +103,7 @@ async def test_sync_balances_new_account_inserts():
         value=Decimal("100.00"),
         unit="EUR",
     )
-    repo.touch_balance_last_synced.assert_not_called()
+    repo.touch_balances_last_synced.assert_called_once_with([])
     assert result == {"inserted": 1, "touched": 0}
 
 
@@ -114,13 +115,15 @@ async def test_sync_balances_unchanged_touches():
 
     ab = _account_balance("ACC1", Decimal("100.00"))
     client.get_account_balances.return_value = MagicMock(values=[ab])
-    repo.get_latest_balance.return_value = {"balance": {"value": "100.00"}}
+    repo.get_latest_balances.return_value = {
+        "ACC1": {"_id": "B1", "balance": {"value": "100.00"}}
+    }
 
     service = SyncService(client, repo, account_name="TEST")
     result = await service.sync_account_balances()
 
     repo.insert_balance.assert_not_called()
-    repo.touch_balance_last_synced.assert_called_once_with("ACC1")
+    repo.touch_balances_last_synced.assert_called_once_with(["B1"])
     assert result == {"inserted": 0, "touched": 1}
 
 
@@ -132,13 +135,13 @@ async def test_sync_balances_changed_inserts():
 
     ab = _account_balance("ACC1", Decimal("200.00"))
     client.get_account_balances.return_value = MagicMock(values=[ab])
-    repo.get_latest_balance.return_value = {"balance": {"value": "100.00"}}
+    repo.get_latest_balances.return_value = {"ACC1": {"_id": "B1", "balance": {"value": "100.00"}}}
 
     service = SyncService(client, repo, account_name="TEST")
     result = await service.sync_account_balances()
 
     repo.insert_balance.assert_called_once()
-    repo.touch_balance_last_synced.assert_not_called()
+    repo.touch_balances_last_synced.assert_called_once_with([])
     assert result == {"inserted": 1, "touched": 0}
 
 
@@ -152,15 +155,17 @@ async def test_sync_balances_multiple_accounts():
     ab2 = _account_balance("ACC2", Decimal("500.00"))
     client.get_account_balances.return_value = MagicMock(values=[ab1, ab2])
 
-    repo.get_latest_balance.side_effect = lambda acc_id: (
-        {"balance": {"value": "100.00"}} if acc_id == "ACC1"
-        else None
-    )
+    repo.get_latest_balances.return_value = {
+        "ACC1": {"_id": "B1", "balance": {"value": "100.00"}}
+    }
 
     service = SyncService(client, repo, account_name="TEST")
     result = await service.sync_account_balances()
 
     assert result == {"inserted": 1, "touched": 1}
+    repo.get_latest_balances.assert_called_once_with(["ACC1", "ACC2"])
+    repo.get_latest_balance.assert_not_called()
+    repo.touch_balances_last_synced.assert_called_once_with(["B1"])
 
 
 # ---------------------------------------------------------------------------
@@ -296,14 +301,15 @@ async def test_sync_positions_unchanged_touches():
     pos = _position("POS1", "A1B2C3", Decimal("1000"), Decimal("6000.00"))
     client.get_depot_positions.return_value = MagicMock(values=[pos])
     repo.get_latest_depot_snapshot.return_value = {
-        "positions": [{"position_id": "POS1", "quantity": {"value": "1000"}}]
+        "_id": "S1",
+        "positions": [{"position_id": "POS1", "quantity": {"value": "1000"}}],
     }
 
     service = SyncService(client, repo, account_name="TEST")
     result = await service.sync_depot_positions("DEPOT1")
 
     repo.insert_depot_snapshot.assert_not_called()
-    repo.touch_depot_last_synced.assert_called_once_with("DEPOT1")
+    repo.touch_depot_last_synced.assert_called_once_with("DEPOT1", snapshot_id="S1")
     assert result == {"inserted": 0, "touched": 1}
 
 
@@ -375,54 +381,372 @@ async def test_sync_positions_sold_position_inserts():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_sync_transactions_new_inserts():
-    """New transaction not yet in DB — should insert."""
+async def test_sync_transactions_uses_one_bulk_insert():
+    """All new transactions go to the repo in one batch."""
     client = AsyncMock()
     repo = AsyncMock()
 
-    txn = _transaction("TXN1")
-    client.get_depot_transactions.return_value = MagicMock(values=[txn])
-    repo.transaction_exists.return_value = False
+    txn1 = _transaction("TXN1")
+    txn2 = _transaction("TXN2", wkn="B2C3D4")
+    client.get_depot_transactions.return_value = MagicMock(values=[txn1, txn2])
+    repo.existing_transaction_ids.return_value = set()
+    repo.insert_transactions_bulk.return_value = {"inserted": 2, "skipped": 0}
 
     service = SyncService(client, repo, account_name="TEST")
     result = await service.sync_depot_transactions("DEPOT1")
 
-    repo.insert_transaction.assert_called_once()
-    assert result == {"inserted": 1, "skipped": 0}
+    assert result == {"inserted": 2, "skipped": 0}
+    repo.transaction_exists.assert_not_called()
+    repo.insert_transaction.assert_not_called()
+    (batch,) = repo.insert_transactions_bulk.call_args.args
+    assert [t["transaction_id"] for t in batch] == ["TXN1", "TXN2"]
+    assert batch[1]["wkn"] == "B2C3D4"
+    assert batch[0]["depot_id"] == "DEPOT1"
+    assert batch[0]["quantity"] == Decimal("1000")
+    assert batch[0]["price_unit"] == "EUR"
 
 
 @pytest.mark.asyncio
-async def test_sync_transactions_existing_skipped():
-    """Transaction already in DB — should skip."""
+async def test_sync_transactions_diffs_existing_ids_in_memory():
+    """Stored ids are looked up once and left out of the insert batch."""
     client = AsyncMock()
     repo = AsyncMock()
 
-    txn = _transaction("TXN1")
-    client.get_depot_transactions.return_value = MagicMock(values=[txn])
-    repo.transaction_exists.return_value = True
+    txns = [_transaction("TXN1"), _transaction("TXN2"), _transaction("TXN3")]
+    client.get_depot_transactions.return_value = MagicMock(values=txns)
+    repo.existing_transaction_ids.return_value = {"TXN1", "TXN3"}
+    repo.insert_transactions_bulk.return_value = {"inserted": 1, "skipped": 0}
 
     service = SyncService(client, repo, account_name="TEST")
     result = await service.sync_depot_transactions("DEPOT1")
 
-    repo.insert_transaction.assert_not_called()
-    assert result == {"inserted": 0, "skipped": 1}
+    assert result == {"inserted": 1, "skipped": 2}
+    repo.existing_transaction_ids.assert_called_once_with(["TXN1", "TXN2", "TXN3"])
+    (batch,) = repo.insert_transactions_bulk.call_args.args
+    assert [t["transaction_id"] for t in batch] == ["TXN2"]
 
 
 @pytest.mark.asyncio
-async def test_sync_transactions_mixed():
-    """One new, one existing — insert one, skip one."""
+async def test_sync_transactions_ignores_missing_ids():
+    """Transactions without an id are not sent to the repo."""
     client = AsyncMock()
     repo = AsyncMock()
 
-    txn1 = _transaction("TXN1")
-    txn2 = _transaction("TXN2")
-    client.get_depot_transactions.return_value = MagicMock(values=[txn1, txn2])
-    repo.transaction_exists.side_effect = lambda txn_id: txn_id == "TXN2"
+    client.get_depot_transactions.return_value = MagicMock(values=[_transaction(None)])
+    repo.existing_transaction_ids.return_value = set()
+    repo.insert_transactions_bulk.return_value = {"inserted": 0, "skipped": 0}
 
     service = SyncService(client, repo, account_name="TEST")
     result = await service.sync_depot_transactions("DEPOT1")
 
+    repo.insert_transactions_bulk.assert_called_once_with([])
+    assert result == {"inserted": 0, "skipped": 0}
+
+
+# ---------------------------------------------------------------------------
+# run_full_sync — watermark-based incremental transaction fetch
+# ---------------------------------------------------------------------------
+
+
+def _full_sync_mocks(transactions: list, watermark: dict | None):
+    client = AsyncMock()
+    repo = AsyncMock()
+    client.get_account_balances.return_value = MagicMock(values=[])
+    client.get_account_depots.return_value = MagicMock(values=[MagicMock(depot_id="DEPOT1")])
+    client.get_depot_transactions.return_value = MagicMock(values=transactions)
+    client.get_depot_positions.return_value = MagicMock(values=[])
+    repo.get_latest_depot_snapshots.return_value = {"DEPOT1": {"_id": "S1", "positions": []}}
+    repo.get_transaction_watermark.return_value = watermark
+    repo.existing_transaction_ids.return_value = set()
+    repo.insert_transactions_bulk.return_value = {"inserted": 0, "skipped": 0}
+    return client, repo
+
+
+@pytest.mark.asyncio
+async def test_full_sync_first_run_fetches_lookback_and_sets_watermark():
+    txns = [
+        _transaction("TXN1", booking_date=date(2026, 3, 1)),
+        _transaction("TXN3", booking_date=date(2026, 3, 5)),
+        _transaction("TXN2", booking_date=date(2026, 3, 5)),
+    ]
+    client, repo = _full_sync_mocks(txns, watermark=None)
+
+    service = SyncService(client, repo, account_name="TEST", depot_transactions_lookback="-365d")
+    await service.run_full_sync()
+
+    client.get_depot_transactions.assert_called_once_with(
+        depot_id="DEPOT1", min_booking_date="-365d", lazy=True
+    )
+    repo.set_transaction_watermark.assert_called_once_with(
+        "DEPOT1", date(2026, 3, 5), ["TXN2", "TXN3"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_sync_fetches_from_watermark_minus_margin():
+    """A confirmed watermark limits the fetch; unchanged depots need no history."""
+    txns = [_transaction("TXN2", booking_date=date(2026, 3, 5))]
+    watermark = {"booking_date": date(2026, 3, 5), "transaction_ids": ["TXN2"]}
+    client, repo = _full_sync_mocks(txns, watermark)
+
+    service = SyncService(client, repo, account_name="TEST", watermark_margin_days=7)
+    await service.run_full_sync()
+
+    client.get_depot_transactions.assert_called_once_with(
+        depot_id="DEPOT1", min_booking_date="2026-02-26", lazy=True
+    )
+    (batch,) = repo.insert_transactions_bulk.call_args.args
+    assert [t["transaction_id"] for t in batch] == ["TXN2"]
+    repo.get_latest_depot_snapshots.assert_called_once_with(["DEPOT1"])
+    repo.get_latest_depot_snapshot.assert_not_called()
+    repo.touch_depot_last_synced.assert_called_once_with("DEPOT1", snapshot_id="S1")
+
+
+@pytest.mark.asyncio
+async def test_full_sync_rescans_when_watermark_not_confirmed():
+    """If the overlap lacks the watermark's transactions, the lookback is fetched."""
+    watermark = {"booking_date": date(2026, 3, 5), "transaction_ids": ["TXN2", "GONE"]}
+    client, repo = _full_sync_mocks([_transaction("TXN2")], watermark)
+
+    service = SyncService(client, repo, account_name="TEST", depot_transactions_lookback="-365d")
+    await service.run_full_sync()
+
+    calls = client.get_depot_transactions.call_args_list
+    assert [c.kwargs["min_booking_date"] for c in calls] == ["2026-02-26", "-365d"]
+
+
+@pytest.mark.asyncio
+async def test_full_sync_full_rescan_ignores_watermark():
+    client, repo = _full_sync_mocks([], watermark=None)
+
+    service = SyncService(client, repo, account_name="TEST", full_rescan=True)
+    await service.run_full_sync()
+
+    repo.get_transaction_watermark.assert_not_called()
+    repo.set_transaction_watermark.assert_not_called()  # nothing booked, keep the old one
+    assert client.get_depot_transactions.call_args.kwargs["min_booking_date"] == "-3650d"
+
+
+@pytest.mark.asyncio
+async def test_sync_positions_fetches_history_only_for_new_snapshot():
+    """fetch_history loads the lookback window when a snapshot is inserted."""
+    client = AsyncMock()
+    repo = AsyncMock()
+    pos = _position("POS1", "A1B2C3", Decimal("1000"), Decimal("5000.00"))
+    client.get_depot_positions.return_value = MagicMock(values=[pos])
+    client.get_depot_transactions.return_value = MagicMock(
+        values=[_transaction("TXN1", wkn="A1B2C3", booking_date=date(2020, 1, 2))]
+    )
+    repo.get_latest_depot_snapshot.return_value = None
+
+    service = SyncService(client, repo, account_name="TEST", depot_transactions_lookback="-9d")
+    await service.sync_depot_positions("DEPOT1", fetch_history=True)
+
+    client.get_depot_transactions.assert_called_once_with(
+        depot_id="DEPOT1", min_booking_date="-9d", lazy=True
+    )
+    positions = repo.insert_depot_snapshot.call_args.kwargs["positions"]
+    assert positions[0]["held_since_date"] == "2020-01-02"
+
+
+@pytest.mark.asyncio
+async def test_advance_watermark_skips_pending_bookings():
+    repo = AsyncMock()
+    booked = _transaction("TXN1", booking_date=date(2026, 3, 1))
+    pending = _transaction("TXN2", booking_date=date(2026, 3, 9))
+    pending.booking_status = "NOTBOOKED"
+
+    service = SyncService(AsyncMock(), repo, account_name="TEST")
+    await service._advance_watermark("DEPOT1", [booked, pending])
+
+    repo.set_transaction_watermark.assert_called_once_with("DEPOT1", date(2026, 3, 1), ["TXN1"])
+
+
+# ---------------------------------------------------------------------------
+# MongoRepo.insert_transactions_bulk (collection mocked)
+# ---------------------------------------------------------------------------
+
+
+def _repo_with_transactions(collection) -> MongoRepo:
+    repo = MongoRepo("mongodb://localhost", "test")  # does not connect until used
+    repo._db = {"transactions": collection}
+    return repo
+
+
+def _bulk_txn(transaction_id: str) -> dict:
+    return {
+        "transaction_id": transaction_id,
+        "depot_id": "DEPOT1",
+        "account_name": "TEST",
+        "display_name": None,
+        "wkn": "A1B2C3",
+        "booking_date": date(2026, 3, 1),
+        "transaction_type": "BUY",
+        "quantity": Decimal("10"),
+        "quantity_unit": "XXX",
+        "execution_price": Decimal("5.00"),
+        "price_unit": "EUR",
+    }
+
+
+@pytest.mark.asyncio
+async def test_insert_transactions_bulk_upserts_unordered():
+    """One unordered bulk_write of $setOnInsert upserts; counts from the result."""
+    collection = AsyncMock()
+    collection.bulk_write.return_value = MagicMock(upserted_count=1)
+    repo = _repo_with_transactions(collection)
+
+    result = await repo.insert_transactions_bulk([_bulk_txn("TXN1"), _bulk_txn("TXN2")])
+
     assert result == {"inserted": 1, "skipped": 1}
+    (operations,) = collection.bulk_write.call_args.args
+    assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+    first = operations[0]  # UpdateOne(filter, update, upsert=True)
+    assert first._filter == {"transaction_id": "TXN1"}
+    assert first._upsert is True
+    assert first._doc["$setOnInsert"]["quantity"] == "10"
+    assert first._doc["$setOnInsert"]["booking_date"].tzinfo == UTC
+
+
+class _Cursor:
+    """Async cursor over canned documents."""
+
+    def __init__(self, docs: list[dict]) -> None:
+        self._docs = docs
+
+    async def __aiter__(self):
+        for doc in self._docs:
+            yield doc
+
+
+@pytest.mark.asyncio
+async def test_existing_transaction_ids_runs_chunked_covered_queries(monkeypatch):
+    """Ids are deduplicated and queried with $in in chunks, projected to the index key."""
+    monkeypatch.setattr("functions.sync.mongo_repo._IN_CHUNK", 2)
+    collection = MagicMock()
+    collection.find.side_effect = [
+        _Cursor([{"transaction_id": "TXN1"}]),
+        _Cursor([{"transaction_id": "TXN3"}]),
+    ]
+    repo = _repo_with_transactions(collection)
+
+    result = await repo.existing_transaction_ids(["TXN1", "TXN2", "TXN1", "TXN3"])
+
+    assert result == {"TXN1", "TXN3"}
+    assert [c.args for c in collection.find.call_args_list] == [
+        ({"transaction_id": {"$in": ["TXN1", "TXN2"]}}, {"transaction_id": 1, "_id": 0}),
+        ({"transaction_id": {"$in": ["TXN3"]}}, {"transaction_id": 1, "_id": 0}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_existing_transaction_ids_empty():
+    collection = MagicMock()
+    repo = _repo_with_transactions(collection)
+
+    assert await repo.existing_transaction_ids([]) == set()
+    collection.find.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_insert_transactions_bulk_empty_batch():
+    collection = AsyncMock()
+    repo = _repo_with_transactions(collection)
+
+    assert await repo.insert_transactions_bulk([]) == {"inserted": 0, "skipped": 0}
+    collection.bulk_write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_insert_transactions_bulk_counts_duplicate_key_races():
+    """Duplicate-key errors from a concurrent insert count as skipped, others raise."""
+    collection = AsyncMock()
+    collection.bulk_write.side_effect = BulkWriteError(
+        {"nUpserted": 1, "writeErrors": [{"index": 1, "code": 11000}]}
+    )
+    repo = _repo_with_transactions(collection)
+
+    result = await repo.insert_transactions_bulk([_bulk_txn("TXN1"), _bulk_txn("TXN2")])
+    assert result == {"inserted": 1, "skipped": 1}
+
+    collection.bulk_write.side_effect = BulkWriteError(
+        {"nUpserted": 0, "writeErrors": [{"index": 0, "code": 121}]}
+    )
+    with pytest.raises(BulkWriteError):
+        await repo.insert_transactions_bulk([_bulk_txn("TXN1")])
+
+
+@pytest.mark.asyncio
+async def test_transaction_watermark_roundtrip():
+    """Watermarks are stored as midnight UTC datetimes and returned as dates."""
+    collection = AsyncMock()
+    repo = MongoRepo("mongodb://localhost", "test")
+    repo._db = {"transaction_watermarks": collection}
+
+    await repo.set_transaction_watermark("DEPOT1", date(2026, 3, 5), ["TXN2"])
+    query, update = collection.update_one.call_args.args
+    assert query == {"depot_id": "DEPOT1"}
+    assert update["$set"]["booking_date"] == _date_to_datetime(date(2026, 3, 5))
+    assert collection.update_one.call_args.kwargs == {"upsert": True}
+
+    collection.find_one.return_value = {
+        "depot_id": "DEPOT1",
+        "booking_date": update["$set"]["booking_date"],
+        "transaction_ids": ["TXN2"],
+    }
+    assert await repo.get_transaction_watermark("DEPOT1") == {
+        "booking_date": date(2026, 3, 5),
+        "transaction_ids": ["TXN2"],
+    }
+    collection.find_one.return_value = None
+    assert await repo.get_transaction_watermark("DEPOT2") is None
+
+
+@pytest.mark.asyncio
+async def test_touches_take_one_round_trip():
+    """Heartbeat touches are single writes: by _id, batched, or find_one_and_update."""
+    balances = AsyncMock()
+    snapshots = AsyncMock()
+    repo = MongoRepo("mongodb://localhost", "test")
+    repo._db = {"account_balances": balances, "depot_snapshots": snapshots}
+
+    await repo.touch_balances_last_synced(["B1", "B2"])
+    await repo.touch_balances_last_synced([])
+    balances.update_many.assert_called_once()
+    assert balances.update_many.call_args.args[0] == {"_id": {"$in": ["B1", "B2"]}}
+
+    await repo.touch_balance_last_synced("ACC1")
+    assert balances.find_one_and_update.call_args.kwargs["sort"] == [("recorded_at", -1)]
+
+    await repo.touch_depot_last_synced("DEPOT1", snapshot_id="S1")
+    assert snapshots.update_one.call_args.args[0] == {"_id": "S1"}
+    await repo.touch_depot_last_synced("DEPOT1")
+    assert snapshots.find_one_and_update.call_args.args[0] == {"depot_id": "DEPOT1"}
+    balances.find_one.assert_not_called()
+    snapshots.find_one.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_latest_per_key_uses_one_aggregation():
+    """Latest documents for many ids come from one $match/$sort/$group pipeline."""
+    collection = AsyncMock()
+    collection.aggregate.return_value = _Cursor([
+        {"_id": "DEPOT1", "doc": {"_id": "S2", "depot_id": "DEPOT1"}},
+    ])
+    repo = MongoRepo("mongodb://localhost", "test")
+    repo._db = {"depot_snapshots": collection, "account_balances": collection}
+
+    result = await repo.get_latest_depot_snapshots(["DEPOT1", "DEPOT2", "DEPOT1"])
+
+    assert result == {"DEPOT1": {"_id": "S2", "depot_id": "DEPOT1"}}
+    (pipeline,) = collection.aggregate.call_args.args
+    assert pipeline == [
+        {"$match": {"depot_id": {"$in": ["DEPOT1", "DEPOT2"]}}},
+        {"$sort": {"depot_id": 1, "recorded_at": -1}},
+        {"$group": {"_id": "$depot_id", "doc": {"$first": "$$ROOT"}}},
+    ]
+    assert await repo.get_latest_balances([]) == {}
+    collection.aggregate.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
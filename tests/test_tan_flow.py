@@ -28,10 +28,10 @@ async def test_initiate_tan_challenge_success(client_instance):
     mock_response.raise_for_status = MagicMock()
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._initiate_tan_challenge()
 
@@ -56,10 +56,10 @@ async def test_initiate_tan_challenge_missing_header(client_instance):
     mock_response.raise_for_status = MagicMock()
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(ValueError, match="Missing 'x-once-authentication-info'"):
             await client_instance._initiate_tan_challenge()
@@ -78,10 +78,10 @@ async def test_initiate_tan_challenge_invalid_json_header(client_instance):
     mock_response.raise_for_status = MagicMock()
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(ValueError, match="Invalid JSON"):
             await client_instance._initiate_tan_challenge()
@@ -108,10 +108,10 @@ async def test_initiate_tan_challenge_missing_auth_url(client_instance):
     mock_response.raise_for_status = MagicMock()
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(ValueError, match="Missing authentication URL"):
             await client_instance._initiate_tan_challenge()
@@ -138,10 +138,10 @@ async def test_create_validate_session_tan_missing_challenge_id(client_instance)
     mock_response.raise_for_status = MagicMock()
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(ValueError, match="No challenge ID received"):
             await client_instance._create_validate_session_tan()
@@ -176,11 +176,10 @@ async def test_create_validate_session_tan_unexpected_status(client_instance):
     wait_response.json.return_value = {"status": "FAILED"}
 
     mock_http_client = AsyncMock()
-    mock_http_client.post.return_value = initiate_response
-    mock_http_client.get.return_value = wait_response
+    mock_http_client.request.side_effect = [initiate_response, wait_response]
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(ValueError, match="Unexpected TAN status"):
             await client_instance._create_validate_session_tan()
@@ -5,6 +5,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from comdirect_api.tan_polling import TanPollingPolicy
+
 
 @pytest.mark.asyncio
 async def test_wait_for_tan_authenticated_immediately(client_instance):
@@ -17,15 +19,15 @@ async def test_wait_for_tan_authenticated_immediately(client_instance):
     mock_response.json.return_value = {"status": "AUTHENTICATED"}
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._wait_for_tan_confirmation("/auth/url")
 
         assert result["status"] == "AUTHENTICATED"
-        mock_http_client.get.assert_called_once()
+        mock_http_client.request.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -44,19 +46,19 @@ async def test_wait_for_tan_pending_then_authenticated(client_instance):
     authenticated_response.json.return_value = {"status": "AUTHENTICATED"}
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.side_effect = [pending_response, authenticated_response]
+    mock_http_client.request.side_effect = [pending_response, authenticated_response]
 
     with patch("httpx.AsyncClient") as mock_client_class, patch(
         "asyncio.sleep", new_callable=AsyncMock
     ):
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._wait_for_tan_confirmation(
-            "/auth/url", max_attempts=5, delay=0.1
+            "/auth/url", policy=TanPollingPolicy(max_attempts=5, first_delay=0.1)
         )
 
         assert result["status"] == "AUTHENTICATED"
-        assert mock_http_client.get.call_count == 2
+        assert mock_http_client.request.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -74,19 +76,19 @@ async def test_wait_for_tan_active_status(client_instance):
     authenticated_response.json.return_value = {"status": "AUTHENTICATED"}
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.side_effect = [active_response, authenticated_response]
+    mock_http_client.request.side_effect = [active_response, authenticated_response]
 
     with patch("httpx.AsyncClient") as mock_client_class, patch(
         "asyncio.sleep", new_callable=AsyncMock
     ):
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._wait_for_tan_confirmation(
-            "/auth/url", max_attempts=5, delay=0.1
+            "/auth/url", policy=TanPollingPolicy(max_attempts=5, first_delay=0.1)
         )
 
         assert result["status"] == "AUTHENTICATED"
-        assert mock_http_client.get.call_count == 2
+        assert mock_http_client.request.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -101,19 +103,19 @@ async def test_wait_for_tan_timeout(client_instance):
     mock_response.json.return_value = {"status": "PENDING"}
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class, patch(
         "asyncio.sleep", new_callable=AsyncMock
     ):
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(TimeoutError, match="TAN confirmation timed out"):
             await client_instance._wait_for_tan_confirmation(
-                "/auth/url", max_attempts=3, delay=0.1
+                "/auth/url", policy=TanPollingPolicy(max_attempts=3, first_delay=0.1)
             )
 
-        assert mock_http_client.get.call_count == 3
+        assert mock_http_client.request.call_count == 3
 
 
 @pytest.mark.asyncio
@@ -122,23 +124,29 @@ async def test_wait_for_tan_not_found(client_instance):
     client_instance.primary_access_token = "token"
     client_instance.session_id = "session123"
 
+    progress = []
+    client_instance._on_tan_progress = progress.append
+
     mock_response = MagicMock()
     mock_response.status_code = 404
     mock_response.text = "Not Found"
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = mock_response
+    mock_http_client.request.return_value = mock_response
 
     with patch("httpx.AsyncClient") as mock_client_class, patch(
         "asyncio.sleep", new_callable=AsyncMock
     ):
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
-        with pytest.raises(TimeoutError):
+        with pytest.raises(ValueError, match="expired"):
             await client_instance._wait_for_tan_confirmation(
-                "/auth/url", max_attempts=3, delay=0.1
+                "/auth/url", policy=TanPollingPolicy(max_attempts=3, first_delay=0.1)
             )
 
+    assert mock_http_client.request.call_count == 1
+    assert [(p.attempt, p.next_delay) for p in progress] == [(1, None)]
+
 
 @pytest.mark.asyncio
 async def test_wait_for_tan_unexpected_status_code(client_instance):
@@ -154,14 +162,14 @@ async def test_wait_for_tan_unexpected_status_code(client_instance):
     )
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = error_response
+    mock_http_client.request.return_value = error_response
 
     with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(httpx.HTTPStatusError):
             await client_instance._wait_for_tan_confirmation(
-                "/auth/url", max_attempts=1, delay=0.1
+                "/auth/url", policy=TanPollingPolicy(max_attempts=1, first_delay=0.1)
             )
 
 
@@ -183,7 +191,7 @@ async def test_wait_for_tan_http_error_retry(client_instance):
     success_response.json.return_value = {"status": "AUTHENTICATED"}
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.side_effect = [
+    mock_http_client.request.side_effect = [
         httpx.HTTPError("Connection error"),
         success_response,
     ]
@@ -191,14 +199,14 @@ async def test_wait_for_tan_http_error_retry(client_instance):
     with patch("httpx.AsyncClient") as mock_client_class, patch(
         "asyncio.sleep", new_callable=AsyncMock
     ):
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         result = await client_instance._wait_for_tan_confirmation(
-            "/auth/url", max_attempts=5, delay=0.1
+            "/auth/url", policy=TanPollingPolicy(max_attempts=5, first_delay=0.1)
         )
 
         assert result["status"] == "AUTHENTICATED"
-        assert mock_http_client.get.call_count == 2
+        assert mock_http_client.request.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -212,17 +220,107 @@ async def test_wait_for_tan_unexpected_status_raises_error(client_instance):
     unknown_response.json.return_value = {"status": "UNKNOWN"}
 
     mock_http_client = AsyncMock()
-    mock_http_client.get.return_value = unknown_response
+    mock_http_client.request.return_value = unknown_response
 
     with patch("httpx.AsyncClient") as mock_client_class, patch(
         "asyncio.sleep", new_callable=AsyncMock
     ):
-        mock_client_class.return_value.__aenter__.return_value = mock_http_client
+        mock_client_class.return_value = mock_http_client
 
         with pytest.raises(ValueError, match="Unexpected TAN status: UNKNOWN"):
             await client_instance._wait_for_tan_confirmation(
-                "/auth/url", max_attempts=5, delay=0.1
+                "/auth/url", policy=TanPollingPolicy(max_attempts=5, first_delay=0.1)
             )
 
         # Should fail immediately on first attempt
-        assert mock_http_client.get.call_count == 1
+        assert mock_http_client.request.call_count == 1
+
+
+def test_polling_policy_grows_to_cap():
+    """Intervals start short and grow exponentially up to max_delay."""
+    policy = TanPollingPolicy(first_delay=0.5, factor=2.0, max_delay=3.0)
+    delays = policy.delays()
+
+    assert [next(delays) for _ in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def _pending_client() -> AsyncMock:
+    pending = MagicMock()
+    pending.status_code = 200
+    pending.json.return_value = {"status": "PENDING"}
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = pending
+    return mock_http_client
+
+
+@pytest.mark.asyncio
+async def test_wait_for_tan_sleeps_on_policy_schedule(client_instance):
+    """Waits between polls follow the policy schedule."""
+    client_instance.primary_access_token = "token"
+    mock_http_client = _pending_client()
+    policy = TanPollingPolicy(first_delay=0.25, factor=2.0, max_delay=1.0, max_attempts=5)
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        mock_client_class.return_value = mock_http_client
+
+        with pytest.raises(TimeoutError):
+            await client_instance._wait_for_tan_confirmation("/auth/url", policy=policy)
+
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [0.25, 0.5, 1.0, 1.0]
+    assert mock_http_client.request.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_wait_for_tan_stops_at_deadline(client_instance):
+    """No poll is scheduled past the overall deadline."""
+    client_instance.primary_access_token = "token"
+    mock_http_client = _pending_client()
+    clock = {"now": 100.0}
+
+    async def fake_sleep(seconds):
+        clock["now"] += seconds
+
+    policy = TanPollingPolicy(first_delay=1.0, factor=2.0, max_delay=4.0, deadline=10.0)
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", side_effect=fake_sleep
+    ), patch("comdirect_api.client.time.monotonic", side_effect=lambda: clock["now"]):
+        mock_client_class.return_value = mock_http_client
+
+        with pytest.raises(TimeoutError, match="after 4 attempts"):
+            await client_instance._wait_for_tan_confirmation("/auth/url", policy=policy)
+
+    # Polls at t=0, 1, 3, 7; the next one (t=11) would pass the 10 s deadline
+    assert mock_http_client.request.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_wait_for_tan_reports_progress(client_instance):
+    """The progress hook sees every poll, including the final one."""
+    progress = []
+    client_instance._on_tan_progress = progress.append
+    client_instance.primary_access_token = "token"
+
+    pending = MagicMock()
+    pending.status_code = 200
+    pending.json.return_value = {"status": "PENDING"}
+    authenticated = MagicMock()
+    authenticated.status_code = 200
+    authenticated.json.return_value = {"status": "AUTHENTICATED"}
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = [pending, authenticated]
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ):
+        mock_client_class.return_value = mock_http_client
+        await client_instance._wait_for_tan_confirmation(
+            "/auth/url", policy=TanPollingPolicy(first_delay=0.5)
+        )
+
+    assert [(p.attempt, p.status, p.next_delay) for p in progress] == [
+        (1, "PENDING", 0.5),
+        (2, "AUTHENTICATED", None),
+    ]
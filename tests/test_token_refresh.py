@@ -0,0 +1,159 @@
+"""Tests for single-flight token refresh and background renewal."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+
+def _refresh_response(token: str = "new_access_token", expires_in: int = 599) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "access_token": token,
+        "refresh_token": "new_refresh_token",
+        "expires_in": expires_in,
+        "token_type": "bearer",
+        "scope": "BANKING_RO BROKERAGE_RW SESSION_RW",
+    }
+    response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_sends_one_request(client_instance):
+    """Many concurrent callers with an expired token share one refresh POST."""
+    client_instance.refresh_token = "old_refresh_token"
+    client_instance.token_expires_at = time.time() - 1
+
+    async def slow_refresh(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return _refresh_response()
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = slow_refresh
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        results = await asyncio.gather(
+            *(client_instance._ensure_fresh_token() for _ in range(20))
+        )
+
+    assert len(results) == 20
+    assert mock_http_client.request.call_count == 1
+    assert client_instance.primary_access_token == "new_access_token"
+    assert not client_instance.is_token_expired()
+
+
+@pytest.mark.asyncio
+async def test_refresh_replaces_banking_token(client_instance):
+    """After banking access is granted, the refreshed token becomes the banking token."""
+    client_instance.refresh_token = "old_refresh_token"
+    client_instance.banking_access_token = "old_banking_token"
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _refresh_response()
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        await client_instance.refresh_access_token()
+
+    assert client_instance.banking_access_token == "new_access_token"
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_not_cached(client_instance):
+    """A failed refresh propagates to all waiters and the next call retries."""
+    client_instance.refresh_token = "old_refresh_token"
+
+    error = httpx.HTTPStatusError("401", request=MagicMock(), response=MagicMock())
+    failing = _refresh_response()
+    failing.raise_for_status.side_effect = error
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = [failing, _refresh_response()]
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client_instance.refresh_access_token()
+        await client_instance.refresh_access_token()
+
+    assert mock_http_client.request.call_count == 2
+    assert client_instance.primary_access_token == "new_access_token"
+
+
+@pytest.mark.asyncio
+async def test_background_renewal_refreshes_before_expiry(client_instance):
+    """The renewal task refreshes `margin` seconds before the token expires."""
+    client_instance.refresh_token = "old_refresh_token"
+    client_instance.token_expires_at = time.time() + 0.05
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _refresh_response(expires_in=3600)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        client_instance.start_token_renewal(margin=0.04)
+        await asyncio.sleep(0.1)
+        await client_instance.aclose()
+
+    assert mock_http_client.request.call_count == 1
+    assert client_instance.primary_access_token == "new_access_token"
+    assert client_instance._renewal_task is None
+
+
+@pytest.mark.asyncio
+async def test_background_renewal_survives_failures(client_instance):
+    """A failed renewal is logged and retried after RENEWAL_RETRY_DELAY."""
+    client_instance.refresh_token = "old_refresh_token"
+    client_instance.token_expires_at = time.time()
+    client_instance.RENEWAL_RETRY_DELAY = 0.01
+
+    mock_http_client = AsyncMock()
+    mock_http_client.request.side_effect = [
+        httpx.ReadTimeout("timeout"),
+        _refresh_response(expires_in=3600),
+    ]
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        client_instance.start_token_renewal(margin=0)
+        await asyncio.sleep(0.1)
+        await client_instance.stop_token_renewal()
+
+    assert mock_http_client.request.call_count == 2
+    assert client_instance.primary_access_token == "new_access_token"
+
+
+@pytest.mark.asyncio
+async def test_background_renewal_stops_on_rejected_refresh(client_instance):
+    """A refresh rejected with an HTTP error status ends the renewal task."""
+    client_instance.refresh_token = "expired_refresh_token"
+    client_instance.token_expires_at = time.time()
+    client_instance.RENEWAL_RETRY_DELAY = 0.01
+
+    rejected = MagicMock()
+    rejected.status_code = 400
+    rejected.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "invalid_grant", request=MagicMock(), response=rejected
+    )
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = rejected
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+
+        client_instance.start_token_renewal(margin=0)
+        await asyncio.sleep(0.1)
+
+        assert client_instance._renewal_task.done()
+        await client_instance.stop_token_renewal()
+
+    assert mock_http_client.request.call_count == 1
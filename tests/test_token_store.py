@@ -0,0 +1,158 @@
+"""Tests for persisted sessions and the encrypted file token store."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from cryptography.fernet import Fernet
+
+from comdirect_api.client import ComdirectClient
+from comdirect_api.token_store import EncryptedFileTokenStore, StoredSession, TokenStore
+
+
+class _MemoryTokenStore(TokenStore):
+    def __init__(self, sessions: dict[str, StoredSession] | None = None) -> None:
+        self.sessions = dict(sessions or {})
+
+    async def load(self, key: str) -> StoredSession | None:
+        return self.sessions.get(key)
+
+    async def save(self, key: str, session: StoredSession) -> None:
+        self.sessions[key] = session
+
+    async def delete(self, key: str) -> None:
+        self.sessions.pop(key, None)
+
+
+def _stored() -> StoredSession:
+    return StoredSession(
+        refresh_token="stored_refresh_token",
+        session_id="stored_session",
+        banking_access_token="stored_banking_token",
+    )
+
+
+def _refresh_response() -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "access_token": "new_access_token",
+        "refresh_token": "new_refresh_token",
+        "expires_in": 599,
+        "token_type": "bearer",
+        "scope": "BANKING_RO BROKERAGE_RW SESSION_RW",
+    }
+    response.raise_for_status.return_value = None
+    return response
+
+
+async def _create(store: TokenStore) -> ComdirectClient:
+    return await ComdirectClient.create(
+        client_id="test_id",
+        client_secret="test_secret",
+        zugangsnummer="test_user",
+        pin="test_pin",
+        token_store=store,
+    )
+
+
+@pytest.mark.asyncio
+async def test_file_store_round_trip(tmp_path):
+    """Sessions survive a new store instance and are not stored in plaintext."""
+    key = Fernet.generate_key()
+    path = tmp_path / "tokens"
+    await EncryptedFileTokenStore(path, key).save("user", _stored())
+
+    assert await EncryptedFileTokenStore(path, key).load("user") == _stored()
+    assert b"stored_refresh_token" not in path.read_bytes()
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+@pytest.mark.asyncio
+async def test_file_store_wrong_key_is_treated_as_empty(tmp_path):
+    """An undecryptable file yields no session instead of an error."""
+    path = tmp_path / "tokens"
+    await EncryptedFileTokenStore(path, Fernet.generate_key()).save("user", _stored())
+
+    assert await EncryptedFileTokenStore(path, Fernet.generate_key()).load("user") is None
+
+
+@pytest.mark.asyncio
+async def test_file_store_delete_keeps_other_keys(tmp_path):
+    """Deleting one login leaves the others in the shared file."""
+    store = EncryptedFileTokenStore(tmp_path / "tokens", Fernet.generate_key())
+    await store.save("a", _stored())
+    await store.save("b", _stored())
+
+    await store.delete("a")
+
+    assert await store.load("a") is None
+    assert await store.load("b") == _stored()
+
+
+@pytest.mark.asyncio
+async def test_create_resumes_stored_session_without_tan():
+    """A refreshable stored session skips the TAN flow and persists the rotated tokens."""
+    store = _MemoryTokenStore({"test_user": _stored()})
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = _refresh_response()
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch.object(
+        ComdirectClient, "_initialize", new_callable=AsyncMock
+    ) as mock_init:
+        mock_client_class.return_value = mock_http_client
+        client = await _create(store)
+
+    mock_init.assert_not_awaited()
+    assert client.session_id == "stored_session"
+    assert client.banking_access_token == "new_access_token"
+    assert store.sessions["test_user"].refresh_token == "new_refresh_token"
+    assert store.sessions["test_user"].banking_access_token == "new_access_token"
+
+
+@pytest.mark.asyncio
+async def test_create_falls_back_to_tan_when_refresh_fails():
+    """An expired stored session falls back to the full flow and is replaced."""
+    store = _MemoryTokenStore({"test_user": _stored()})
+    rejected = MagicMock()
+    rejected.status_code = 401
+    rejected.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "401", request=MagicMock(), response=rejected
+    )
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = rejected
+
+    async def fake_initialize(self):
+        self.refresh_token = "tan_refresh_token"
+        self.session_id = "tan_session"
+        self.banking_access_token = "tan_banking_token"
+
+    with patch("httpx.AsyncClient") as mock_client_class, patch.object(
+        ComdirectClient, "_initialize", autospec=True, side_effect=fake_initialize
+    ) as mock_init:
+        mock_client_class.return_value = mock_http_client
+        client = await _create(store)
+
+    mock_init.assert_awaited_once()
+    assert client.session_id == "tan_session"
+    assert store.sessions["test_user"].refresh_token == "tan_refresh_token"
+
+
+@pytest.mark.asyncio
+async def test_revoke_forgets_stored_session(client_instance):
+    """Revoking the token also removes it from the store."""
+    store = _MemoryTokenStore({"test_username": _stored()})
+    client_instance._token_store = store
+    client_instance.banking_access_token = "banking_token"
+
+    revoked = MagicMock()
+    revoked.status_code = 204
+    revoked.raise_for_status.return_value = None
+    mock_http_client = AsyncMock()
+    mock_http_client.request.return_value = revoked
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client_class.return_value = mock_http_client
+        await client_instance.revoke_access_token()
+
+    assert store.sessions == {}
@@ -0,0 +1,34 @@
+"""Tests for utility functions."""
+
+import datetime
+import time
+from unittest.mock import patch
+
+from comdirect_api.utils import timestamp
+
+
+def test_timestamp_format_is_utc_with_microseconds():
+    """Request IDs are 20-digit UTC timestamps (YYYYmmddHHMMSSffffff)."""
+    before = datetime.datetime.now(datetime.UTC).strftime("%Y%m%d%H%M%S")
+    value = timestamp()
+
+    assert len(value) == 20
+    assert value.isdigit()
+    assert value[:14] >= before
+
+
+def test_timestamp_is_strictly_increasing():
+    """Consecutive calls never repeat, even within the same microsecond."""
+    values = [timestamp() for _ in range(1000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_timestamp_survives_clock_step_back():
+    """A backwards wall-clock step does not produce a smaller request ID."""
+    first = timestamp()
+    with patch("comdirect_api.utils.time.time_ns", return_value=time.time_ns() - 10**9):
+        second = timestamp()
+
+    assert second > first